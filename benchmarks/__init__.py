@@ -0,0 +1,6 @@
+"""
+DuoReadme benchmarks
+
+Offline performance measurements of the gen and trans pipelines against a
+local stand-in for the provider APIs.
+"""
@@ -0,0 +1,398 @@
+"""
+Mock provider server module
+
+Local stand-in for the provider APIs, so the pipeline can be measured
+without paid requests. Serves OpenAI/SiliconFlow chat completions (plain
+and streamed) and Tencent Cloud SSE reply events, with configurable
+latency, output token rate and injected errors and 429s.
+
+Run standalone:
+
+    python -m benchmarks.mock_server --port 8000 --latency 0.2 --token-rate 200
+
+and point DuoReadme at it with siliconflow.api_url,
+openai.base_url or sse.url.
+"""
+
+import argparse
+import json
+import math
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Optional
+
+
+CHAT_PATH = "/v1/chat/completions"
+SSE_PATH = "/v1/qbot/chat/sse"
+
+# Characters per generated token, close to the tokenizer average of English text
+CHARS_PER_TOKEN = 4
+# Tokens per streamed chunk
+CHUNK_TOKENS = 8
+
+_JSON_KEYS = re.compile(r"The JSON keys must be exactly: ([^\n]+)")
+_LANGUAGE_NAME = re.compile(r"Translate into ([^.]+)\.")
+
+
+@dataclass
+class MockOptions:
+    """Behaviour of the mock server"""
+
+    # Seconds before the first byte of a response
+    latency: float = 0.0
+    # Random extra latency, uniformly up to this many seconds
+    jitter: float = 0.0
+    # Output tokens per second per request, 0 = unlimited
+    token_rate: float = 0.0
+    # Output length relative to the input content
+    output_ratio: float = 1.0
+    # Fraction of requests answered with HTTP 500
+    error_rate: float = 0.0
+    # Fraction of requests answered with HTTP 429
+    throttle_rate: float = 0.0
+    # Answer this many first requests with HTTP 429, for deterministic retry runs
+    throttle_first: int = 0
+    # Retry-After header of 429 responses in seconds
+    retry_after: float = 0.0
+    seed: Optional[int] = None
+
+
+@dataclass
+class RequestRecord:
+    """One served request"""
+
+    path: str
+    status: int
+    started: float
+    finished: float
+    output_tokens: int = 0
+
+    @property
+    def duration(self) -> float:
+        return self.finished - self.started
+
+
+@dataclass
+class MockStats:
+    """Requests served since the server started or was last reset"""
+
+    records: List[RequestRecord] = field(default_factory=list)
+    in_flight: int = 0
+    lock: threading.Condition = field(default_factory=threading.Condition)
+
+    def begin(self):
+        with self.lock:
+            self.in_flight += 1
+
+    def add(self, record: RequestRecord):
+        with self.lock:
+            self.records.append(record)
+            self.in_flight -= 1
+            self.lock.notify_all()
+
+    def wait_idle(self, timeout: float = 5.0) -> bool:
+        """
+        Wait until no request is being served
+
+        A client may see the end of a response before its handler records it.
+
+        Args:
+            timeout: Seconds to wait at most
+
+        Returns:
+            bool: Whether the server became idle
+        """
+        with self.lock:
+            return self.lock.wait_for(lambda: self.in_flight == 0, timeout)
+
+    def reset(self):
+        with self.lock:
+            self.records.clear()
+
+    def snapshot(self) -> List[RequestRecord]:
+        with self.lock:
+            return list(self.records)
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """
+    Get a percentile by the nearest-rank method
+
+    Args:
+        values: Samples
+        fraction: Percentile as a fraction, e.g. 0.99
+
+    Returns:
+        float: Percentile, 0.0 without samples
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def fake_text(length: int, label: str) -> str:
+    """Build deterministic Markdown of about the given length"""
+    lines = [f"# Project ({label})\n\n"]
+    size = len(lines[0])
+    while size < length:
+        # Numbered lines, so the output never looks like a repetition loop
+        line = f"Paragraph {len(lines)} translated into {label} with some words to fill the document.\n"
+        lines.append(line)
+        size += len(line)
+    return "".join(lines)
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    """Request handler, the server carries options, stats and the random source"""
+
+    protocol_version = "HTTP/1.1"
+    server: "MockServer"
+
+    def log_message(self, format: str, *args: Any):
+        """Keep benchmark output clean"""
+
+    def do_POST(self):
+        started = time.perf_counter()
+        self.server.stats.begin()
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            body = {}
+
+        status = self._injected_status()
+        output_tokens = 0
+        self._sleep(self.server.options.latency + self.server.random_uniform(self.server.options.jitter))
+        if status == 429:
+            self._send_json(429, {"error": {"message": "Rate limit exceeded"}},
+                            {"Retry-After": str(self.server.options.retry_after)})
+        elif status == 500:
+            self._send_json(500, {"error": {"message": "Injected server error"}})
+        elif self.path.startswith(CHAT_PATH):
+            output_tokens = self._chat(body)
+        elif self.path.startswith(SSE_PATH):
+            output_tokens = self._tencent(body)
+        else:
+            status = 404
+            self._send_json(404, {"error": {"message": f"Unknown path {self.path}"}})
+
+        self.server.stats.add(RequestRecord(self.path, status, started, time.perf_counter(), output_tokens))
+
+    def _injected_status(self) -> int:
+        """Pick 429, 500 or 200 for this request"""
+        options = self.server.options
+        if self.server.next_request_number() < options.throttle_first:
+            return 429
+        roll = self.server.random_uniform(1.0)
+        if roll < options.throttle_rate:
+            return 429
+        if roll < options.throttle_rate + options.error_rate:
+            return 500
+        return 200
+
+    def _sleep(self, seconds: float):
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def _send_json(self, status: int, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None):
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _start_stream(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        # Streams end with the connection, as with the real endpoints
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+    def _paced_chunks(self, text: str) -> Iterator[str]:
+        """Split output into chunks, sleeping to hold the configured token rate"""
+        size = CHUNK_TOKENS * CHARS_PER_TOKEN
+        rate = self.server.options.token_rate
+        for start in range(0, len(text), size):
+            if rate > 0:
+                time.sleep(CHUNK_TOKENS / rate)
+            yield text[start:start + size]
+
+    def _chat(self, body: Dict[str, Any]) -> int:
+        """Answer a chat-completions request"""
+        messages = body.get("messages") or []
+        prompt = "".join(str(message.get("content", "")) for message in messages)
+        match = _LANGUAGE_NAME.search(str(messages[0].get("content", "")) if messages else "")
+        label = match.group(1) if match else "text"
+
+        max_tokens = int(body.get("max_tokens") or 4096)
+        length = min(int(len(prompt) * self.server.options.output_ratio), max_tokens * CHARS_PER_TOKEN)
+        text = fake_text(length, label)
+        output_tokens = len(text) // CHARS_PER_TOKEN
+        usage = {
+            "prompt_tokens": len(prompt) // CHARS_PER_TOKEN,
+            "completion_tokens": output_tokens,
+            "total_tokens": len(prompt) // CHARS_PER_TOKEN + output_tokens
+        }
+
+        if not body.get("stream"):
+            rate = self.server.options.token_rate
+            if rate > 0:
+                time.sleep(output_tokens / rate)
+            self._send_json(200, {
+                "id": "mock", "object": "chat.completion", "model": body.get("model", "mock"),
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": text}, "finish_reason": "stop"}],
+                "usage": usage
+            })
+            return output_tokens
+
+        self._start_stream()
+        for chunk in self._paced_chunks(text):
+            event = {"choices": [{"index": 0, "delta": {"content": chunk}}]}
+            self.wfile.write(f"data: {json.dumps(event)}\n\n".encode("utf-8"))
+            self.wfile.flush()
+        self.wfile.write(f"data: {json.dumps({'choices': [], 'usage': usage})}\n\ndata: [DONE]\n\n".encode("utf-8"))
+        return output_tokens
+
+    def _tencent(self, body: Dict[str, Any]) -> int:
+        """Answer a Tencent Cloud chat request with reply events"""
+        prompt = str(body.get("content", ""))
+        match = _JSON_KEYS.search(prompt)
+        languages = [lang.strip() for lang in match.group(1).split(",")] if match else ["en"]
+
+        variables = body.get("custom_variables") or {}
+        source = str(variables.get("code_text", "")) or prompt
+        length = int(len(source) * self.server.options.output_ratio)
+        content = "```json\n" + json.dumps({lang: fake_text(length, lang) for lang in languages}, ensure_ascii=False) + "\n```"
+
+        def reply(text: str, is_final: bool = False, is_from_self: bool = False) -> bytes:
+            payload = {"type": "reply", "payload": {
+                "content": text, "is_final": is_final, "is_from_self": is_from_self,
+                "session_id": body.get("session_id", ""), "record_id": "mock"
+            }}
+            return f"event: reply\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n".encode("utf-8")
+
+        self._start_stream()
+        self.wfile.write(reply(prompt[:200], is_from_self=True))
+        for chunk in self._paced_chunks(content):
+            self.wfile.write(reply(chunk))
+            self.wfile.flush()
+        self.wfile.write(reply(content, is_final=True))
+        return len(content) // CHARS_PER_TOKEN
+
+
+class MockServer(ThreadingHTTPServer):
+    """Threaded mock server, usable as a context manager that serves in the background"""
+
+    daemon_threads = True
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, options: Optional[MockOptions] = None):
+        """
+        Initialize mock server
+
+        Args:
+            host: Interface to bind
+            port: Port to bind, 0 picks a free one
+            options: Latency, rate and error injection settings
+        """
+        super().__init__((host, port), MockHandler)
+        self.options = options or MockOptions()
+        self.stats = MockStats()
+        self._random = random.Random(self.options.seed)
+        self._random_lock = threading.Lock()
+        self._requests = 0
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def chat_url(self) -> str:
+        return self.url + CHAT_PATH
+
+    @property
+    def sse_url(self) -> str:
+        return self.url + SSE_PATH
+
+    def random_uniform(self, upper: float) -> float:
+        """Draw from the seeded random source, shared by all handler threads"""
+        if upper <= 0:
+            return 0.0
+        with self._random_lock:
+            return self._random.uniform(0, upper)
+
+    def next_request_number(self) -> int:
+        """Number the requests in arrival order, starting at 0"""
+        with self._random_lock:
+            number = self._requests
+            self._requests += 1
+            return number
+
+    def start(self) -> "MockServer":
+        """Serve on a background thread"""
+        self._thread = threading.Thread(target=self.serve_forever, name="mock-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and close the socket"""
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "MockServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any):
+        self.stop()
+
+
+def main(argv: Optional[List[str]] = None):
+    """Run the mock server in the foreground"""
+    parser = argparse.ArgumentParser(description="Mock SiliconFlow/OpenAI and Tencent Cloud SSE server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds before the first byte")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random extra latency in seconds")
+    parser.add_argument("--token-rate", type=float, default=0.0, help="Output tokens per second, 0 = unlimited")
+    parser.add_argument("--output-ratio", type=float, default=1.0, help="Output length relative to the input")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests failing with 500")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of requests failing with 429")
+    parser.add_argument("--throttle-first", type=int, default=0, help="Answer this many first requests with 429")
+    parser.add_argument("--retry-after", type=float, default=0.0, help="Retry-After of 429 responses")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+
+    options = MockOptions(
+        latency=args.latency, jitter=args.jitter, token_rate=args.token_rate, output_ratio=args.output_ratio,
+        error_rate=args.error_rate, throttle_rate=args.throttle_rate,
+        throttle_first=args.throttle_first, retry_after=args.retry_after, seed=args.seed
+    )
+    server = MockServer(args.host, args.port, options)
+    print(f"Mock server listening on {server.url}")
+    print(f"  siliconflow.api_url: {server.chat_url}")
+    print(f"  openai.base_url:     {server.url}/v1")
+    print(f"  sse.url:             {server.sse_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""
+End-to-end benchmark module
+
+Runs `duoreadme gen` and `duoreadme trans` on synthetic repositories of
+several sizes against the local mock server and reports wall time,
+requests/s, p50/p99 request latency, CPU time and peak RSS per run.
+
+    python -m benchmarks.run --sizes small,medium --languages 1,3,6 --latency 0.2
+
+Each run is a separate CLI process with the cache disabled, so the numbers
+include interpreter start-up and reflect what a user waits for.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import yaml
+
+from .mock_server import MockOptions, MockServer, percentile
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Size name to (README sections, source files)
+REPO_SIZES: Dict[str, tuple] = {
+    "small": (5, 5),
+    "medium": (25, 40),
+    "large": (100, 200),
+}
+
+LANGUAGES = ["zh-Hans", "ja", "ko", "fr", "de", "es", "ru", "pt", "it", "vi"]
+
+PARAGRAPH = (
+    "This section explains how the project is configured and used. It covers the "
+    "options, the defaults and a few examples that show typical workflows.\n"
+)
+
+
+@dataclass
+class BenchmarkResult:
+    """Measurements of one CLI run"""
+
+    command: str
+    provider: str
+    size: str
+    languages: int
+    wall_time: float
+    cpu_time: float
+    peak_rss_mb: float
+    requests: int
+    requests_per_second: float
+    p50: float
+    p99: float
+    exit_code: int
+
+
+def make_repo(path: Path, size: str):
+    """
+    Write a synthetic repository
+
+    Args:
+        path: Repository directory
+        size: Key of REPO_SIZES
+    """
+    sections, source_files = REPO_SIZES[size]
+    path.mkdir(parents=True, exist_ok=True)
+
+    readme = ["# Benchmark Project\n\nA synthetic project for DuoReadme benchmarks.\n"]
+    for i in range(sections):
+        readme.append(f"\n## Section {i}\n\n{PARAGRAPH * 3}\n```bash\nbench run --step {i}\n```\n")
+    (path / "README.md").write_text("".join(readme), encoding="utf-8")
+
+    src_dir = path / "src"
+    src_dir.mkdir(exist_ok=True)
+    for i in range(source_files):
+        (src_dir / f"module_{i}.py").write_text(
+            f'"""Module {i}"""\n\n\ndef handler_{i}(value):\n    """Handle a value"""\n    return value * {i}\n',
+            encoding="utf-8"
+        )
+
+
+def write_config(path: Path, provider: str, server: MockServer, stream: bool) -> Path:
+    """
+    Write a configuration that sends all provider traffic to the mock server
+
+    Args:
+        path: Directory for the configuration file
+        provider: Provider name
+        server: Running mock server
+        stream: Whether chat completions are streamed
+
+    Returns:
+        Path: Configuration file path
+    """
+    config = {
+        "provider": provider,
+        "app": {"bot_app_key": "benchmark", "visitor_biz_id": "benchmark"},
+        "tencent_cloud": {"secret_id": "benchmark", "secret_key": "benchmark"},
+        "sse": {"url": server.sse_url},
+        "siliconflow": {"api_url": server.chat_url, "api_key": "benchmark", "stream": stream},
+        "openai": {"base_url": server.url + "/v1", "api_key": "benchmark", "stream": stream},
+        "cache": {"enabled": False},
+    }
+    config_path = path / "benchmark_config.yaml"
+    config_path.write_text(yaml.safe_dump(config), encoding="utf-8")
+    return config_path
+
+
+def run_cli(args: List[str], cwd: Path) -> tuple:
+    """
+    Run the CLI and measure it
+
+    Args:
+        args: CLI arguments after the program name
+        cwd: Working directory, outputs are written below it
+
+    Returns:
+        tuple: (exit code, wall time, CPU time, peak RSS in MB, output)
+    """
+    env = dict(os.environ, PYTHONPATH=str(REPO_ROOT))
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-c", "from src.cli.main import main; main()"] + args,
+        cwd=str(cwd), env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT
+    )
+    output = process.stdout.read().decode("utf-8", errors="replace")
+    process.stdout.close()
+
+    if hasattr(os, "wait4"):
+        _, status, usage = os.wait4(process.pid, 0)
+        wall_time = time.perf_counter() - started
+        exit_code = os.waitstatus_to_exitcode(status) if hasattr(os, "waitstatus_to_exitcode") else status >> 8
+        process.returncode = exit_code
+        cpu_time = usage.ru_utime + usage.ru_stime
+        # ru_maxrss is in kilobytes on Linux and bytes on macOS
+        peak_rss = usage.ru_maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+    else:
+        exit_code = process.wait()
+        wall_time = time.perf_counter() - started
+        cpu_time = peak_rss = 0.0
+    return exit_code, wall_time, cpu_time, peak_rss, output
+
+
+def run_benchmark(server: MockServer, workdir: Path, command: str, provider: str, size: str,
+                  languages: int, stream: bool = False) -> BenchmarkResult:
+    """
+    Run one command on a fresh synthetic repository
+
+    Args:
+        server: Running mock server
+        workdir: Scratch directory
+        command: "gen" or "trans"
+        provider: Provider name
+        size: Key of REPO_SIZES
+        languages: Number of target languages
+        stream: Whether chat completions are streamed
+
+    Returns:
+        BenchmarkResult: Measurements of the run
+    """
+    repo = workdir / f"{command}-{provider}-{size}-{languages}"
+    make_repo(repo, size)
+    config_path = write_config(repo, provider, server, stream)
+
+    server.stats.reset()
+    exit_code, wall_time, cpu_time, peak_rss, output = run_cli([
+        command, "--config", str(config_path), "--project-path", ".",
+        "--languages", ",".join(LANGUAGES[:languages])
+    ], repo)
+    if exit_code != 0 or "❌" in output:
+        print(output, file=sys.stderr)
+
+    server.stats.wait_idle()
+    durations = [record.duration for record in server.stats.snapshot()]
+    return BenchmarkResult(
+        command=command, provider=provider, size=size, languages=languages,
+        wall_time=wall_time, cpu_time=cpu_time, peak_rss_mb=peak_rss,
+        requests=len(durations), requests_per_second=len(durations) / wall_time if wall_time else 0.0,
+        p50=percentile(durations, 0.5), p99=percentile(durations, 0.99), exit_code=exit_code
+    )
+
+
+def format_table(results: List[BenchmarkResult]) -> str:
+    """Format results as a plain text table"""
+    header = f"{'command':<8}{'provider':<13}{'size':<8}{'langs':>6}{'wall s':>9}{'cpu s':>8}{'rss MB':>8}{'reqs':>6}{'req/s':>8}{'p50 s':>8}{'p99 s':>8}"
+    lines = [header, "-" * len(header)]
+    for result in results:
+        lines.append(
+            f"{result.command:<8}{result.provider:<13}{result.size:<8}{result.languages:>6}"
+            f"{result.wall_time:>9.2f}{result.cpu_time:>8.2f}{result.peak_rss_mb:>8.1f}{result.requests:>6}"
+            f"{result.requests_per_second:>8.1f}{result.p50:>8.3f}{result.p99:>8.3f}"
+            + ("" if result.exit_code == 0 else f"  (exit {result.exit_code})")
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None):
+    """Run the benchmark matrix"""
+    parser = argparse.ArgumentParser(description="DuoReadme end-to-end benchmarks against a local mock server")
+    parser.add_argument("--commands", default="gen,trans", help="Comma-separated commands to run")
+    parser.add_argument("--providers", default="siliconflow,tencent", help="Comma-separated providers to run")
+    parser.add_argument("--sizes", default="small,medium", help=f"Comma-separated repository sizes: {', '.join(REPO_SIZES)}")
+    parser.add_argument("--languages", default="1,3", help="Comma-separated target language counts")
+    parser.add_argument("--stream", action="store_true", help="Stream chat completions")
+    parser.add_argument("--latency", type=float, default=0.1, help="Mock seconds before the first byte")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Mock random extra latency in seconds")
+    parser.add_argument("--token-rate", type=float, default=0.0, help="Mock output tokens per second, 0 = unlimited")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests failing with 500")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of requests failing with 429")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the mock's random source")
+    parser.add_argument("--json", dest="json_out", help="Also write results as JSON to this file")
+    args = parser.parse_args(argv)
+
+    options = MockOptions(
+        latency=args.latency, jitter=args.jitter, token_rate=args.token_rate,
+        error_rate=args.error_rate, throttle_rate=args.throttle_rate, seed=args.seed
+    )
+    results = []
+    with MockServer(options=options) as server, tempfile.TemporaryDirectory(prefix="duoreadme-bench-") as tmp:
+        for command in args.commands.split(","):
+            for provider in args.providers.split(","):
+                for size in args.sizes.split(","):
+                    for languages in (int(count) for count in args.languages.split(",")):
+                        result = run_benchmark(server, Path(tmp), command, provider, size, languages, args.stream)
+                        results.append(result)
+                        print(format_table([result]).splitlines()[-1], flush=True)
+
+    print()
+    print(format_table(results))
+    if args.json_out:
+        Path(args.json_out).write_text(json.dumps([asdict(result) for result in results], indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,9 +7,20 @@ A powerful CLI tool for automatically generating project code and README into mu
 __version__ = "0.0.1"
 __author__ = "DuoReadme Team"
 
-from .core.translator import Translator
-from .core.parser import Parser
-from .core.generator import Generator
+from typing import TYPE_CHECKING
+from .utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .core.translator import Translator
+    from .core.parser import Parser
+    from .core.generator import Generator
+
+# Loaded on first access, so the CLI starts without importing the translator
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "Translator": ".core.translator",
+    "Parser": ".core.parser",
+    "Generator": ".core.generator",
+})
 
 __all__ = [
     "Translator",
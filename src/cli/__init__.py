@@ -5,6 +5,6 @@ Provides command line interface tools.
 """
 
 from .main import main, cli
-from .commands import gen_command, config_command, trans_command, set_command, export_command
+from .commands import gen_command, config_command, trans_command, set_command, export_command, cache_command
 
-__all__ = ["main", "cli", "gen_command", "config_command", "trans_command", "set_command", "export_command"] 
\ No newline at end of file
+__all__ = ["main", "cli", "gen_command", "config_command", "trans_command", "set_command", "export_command", "cache_command"] 
\ No newline at end of file
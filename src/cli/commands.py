@@ -7,22 +7,32 @@ Provides implementations for various CLI commands.
 import click
 import yaml
 from pathlib import Path
-from ..core.translator import Translator
-from ..core.parser import Parser
-from ..core.generator import Generator
+from typing import TYPE_CHECKING
 from ..utils.config import Config
 from ..utils.logger import enable_debug, info, debug
+from ..utils.metrics import get_metrics, span
+
+# The translator and providers are imported inside the commands that use
+# them, so config, set and export start without loading them
+if TYPE_CHECKING:
+    from ..core.translator import Translator
+    from ..core.parser import Parser
+    from ..core.generator import Generator
 
 
 @click.command()
 @click.option('--project-path', default='.', help='Project path, defaults to current directory')
 @click.option('--languages', help='Languages to generate, comma-separated, e.g.: zh-Hans,en,ja')
-@click.option('--provider', type=click.Choice(['tencent', 'siliconflow']), help='Translation provider to use')
+@click.option('--provider', help='Translation provider to use: tencent, siliconflow, openai or an installed plugin')
 @click.option('--config', help='Configuration file path')
 @click.option('--verbose', is_flag=True, help='Show detailed output')
 @click.option('--debug', 'debug_mode', is_flag=True, help='Enable debug mode, output DEBUG level logs')
-def gen_command(project_path, languages, provider, config, verbose, debug_mode):
+@click.option('--no-cache', is_flag=True, help='Ignore cached translations and always call the provider')
+@click.option('--metrics-out', type=click.Path(dir_okay=False), help='Write stage and request timings, bytes and tokens as JSON to this file')
+@click.option('--prometheus-out', type=click.Path(dir_okay=False), help='Write the same metrics as a Prometheus textfile (e.g. for the node exporter textfile collector)')
+def gen_command(project_path, languages, provider, config, verbose, debug_mode, no_cache, metrics_out, prometheus_out):
     """Generate multi-language README"""
+    get_metrics().reset()
     try:
         # Set log level based on --debug parameter
         if debug_mode:
@@ -38,6 +48,14 @@ def gen_command(project_path, languages, provider, config, verbose, debug_mode):
             click.echo("Error: Configuration validation failed", err=True)
             return
         
+        if no_cache:
+            config_obj.set("cache.enabled", False)
+            debug("Translation cache disabled")
+        
+        from ..core.translator import Translator
+        from ..core.parser import Parser
+        from ..core.generator import Generator
+        
         # Create core components
         translator = Translator(config_obj, provider=provider)
         parser_obj = Parser()
@@ -70,12 +88,28 @@ def gen_command(project_path, languages, provider, config, verbose, debug_mode):
         if verbose or debug_mode:
             import traceback
             traceback.print_exc()
+    finally:
+        export_metrics(metrics_out, prometheus_out)
+
+
+def export_metrics(metrics_out: str = None, prometheus_out: str = None):
+    """Write the metrics of the run to the requested files, also after a failed run"""
+    metrics = get_metrics()
+    try:
+        if metrics_out:
+            metrics.write_json(metrics_out)
+            debug(f"Metrics written to {metrics_out}")
+        if prometheus_out:
+            metrics.write_prometheus(prometheus_out)
+            debug(f"Prometheus metrics written to {prometheus_out}")
+    except OSError as e:
+        click.echo(f"❌ Failed to write metrics: {e}", err=True)
 
 
 def run_translation_workflow(
-    translator: Translator,
-    parser_obj: Parser,
-    generator: Generator,
+    translator: "Translator",
+    parser_obj: "Parser",
+    generator: "Generator",
     project_path: str,
     languages: list = None,
     verbose: bool = False
@@ -94,18 +128,20 @@ def run_translation_workflow(
     debug("Generation response processing completed")
     
     # Parse multi-language README
-    parsed_readme = parser_obj.parse_multilingual_content(
-        translation_response.content, 
-        languages
-    )
+    with span("parse"):
+        parsed_readme = parser_obj.parse_multilingual_content(
+            translation_response.content, 
+            languages
+        )
     debug("Multi-language content parsing completed")
     
     # Generate README files
     click.echo("\nGenerating README files")
-    generation_result = generator.generate_readme_files(
-        parsed_readme, 
-        translation_response.raw_response
-    )
+    with span("generate"):
+        generation_result = generator.generate_readme_files(
+            parsed_readme, 
+            translation_response.raw_response
+        )
     debug("README file generation completed")
     
     # Generate summary report
@@ -117,12 +153,17 @@ def run_translation_workflow(
 @click.command()
 @click.option('--project-path', default='.', help='Project path, defaults to current directory')
 @click.option('--languages', help='Languages to translate, comma-separated, e.g.: zh-Hans,en,ja')
-@click.option('--provider', type=click.Choice(['tencent', 'siliconflow']), help='Translation provider to use')
+@click.option('--provider', help='Translation provider to use: tencent, siliconflow, openai or an installed plugin')
 @click.option('--config', help='Configuration file path')
 @click.option('--verbose', is_flag=True, help='Show detailed output')
 @click.option('--debug', 'debug_mode', is_flag=True, help='Enable debug mode, output DEBUG level logs')
-def trans_command(project_path, languages, provider, config, verbose, debug_mode):
+@click.option('--no-cache', is_flag=True, help='Ignore cached translations and always call the provider')
+@click.option('--full', is_flag=True, help='Translate the whole README instead of only the sections changed since the last run')
+@click.option('--metrics-out', type=click.Path(dir_okay=False), help='Write stage and request timings, bytes and tokens as JSON to this file')
+@click.option('--prometheus-out', type=click.Path(dir_okay=False), help='Write the same metrics as a Prometheus textfile (e.g. for the node exporter textfile collector)')
+def trans_command(project_path, languages, provider, config, verbose, debug_mode, no_cache, full, metrics_out, prometheus_out):
     """Pure text translation function - translate README file in project root directory"""
+    get_metrics().reset()
     try:
         # Set log level based on --debug parameter
         if debug_mode:
@@ -138,6 +179,14 @@ def trans_command(project_path, languages, provider, config, verbose, debug_mode
             click.echo("Error: Configuration validation failed", err=True)
             return
         
+        if no_cache:
+            config_obj.set("cache.enabled", False)
+            debug("Translation cache disabled")
+        
+        from ..core.translator import Translator
+        from ..core.parser import Parser
+        from ..core.generator import Generator
+        
         # Create core components
         translator = Translator(config_obj, provider=provider)
         parser_obj = Parser()
@@ -162,7 +211,8 @@ def trans_command(project_path, languages, provider, config, verbose, debug_mode
             generator=generator,
             project_path=project_path,
             languages=language_list,
-            verbose=verbose
+            verbose=verbose,
+            incremental=not full and config_obj.get("translation.incremental", True)
         )
         
         click.echo("\nTranslation completed!")
@@ -172,21 +222,26 @@ def trans_command(project_path, languages, provider, config, verbose, debug_mode
         if verbose or debug_mode:
             import traceback
             traceback.print_exc()
+    finally:
+        export_metrics(metrics_out, prometheus_out)
 
 
 def run_text_translation_workflow(
-    translator: Translator,
-    parser_obj: Parser,
-    generator: Generator,
+    translator: "Translator",
+    parser_obj: "Parser",
+    generator: "Generator",
     project_path: str,
     languages: list = None,
-    verbose: bool = False
+    verbose: bool = False,
+    incremental: bool = True
 ):
     """Execute pure text translation workflow"""
     debug(f"Starting project translation: {project_path}")
     
     # Read README file in project root directory
-    readme_content = translator._read_readme_file(project_path)
+    with span("read") as read_span:
+        readme_content = translator._read_readme_file(project_path)
+        read_span.set(bytes_out=len(readme_content.encode("utf-8")))
     
     if not readme_content:
         click.echo("❌ README file not found or read failed", err=True)
@@ -194,8 +249,17 @@ def run_text_translation_workflow(
     
     debug(f"Successfully read README file, length: {len(readme_content)} characters")
     
+    # Compare README sections with the previous run so only changed sections are translated
+    section_plan = generator.create_section_plan(readme_content, incremental=incremental)
+    debug(f"README split into {len(section_plan.sections)} sections")
+    
     # Execute pure text translation
-    translation_response = translator.translate_text_only(readme_content, languages)
+    translation_response = translator.translate_text_only(
+        readme_content,
+        languages,
+        section_plan=section_plan,
+        stream_writer_factory=generator.open_stream_writer
+    )
     
     if not translation_response.success:
         click.echo(f"❌ Translation failed: {translation_response.error}", err=True)
@@ -205,18 +269,21 @@ def run_text_translation_workflow(
     debug("Translation response processing completed")
     
     # Parse multi-language README (same processing as gen command)
-    parsed_readme = parser_obj.parse_multilingual_content(
-        translation_response.content, 
-        languages
-    )
+    with span("parse"):
+        parsed_readme = parser_obj.parse_multilingual_content(
+            translation_response.content, 
+            languages
+        )
     debug("Multi-language content parsing completed")
     
     # Generate README files (same processing as gen command)
     click.echo("\nGenerating README files")
-    generation_result = generator.generate_readme_files(
-        parsed_readme, 
-        translation_response.raw_response
-    )
+    with span("generate"):
+        generation_result = generator.generate_readme_files(
+            parsed_readme, 
+            translation_response.raw_response,
+            section_plan=section_plan
+        )
     debug("README file generation completed")
     
     # Generate summary report (same processing as gen command)
@@ -225,6 +292,72 @@ def run_text_translation_workflow(
     debug("Summary report generation completed")
 
 
+@click.command()
+@click.argument('manifest', type=click.Path(exists=True, file_okay=True, dir_okay=False))
+@click.option('--provider', help='Translation provider to use: tencent, siliconflow, openai or an installed plugin')
+@click.option('--config', help='Configuration file path')
+@click.option('--concurrency', type=int, help='Jobs in flight across all repositories (default: translation.job_concurrency)')
+@click.option('--verbose', is_flag=True, help='Show detailed output')
+@click.option('--debug', 'debug_mode', is_flag=True, help='Enable debug mode, output DEBUG level logs')
+@click.option('--no-cache', is_flag=True, help='Ignore cached translations and always call the provider')
+@click.option('--full', is_flag=True, help='Translate whole READMEs instead of only the sections changed since the last run')
+@click.option('--metrics-out', type=click.Path(dir_okay=False), help='Write stage and request timings, bytes and tokens as JSON to this file')
+@click.option('--prometheus-out', type=click.Path(dir_okay=False), help='Write the same metrics as a Prometheus textfile (e.g. for the node exporter textfile collector)')
+def batch_command(manifest, provider, config, concurrency, verbose, debug_mode, no_cache, full, metrics_out, prometheus_out):
+    """Run gen/trans for every repository listed in a YAML manifest"""
+    get_metrics().reset()
+    try:
+        # Set log level based on --debug parameter
+        if debug_mode:
+            enable_debug()
+            debug("Debug mode enabled")
+        
+        # Load configuration
+        config_obj = Config(config)
+        debug(f"Configuration file path: {config}")
+        
+        # Validate configuration
+        if not config_obj.validate():
+            click.echo("Error: Configuration validation failed", err=True)
+            return
+        
+        if no_cache:
+            config_obj.set("cache.enabled", False)
+            debug("Translation cache disabled")
+        
+        from ..core.translator import Translator
+        from ..core.parser import Parser
+        from ..core.batch import BatchRunner, load_manifest, format_batch_summary
+        
+        repositories = load_manifest(manifest)
+        debug(f"Loaded {len(repositories)} repositories from {manifest}")
+        
+        # One translator, provider and connection pool for all repositories
+        translator = Translator(config_obj, provider=provider)
+        runner = BatchRunner(
+            translator,
+            Parser(),
+            max_concurrency=concurrency,
+            incremental=not full and config_obj.get("translation.incremental", True)
+        )
+        debug("Core components initialized")
+        
+        click.echo("=" * 50)
+        click.echo(f"Starting batch run for {len(repositories)} repositories")
+        click.echo("=" * 50)
+        
+        results = runner.run(repositories)
+        click.echo(format_batch_summary(results))
+        
+    except Exception as e:
+        click.echo(f"❌ Batch run failed: {e}", err=True)
+        if verbose or debug_mode:
+            import traceback
+            traceback.print_exc()
+    finally:
+        export_metrics(metrics_out, prometheus_out)
+
+
 @click.command()
 @click.option('--config', help='Configuration file path')
 @click.option('--debug', 'debug_mode', is_flag=True, help='Enable debug mode, output DEBUG level logs')
@@ -354,3 +487,90 @@ def export_command(output, debug_mode):
         if debug_mode:
             import traceback
             traceback.print_exc()
+
+
+@click.group()
+def cache_command():
+    """Manage the translation cache"""
+    pass
+
+
+def _load_cache(config, debug_mode):
+    """Load configuration and create translation cache for cache subcommands"""
+    if debug_mode:
+        enable_debug()
+        debug("Debug mode enabled")
+    
+    from ..utils.cache import TranslationCache
+    
+    config_obj = Config(config)
+    debug(f"Configuration file path: {config}")
+    
+    cache = TranslationCache.from_config(config_obj)
+    if cache is None:
+        # Still allow inspecting and cleaning the cache directory when caching is disabled
+        cache = TranslationCache(
+            cache_dir=config_obj.get("cache.dir") or None,
+            max_size_mb=config_obj.get("cache.max_size_mb", 200),
+            max_age_days=config_obj.get("cache.max_age_days", 30)
+        )
+    return cache
+
+
+@cache_command.command(name="stats")
+@click.option('--config', help='Configuration file path')
+@click.option('--debug', 'debug_mode', is_flag=True, help='Enable debug mode, output DEBUG level logs')
+def cache_stats_command(config, debug_mode):
+    """Display translation cache statistics"""
+    try:
+        cache = _load_cache(config, debug_mode)
+        stats = cache.stats()
+        
+        click.echo("Translation cache:")
+        click.echo("=" * 30)
+        click.echo(f"  directory: {stats['cache_dir']}")
+        click.echo(f"  entries: {stats['entries']}")
+        click.echo(f"  size: {stats['total_bytes'] / 1024 / 1024:.2f} MB / {stats['max_bytes'] / 1024 / 1024:.0f} MB")
+        click.echo(f"  max age: {stats['max_age_days']:g} days")
+        
+    except Exception as e:
+        click.echo(f"❌ Failed to get cache statistics: {e}", err=True)
+        if debug_mode:
+            import traceback
+            traceback.print_exc()
+
+
+@cache_command.command(name="prune")
+@click.option('--max-age-days', type=float, help='Remove entries not used for this many days')
+@click.option('--max-size-mb', type=float, help='Shrink the cache below this size')
+@click.option('--config', help='Configuration file path')
+@click.option('--debug', 'debug_mode', is_flag=True, help='Enable debug mode, output DEBUG level logs')
+def cache_prune_command(max_age_days, max_size_mb, config, debug_mode):
+    """Evict expired and least recently used cache entries"""
+    try:
+        cache = _load_cache(config, debug_mode)
+        removed = cache.prune(max_age_days=max_age_days, max_size_mb=max_size_mb)
+        click.echo(f"✅ Removed {removed} cache entries")
+        
+    except Exception as e:
+        click.echo(f"❌ Failed to prune cache: {e}", err=True)
+        if debug_mode:
+            import traceback
+            traceback.print_exc()
+
+
+@cache_command.command(name="clear")
+@click.option('--config', help='Configuration file path')
+@click.option('--debug', 'debug_mode', is_flag=True, help='Enable debug mode, output DEBUG level logs')
+def cache_clear_command(config, debug_mode):
+    """Remove all cached translations"""
+    try:
+        cache = _load_cache(config, debug_mode)
+        removed = cache.clear()
+        click.echo(f"✅ Removed {removed} cache entries from {cache.cache_dir}")
+        
+    except Exception as e:
+        click.echo(f"❌ Failed to clear cache: {e}", err=True)
+        if debug_mode:
+            import traceback
+            traceback.print_exc()
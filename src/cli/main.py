@@ -5,7 +5,7 @@ Provides the main entry point for the command line interface.
 """
 
 import click
-from .commands import gen_command, config_command, trans_command, set_command, export_command
+from .commands import gen_command, config_command, trans_command, batch_command, set_command, export_command, cache_command
 
 
 @click.group()
@@ -22,9 +22,11 @@ def cli():
 # Add all subcommands
 cli.add_command(gen_command, name="gen")
 cli.add_command(trans_command, name="trans")
+cli.add_command(batch_command, name="batch")
 cli.add_command(config_command, name="config")
 cli.add_command(set_command, name="set")
 cli.add_command(export_command, name="export")
+cli.add_command(cache_command, name="cache")
 
 
 def main():
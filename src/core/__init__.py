@@ -4,8 +4,20 @@ Core functionality module
 Contains the core logic for generation, parsing, and generation.
 """
 
-from .translator import Translator
-from .parser import Parser
-from .generator import Generator
+from typing import TYPE_CHECKING
+from ..utils.lazy import lazy_exports
 
-__all__ = ["Translator", "Parser", "Generator"] 
\ No newline at end of file
+if TYPE_CHECKING:
+    from .translator import Translator
+    from .parser import Parser
+    from .generator import Generator
+    from .batch import BatchRunner
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "Translator": ".translator",
+    "Parser": ".parser",
+    "Generator": ".generator",
+    "BatchRunner": ".batch",
+})
+
+__all__ = ["Translator", "Parser", "Generator", "BatchRunner"] 
\ No newline at end of file
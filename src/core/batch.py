@@ -0,0 +1,303 @@
+"""
+Batch processing module
+
+Runs gen/trans for many repositories in one process, sharing a single
+translator, provider and connection pool across all of them.
+"""
+
+import asyncio
+import yaml
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+from .translator import Translator
+from .parser import Parser
+from .generator import Generator
+from .sections import SectionPlan
+from ..services.http_client import run_blocking, run_sync
+from ..models.types import BatchRepository, BatchRepositoryResult, ParsedReadme, TranslationResponse
+from ..utils.logger import debug, info, warning, error
+from ..utils.metrics import span
+
+
+MODES = ("gen", "trans")
+
+
+def load_manifest(manifest_path: Union[str, Path]) -> List[BatchRepository]:
+    """
+    Load a batch manifest
+
+    The manifest is a YAML file with a `repositories` list, or just the list.
+    Entries are repository paths or mappings with `path`, optional `languages`
+    and optional `mode`; top-level `languages` and `mode` are the defaults.
+    Relative paths are resolved against the manifest's directory.
+
+    Args:
+        manifest_path: Manifest file path
+
+    Returns:
+        List[BatchRepository]: Repositories in manifest order
+
+    Raises:
+        ValueError: Manifest is malformed
+    """
+    manifest_path = Path(manifest_path)
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        data = yaml.safe_load(f) or {}
+
+    if isinstance(data, list):
+        data = {"repositories": data}
+    if not isinstance(data, dict) or not isinstance(data.get("repositories"), list):
+        raise ValueError(f"{manifest_path}: expected a 'repositories' list")
+
+    default_languages = _parse_languages(data.get("languages"))
+    default_mode = data.get("mode", "trans")
+
+    repositories = []
+    for index, entry in enumerate(data["repositories"], 1):
+        if isinstance(entry, str):
+            entry = {"path": entry}
+        if not isinstance(entry, dict) or not entry.get("path"):
+            raise ValueError(f"{manifest_path}: repository {index} has no path")
+
+        mode = entry.get("mode", default_mode)
+        if mode not in MODES:
+            raise ValueError(f"{manifest_path}: repository {index} has unknown mode '{mode}'")
+
+        path = Path(entry["path"]).expanduser()
+        if not path.is_absolute():
+            path = manifest_path.parent / path
+
+        languages = _parse_languages(entry.get("languages"))
+        repositories.append(BatchRepository(
+            path=str(path),
+            languages=languages if languages is not None else default_languages,
+            mode=mode
+        ))
+
+    return repositories
+
+
+def _parse_languages(value: Any) -> Optional[List[str]]:
+    """Parse a language list given as YAML list or comma-separated string"""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = value.split(",")
+    return [str(lang).strip() for lang in value if str(lang).strip()]
+
+
+class _RepositoryState:
+    """Work state of one repository during a batch run"""
+
+    def __init__(self, repository: BatchRepository, languages: List[str]):
+        self.repository = repository
+        self.result = BatchRepositoryResult(path=repository.path, mode=repository.mode, languages=languages)
+        self.generator = Generator(base_dir=repository.path)
+        self.content = ""
+        self.section_plan: Optional[SectionPlan] = None
+        self.responses: Dict[str, TranslationResponse] = {}
+        self.remaining = len(languages)
+
+
+class BatchRunner:
+    """Runs (repository, language) jobs of many repositories on one shared worker pool"""
+
+    def __init__(self, translator: Translator, parser_obj: Optional[Parser] = None,
+                 max_concurrency: Optional[int] = None, incremental: bool = True):
+        """
+        Initialize batch runner
+
+        Args:
+            translator: Translator shared by all repositories
+            parser_obj: Parser for provider responses
+            max_concurrency: Jobs in flight across all repositories, defaults to translation.job_concurrency,
+                1 for providers that are not parallel-safe
+            incremental: Whether trans jobs only translate sections changed since the last run
+        """
+        self.translator = translator
+        self.parser = parser_obj or Parser()
+        if max_concurrency is None:
+            max_concurrency = translator.config.get("translation.job_concurrency", 4)
+        self.max_concurrency = translator.request_concurrency(int(max_concurrency))
+        self.incremental = incremental
+
+    def run(self, repositories: List[BatchRepository]) -> List[BatchRepositoryResult]:
+        """
+        Process all repositories
+
+        Args:
+            repositories: Repositories to process
+
+        Returns:
+            List[BatchRepositoryResult]: Results in repository order
+        """
+        return run_sync(self.arun(repositories))
+
+    async def arun(self, repositories: List[BatchRepository]) -> List[BatchRepositoryResult]:
+        """
+        Process all repositories asynchronously
+
+        Args:
+            repositories: Repositories to process
+
+        Returns:
+            List[BatchRepositoryResult]: Results in repository order
+        """
+        states = await asyncio.gather(*[run_blocking(self._prepare, repository) for repository in repositories])
+        jobs = self._schedule(states)
+        info(f"Batch: {len(jobs)} jobs for {len(repositories)} repositories, {self.max_concurrency} at a time")
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        await asyncio.gather(*[self._run_job(state, lang, semaphore) for state, lang in jobs])
+        return [state.result for state in states]
+
+    def _default_languages(self) -> List[str]:
+        """Get target languages for repositories without their own list"""
+        config_languages = self.translator.config.get("translation.default_languages", [])
+        if config_languages:
+            return [self.translator._normalize_language_code(lang) for lang in config_languages]
+        return ["zh-Hans", "en", "ja"]
+
+    def _prepare(self, repository: BatchRepository) -> _RepositoryState:
+        """Read the inputs of a repository, runs on a worker thread"""
+        languages = repository.languages or self._default_languages()
+        state = _RepositoryState(repository, languages)
+        path = Path(repository.path)
+
+        if not path.is_dir():
+            state.result.error = "Repository directory not found"
+        else:
+            with span("read", repository=repository.path) as read_span:
+                if repository.mode == "trans":
+                    state.content = self.translator._read_readme_file(str(path))
+                else:
+                    state.content = self.translator._read_project_content(str(path))
+                read_span.set(bytes_out=len(state.content.encode("utf-8")))
+            if repository.mode == "trans":
+                if not state.content:
+                    state.result.error = "README file not found or read failed"
+                else:
+                    state.section_plan = state.generator.create_section_plan(state.content, incremental=self.incremental)
+
+        if state.result.error:
+            warning(f"⚠ Skipping {repository.path}: {state.result.error}")
+            state.remaining = 0
+        return state
+
+    def _schedule(self, states: List[_RepositoryState]) -> List[Tuple[_RepositoryState, str]]:
+        """
+        Order jobs round-robin over repositories
+
+        Jobs acquire the shared semaphore in this order, so every repository
+        gets a turn before any repository gets its next language.
+        """
+        queues = [list(state.result.languages) for state in states if state.remaining]
+        active = [state for state in states if state.remaining]
+        jobs = []
+        while any(queues):
+            for state, queue in zip(active, queues):
+                if queue:
+                    jobs.append((state, queue.pop(0)))
+        return jobs
+
+    async def _run_job(self, state: _RepositoryState, lang: str, semaphore: asyncio.Semaphore):
+        """Translate one language of a repository and write the repository once its last job finished"""
+        async with semaphore:
+            debug(f"Batch job started: {state.repository.path} [{lang}]")
+            try:
+                with span("translate", repository=state.repository.path, language=lang):
+                    if state.repository.mode == "trans":
+                        response = await self.translator.atranslate_text_only(
+                            state.content,
+                            [lang],
+                            section_plan=state.section_plan,
+                            stream_writer_factory=state.generator.open_stream_writer
+                        )
+                    else:
+                        response = await self.translator.atranslate_project_content(state.content, [lang])
+            except Exception as e:
+                response = TranslationResponse(success=False, error=str(e), languages=[lang])
+
+        if response.success:
+            state.responses[lang] = response
+        else:
+            state.result.errors[lang] = response.error
+            error(f"❌ {state.repository.path} [{lang}]: {response.error}")
+
+        state.remaining -= 1
+        if state.remaining == 0:
+            await run_blocking(self._write, state)
+
+    def _write(self, state: _RepositoryState):
+        """Parse the responses of a repository and write its README files, runs on a worker thread"""
+        contents: Dict[str, str] = {}
+        with span("parse", repository=state.repository.path):
+            for lang in state.result.languages:
+                response = state.responses.get(lang)
+                if response is None:
+                    continue
+                parsed = self.parser.parse_multilingual_content(response.content, [lang])
+                if lang in parsed.content:
+                    contents[lang] = parsed.content[lang]
+                else:
+                    state.result.errors[lang] = "No content found in response"
+
+        if not contents:
+            return
+
+        parsed_readme = ParsedReadme(content=contents, languages=list(contents), total_count=len(contents))
+        raw_response = "\n\n".join(state.responses[lang].raw_response for lang in contents)
+        try:
+            with span("generate", repository=state.repository.path):
+                state.result.generation = state.generator.generate_readme_files(
+                    parsed_readme,
+                    raw_response,
+                    section_plan=state.section_plan
+                )
+        except Exception as e:
+            state.result.error = f"Failed to write README files: {e}"
+            error(f"❌ {state.repository.path}: {state.result.error}")
+            return
+        info(f"✓ {state.repository.path}: {state.result.generation.total_saved} README files written")
+
+
+def format_batch_summary(results: List[BatchRepositoryResult]) -> str:
+    """
+    Build the consolidated summary of a batch run
+
+    Args:
+        results: Batch results
+
+    Returns:
+        str: Summary report text
+    """
+    total_languages = sum(len(result.languages) for result in results)
+    total_saved = 0
+    lines = []
+
+    for result in results:
+        saved = [f["language"] for f in result.generation.saved_files] if result.generation else []
+        failed = dict(result.errors)
+        if result.generation:
+            failed.update({f["language"]: f["error"] for f in result.generation.failed_files})
+        total_saved += len(saved)
+
+        if result.error and not saved:
+            lines.append(f"❌ {result.path}: {result.error}")
+            continue
+
+        status = "✓" if not failed and not result.error else "⚠"
+        line = f"{status} {result.path} ({result.mode}): {', '.join(saved) if saved else 'nothing written'}"
+        if failed:
+            line += "; failed: " + ", ".join(f"{lang} ({reason})" for lang, reason in failed.items())
+        if result.error:
+            line += f"; {result.error}"
+        lines.append(line)
+
+    return "\n".join([
+        "=" * 60,
+        f"Batch summary: {len(results)} repositories, {total_saved}/{total_languages} READMEs generated",
+        "=" * 60,
+        *lines,
+        "=" * 60
+    ])
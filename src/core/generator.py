@@ -6,30 +6,100 @@ Responsible for generating and saving multi-language README files.
 
 import os
 from pathlib import Path
-from typing import Dict, List, Optional
-from ..utils.file_utils import FileUtils
+from typing import Dict, List, Optional, Union
+from ..utils.file_utils import FileUtils, AtomicFileWriter
 from ..models.types import ParsedReadme, GenerationResult
+from .sections import SectionPlan
 from ..utils.logger import debug, info, warning, error
 
 
 class Generator:
     """Document generator class, responsible for generating and saving multi-language README files"""
     
-    def __init__(self):
+    def __init__(self, base_dir: Optional[Union[str, Path]] = None):
         """
         Initialize generator
+        
+        Args:
+            base_dir: Project directory the README files are written to, defaults to the current directory
         """
-        self.output_dir = Path("docs")
+        self.base_dir = Path(base_dir) if base_dir is not None else Path(".")
+        self.output_dir = self.base_dir / "docs"
         self.file_utils = FileUtils()
         debug("Document generator initialized")
         
-    def generate_readme_files(self, parsed_readme: ParsedReadme, raw_content: str = "") -> GenerationResult:
+    def create_section_plan(self, text: str, incremental: bool = True) -> SectionPlan:
+        """
+        Create an incremental translation plan against the existing output files
+        
+        Args:
+            text: Source README content
+            incremental: Whether unchanged sections may be reused from existing translations
+            
+        Returns:
+            SectionPlan: Section plan for the source README
+        """
+        return SectionPlan(
+            text,
+            manifest_path=self.output_dir / SectionPlan.MANIFEST_NAME,
+            load_translation=self._read_existing_translation,
+            incremental=incremental
+        )
+    
+    def open_stream_writer(self, lang: str) -> Optional[AtomicFileWriter]:
+        """
+        Open an atomic writer for streaming a translation into its README file
+        
+        Args:
+            lang: Language code
+            
+        Returns:
+            Optional[AtomicFileWriter]: Writer for docs/README.<lang>.md, None for English which needs the language note
+        """
+        if lang == "English" or lang == "en":
+            return None
+        
+        self._ensure_output_directory()
+        filepath = self.output_dir / self._get_filename_for_language(lang)
+        debug(f"Streaming {lang} README to temporary file next to {filepath}")
+        return AtomicFileWriter(filepath)
+    
+    def _read_existing_translation(self, lang: str) -> Optional[str]:
+        """
+        Read previously generated README for a language
+        
+        Args:
+            lang: Language code
+            
+        Returns:
+            Optional[str]: Existing README content without language note, None if missing
+        """
+        if lang == "English" or lang == "en":
+            filepath = self.base_dir / "README.md"
+        else:
+            filepath = self.output_dir / self._get_filename_for_language(lang)
+        
+        try:
+            content = filepath.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            return None
+        
+        if lang == "English" or lang == "en":
+            lines = content.split('\n')
+            while lines and (lines[0].strip().startswith('>') or lines[0].strip() == ''):
+                lines.pop(0)
+            content = '\n'.join(lines)
+        
+        return content
+    
+    def generate_readme_files(self, parsed_readme: ParsedReadme, raw_content: str = "", section_plan: Optional[SectionPlan] = None) -> GenerationResult:
         """
         Generate multi-language README files
         
         Args:
             parsed_readme: Parsed README object
             raw_content: Original response content (no longer saved)
+            section_plan: Incremental translation plan, partial translations are re-assembled with it
             
         Returns:
             GenerationResult: Generation result object
@@ -47,13 +117,24 @@ class Generator:
         
         # Save README files for each language
         for lang, content in parsed_readme.content.items():
+            filename = self._get_filename_for_language(lang)
             try:
                 debug(f"Generating README file for {lang} language")
                 
+                if section_plan is not None:
+                    if lang in section_plan.partial_languages:
+                        assembled = section_plan.assemble(lang, content)
+                        if assembled is None:
+                            section_plan.forget(lang)
+                            raise ValueError("Translated sections do not match the source, run again to translate in full")
+                        content = assembled
+                        debug(f"Re-assembled {lang} README from cached and freshly translated sections")
+                    section_plan.record(lang, content)
+                
                 # English README goes in root directory
                 if lang == "English" or lang == "en":
                     filename = "README.md"
-                    filepath = Path(filename)
+                    filepath = self.base_dir / filename
                     # Add multi-language note at the beginning of English README
                     language_note = f"> Homepage is English README. You can view the {language_links} versions.\n\n"
                     content = self._add_language_note_to_content(content, language_note)
@@ -71,7 +152,7 @@ class Generator:
                     "filepath": str(filepath),
                     "size": len(content)
                 })
-                debug(f"✅ Successfully saved {lang} README file ({len(content)} characters)")
+                debug("✅ Successfully saved %s README file (%d characters)", lang, len(content))
             except Exception as e:
                 failed_files.append({
                     "language": lang,
@@ -80,8 +161,17 @@ class Generator:
                 })
                 error(f"❌ Failed to save {lang} README: {e}")
                 debug(f"Save failure details: {e}")
+                if section_plan is not None:
+                    section_plan.forget(lang)
         
-
+        # Keep the section manifest in sync with the files that were just written
+        if section_plan is not None:
+            section_plan.save()
+        else:
+            SectionPlan.invalidate(
+                self.output_dir / SectionPlan.MANIFEST_NAME,
+                [f["language"] for f in saved_files]
+            )
         
         debug(f"README file generation completed: {len(saved_files)} successful, {len(failed_files)} failed")
         return GenerationResult(
@@ -115,17 +115,17 @@ class Parser:
         json_data, language_content = extract_json_content(response_text)
         
         if json_data:
-            debug(f"🔍 Successfully extracted JSON data, contains {len(json_data)} keys")
+            debug("🔍 Successfully extracted JSON data, contains %d keys", len(json_data))
             
             # Use extracted language content
             for lang_code, content in language_content.items():
                 if lang_code in languages:
                     results[lang_code] = content
                     found_languages.append(lang_code)
-                    debug(f"Successfully parsed {lang_code} language content")
+                    debug("Successfully parsed %s language content", lang_code)
             
             if results:
-                debug(f"Successfully parsed {len(results)} languages")
+                debug("Successfully parsed %d languages", len(results))
                 return ParsedReadme(
                     content=results,
                     languages=found_languages,
@@ -133,7 +133,7 @@ class Parser:
                 )
         else:
             error("Unable to extract JSON data")
-            debug(f"Original response text: {response_text[:200]}...")
+            debug(lambda: f"Original response text: {response_text[:200]}...")
         
         if not results:
             warning("Failed to parse multi-language README content")
@@ -0,0 +1,347 @@
+"""
+File ranking module
+
+Ranks project files by how much they tell about the project, using cheap
+features extracted once per file content: entry points declared in the
+packaging metadata, import in-degree, public symbol count and docstring
+density. Files are then chosen under a token budget instead of a fixed count.
+"""
+
+import json
+import posixpath
+import re
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+from ..utils.ingest import FileRecord, bounded_map
+from ..utils.scan_index import ScanIndex
+from ..utils.tokens import TokenCounter
+from .summarizer import summarize
+from ..utils.logger import debug
+
+
+# Only this much of a file is parsed for features
+FEATURE_READ_LIMIT = 256 * 1024
+
+PYTHON_SUFFIXES = (".py", ".pyi")
+SCRIPT_SUFFIXES = (".js", ".jsx", ".ts", ".tsx", ".mjs", ".cjs")
+# Directories commonly holding top-level packages
+SOURCE_ROOTS = ("src", "lib")
+
+_PY_IMPORT = re.compile(r"^[ \t]*import[ \t]+([\w.]+(?:[ \t]*,[ \t]*[\w.]+)*)", re.M)
+_PY_FROM_IMPORT = re.compile(r"^[ \t]*from[ \t]+(\.*[\w.]*)[ \t]+import[ \t]+\(?([\w \t,]*)", re.M)
+_PY_PUBLIC = re.compile(r"^(?:async[ \t]+def|def|class)[ \t]+([A-Za-z]\w*)", re.M)
+_PY_DOC_QUOTES = re.compile(r'"""|\'\'\'')
+_SCRIPT_IMPORT = re.compile(r"""(?:\bfrom[ \t]+|\brequire\(\s*|\bimport\(\s*|^[ \t]*import[ \t]+)['"]([^'"\n]+)['"]""", re.M)
+_SCRIPT_PUBLIC = re.compile(
+    r"^export[ \t]+(?:default[ \t]+)?(?:async[ \t]+)?(?:function\*?|class|const|let|var|interface|type|enum)[ \t]+\w",
+    re.M
+)
+_COMMENT_LINE = re.compile(r"^[ \t]*(?:#|//|/\*|\*)", re.M)
+
+_PYPROJECT_SCRIPT_SECTION = re.compile(r"^\[(?:project\.scripts|project\.gui-scripts|tool\.poetry\.scripts)\][ \t]*$")
+_SCRIPT_TARGET = re.compile(r"""['"]?[\w.-]+['"]?[ \t]*=[ \t]*['"]([\w.]+)[ \t]*:[ \t]*[\w.]+['"]""")
+_SETUP_SCRIPT_TARGET = re.compile(r"""['"][ \t]*[\w.-]+[ \t]*=[ \t]*([\w.]+)[ \t]*:[ \t]*[\w.]+[ \t]*['"]""")
+
+# Score weights of the ranking features
+ENTRY_POINT_POINTS = 200
+IMPORT_POINTS = 25
+MAX_COUNTED_IMPORTERS = 8
+SYMBOL_POINTS = 5
+MAX_COUNTED_SYMBOLS = 20
+DOC_DENSITY_POINTS = 50
+
+# Tokens of the "=== path ===" header in front of every file's excerpt
+HEADER_TOKENS = 10
+
+
+@dataclass
+class FileFeatures:
+    """Ranking features of one file, stored in the scan index by content hash"""
+    imports: List[str] = field(default_factory=list)
+    public_symbols: int = 0
+    doc_lines: int = 0
+    lines: int = 0
+    tokens: int = 0
+    # Tokens of the structural summary sent in place of long source files, 0 without one
+    summary_tokens: int = 0
+
+
+@dataclass
+class RankedFile:
+    """File record with its ranking features and score"""
+    record: FileRecord
+    features: FileFeatures
+    entry_point: bool = False
+    importers: int = 0
+    score: float = 0.0
+
+
+def extract_features(path: Path, counter: Optional[TokenCounter] = None) -> FileFeatures:
+    """
+    Extract ranking features of a file
+
+    Args:
+        path: File path
+        counter: Token counter for the file size, defaults to the approximation
+
+    Returns:
+        FileFeatures: Features, empty if the file cannot be read
+    """
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            text = f.read(FEATURE_READ_LIMIT)
+    except OSError:
+        return FileFeatures()
+
+    counter = counter or TokenCounter()
+    summary = summarize(path, text)
+    features = FileFeatures(
+        lines=text.count("\n") + (1 if text and not text.endswith("\n") else 0),
+        tokens=counter.count_raw(text),
+        summary_tokens=counter.count_raw(summary) if summary else 0
+    )
+    suffix = path.suffix.lower()
+
+    if suffix in PYTHON_SUFFIXES:
+        for match in _PY_IMPORT.finditer(text):
+            features.imports.extend(name.strip() for name in match.group(1).split(","))
+        for match in _PY_FROM_IMPORT.finditer(text):
+            module, names = match.group(1), match.group(2)
+            if module.strip(".") or not names.strip():
+                features.imports.append(module)
+            else:
+                # "from . import a, b" imports sibling modules
+                features.imports.extend(module + name.strip() for name in names.split(",") if name.strip())
+        features.public_symbols = len(_PY_PUBLIC.findall(text))
+        features.doc_lines = _count_docstring_lines(text) + len(_COMMENT_LINE.findall(text))
+    elif suffix in SCRIPT_SUFFIXES:
+        features.imports = _SCRIPT_IMPORT.findall(text)
+        features.public_symbols = len(_SCRIPT_PUBLIC.findall(text))
+        features.doc_lines = len(_COMMENT_LINE.findall(text))
+    else:
+        features.doc_lines = len(_COMMENT_LINE.findall(text))
+
+    return features
+
+
+def _count_docstring_lines(text: str) -> int:
+    """Count lines inside triple-quoted strings"""
+    count = 0
+    start = None
+    for match in _PY_DOC_QUOTES.finditer(text):
+        if start is None:
+            start = match.start()
+        else:
+            count += text.count("\n", start, match.end()) + 1
+            start = None
+    return count
+
+
+def find_entry_points(project_path: Path) -> Set[str]:
+    """
+    Find modules declared as console or GUI scripts
+
+    Reads [project.scripts], [project.gui-scripts] and [tool.poetry.scripts]
+    of pyproject.toml, the entry_points of setup.py and setup.cfg, and
+    "main"/"bin" of package.json.
+
+    Args:
+        project_path: Project root directory
+
+    Returns:
+        Set[str]: Dotted Python module names and project-relative script paths
+    """
+    entry_points: Set[str] = set()
+
+    pyproject = _read_small(project_path / "pyproject.toml")
+    in_scripts = False
+    for line in pyproject.splitlines():
+        if line.startswith("["):
+            in_scripts = bool(_PYPROJECT_SCRIPT_SECTION.match(line.strip()))
+        elif in_scripts:
+            entry_points.update(_SCRIPT_TARGET.findall(line))
+
+    for name in ("setup.py", "setup.cfg"):
+        text = _read_small(project_path / name)
+        entry_points.update(_SETUP_SCRIPT_TARGET.findall(text))
+        if name == "setup.cfg":
+            # setup.cfg lists "name = module:func" without quotes
+            entry_points.update(re.findall(r"^[ \t]+[\w.-]+[ \t]*=[ \t]*([\w.]+)[ \t]*:[ \t]*[\w.]+[ \t]*$", text, re.M))
+
+    package_json = _read_small(project_path / "package.json")
+    if package_json:
+        try:
+            package = json.loads(package_json)
+        except ValueError:
+            package = {}
+        if isinstance(package, dict):
+            targets = [package.get("main")]
+            bins = package.get("bin")
+            targets.extend(bins.values() if isinstance(bins, dict) else [bins])
+            entry_points.update(posixpath.normpath(target) for target in targets if isinstance(target, str))
+
+    return entry_points
+
+
+def _read_small(path: Path) -> str:
+    """Read a small metadata file, empty if missing"""
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            return f.read(FEATURE_READ_LIMIT)
+    except OSError:
+        return ""
+
+
+def _module_names(relative_path: str) -> List[str]:
+    """Get the dotted module names a Python file can be imported by"""
+    parts = relative_path[:relative_path.rfind(".")].split("/")
+    if parts[-1] == "__init__":
+        parts = parts[:-1]
+    # Full name, dotted suffixes for packages below other directories, and
+    # single names only right below a source root, so "import json" does not
+    # resolve to some deep json.py
+    return [
+        ".".join(parts[i:]) for i in range(len(parts))
+        if i == 0 or len(parts) - i >= 2 or parts[i - 1] in SOURCE_ROOTS
+    ]
+
+
+def _resolve_python(module: str, relative_path: str, modules: Dict[str, str]) -> Optional[str]:
+    """Resolve an import of a Python file to a project file"""
+    if module.startswith("."):
+        level = len(module) - len(module.lstrip("."))
+        # Package of both "pkg/mod.py" and "pkg/__init__.py" is "pkg"
+        package = relative_path[:relative_path.rfind(".")].split("/")[:-1]
+        if level > 1:
+            package = package[:len(package) - (level - 1)] if level - 1 <= len(package) else []
+        name = module.lstrip(".")
+        module = ".".join(package + ([name] if name else []))
+    # "import a.b.c" may name a module or an attribute of one
+    while module:
+        target = modules.get(module)
+        if target is not None:
+            return target
+        module = module.rpartition(".")[0]
+    return None
+
+
+def _resolve_script(specifier: str, relative_path: str, paths: Set[str]) -> Optional[str]:
+    """Resolve a relative JavaScript/TypeScript import to a project file"""
+    if not specifier.startswith("."):
+        return None
+    base = posixpath.normpath(posixpath.join(posixpath.dirname(relative_path), specifier))
+    for candidate in [base] + [base + suffix for suffix in SCRIPT_SUFFIXES] + [f"{base}/index{suffix}" for suffix in SCRIPT_SUFFIXES]:
+        if candidate in paths:
+            return candidate
+    return None
+
+
+def rank_files(records: List[FileRecord], project_path: Path, index: Optional[ScanIndex] = None,
+               counter: Optional[TokenCounter] = None, max_workers: int = 8) -> List[RankedFile]:
+    """
+    Rank files by importance
+
+    Features are taken from the scan index when the file content is
+    unchanged and extracted on the ingestion pool otherwise.
+
+    Args:
+        records: Ingested file records
+        project_path: Project root directory
+        index: Scan index to reuse and store features in
+        counter: Token counter for file sizes
+        max_workers: Worker threads for feature extraction
+
+    Returns:
+        List[RankedFile]: Files from most to least important
+    """
+    if not records:
+        return []
+    project_path = Path(project_path)
+    stored = index.get_features(records) if index is not None else [None] * len(records)
+    features: List[Optional[FileFeatures]] = [FileFeatures(**data) if data else None for data in stored]
+
+    missing = [i for i, item in enumerate(features) if item is None]
+    extracted = bounded_map(lambda i: extract_features(records[i].path, counter), missing, max_workers)
+    for i, item in zip(missing, extracted):
+        features[i] = item
+    if index is not None and missing:
+        index.set_features([(records[i], asdict(features[i])) for i in missing])
+
+    relative_paths = [record.path.relative_to(project_path).as_posix() for record in records]
+    path_set = set(relative_paths)
+    modules: Dict[str, str] = {}
+    for relative_path in relative_paths:
+        if relative_path.endswith(PYTHON_SUFFIXES):
+            for name in _module_names(relative_path):
+                # Shorter names may be ambiguous, the first (shallowest walk order) file wins
+                modules.setdefault(name, relative_path)
+
+    importers: Dict[str, Set[str]] = {}
+    for relative_path, item in zip(relative_paths, features):
+        is_python = relative_path.endswith(PYTHON_SUFFIXES)
+        for module in item.imports:
+            if is_python:
+                target = _resolve_python(module, relative_path, modules)
+            else:
+                target = _resolve_script(module, relative_path, path_set)
+            if target is not None and target != relative_path:
+                importers.setdefault(target, set()).add(relative_path)
+
+    entry_names = find_entry_points(project_path)
+    ranked = []
+    for record, relative_path, item in zip(records, relative_paths, features):
+        entry_point = relative_path in entry_names or (
+            relative_path.endswith(PYTHON_SUFFIXES) and any(name in entry_names for name in _module_names(relative_path))
+        )
+        importer_count = len(importers.get(relative_path, ()))
+        doc_density = item.doc_lines / item.lines if item.lines else 0.0
+        score = (
+            record.score
+            + (ENTRY_POINT_POINTS if entry_point else 0)
+            + IMPORT_POINTS * min(importer_count, MAX_COUNTED_IMPORTERS)
+            + SYMBOL_POINTS * min(item.public_symbols, MAX_COUNTED_SYMBOLS)
+            + DOC_DENSITY_POINTS * min(doc_density, 1.0)
+        )
+        ranked.append(RankedFile(record=record, features=item, entry_point=entry_point, importers=importer_count, score=score))
+
+    # Stable sort keeps walk order among equal scores
+    ranked.sort(key=lambda item: item.score, reverse=True)
+    debug(lambda: f"Ranked {len(ranked)} files, {len(entry_names)} entry points, {sum(len(s) for s in importers.values())} internal imports")
+    return ranked
+
+
+def select_within_budget(ranked: Iterable[RankedFile], budget_tokens: int, excerpt_tokens: int) -> List[RankedFile]:
+    """
+    Choose the best files whose excerpts fit a token budget
+
+    Each file costs its excerpt plus its header: the whole file if it fits
+    excerpt_tokens, else its structural summary, at most excerpt_tokens. Files that do not fit are skipped, so smaller
+    files further down may still be taken; files without a positive score
+    or content are never worth their tokens.
+
+    Args:
+        ranked: Files from most to least important
+        budget_tokens: Token budget of all selected excerpts
+        excerpt_tokens: Token budget of one excerpt
+
+    Returns:
+        List[RankedFile]: Selected files in rank order
+    """
+    selected = []
+    remaining = budget_tokens
+    for item in ranked:
+        if remaining < HEADER_TOKENS:
+            break
+        cost = _excerpt_cost(item.features, excerpt_tokens) + HEADER_TOKENS
+        if item.score > 0 and item.features.tokens and cost <= remaining:
+            selected.append(item)
+            remaining -= cost
+    return selected
+
+
+def _excerpt_cost(features: FileFeatures, excerpt_tokens: int) -> int:
+    """Get the tokens of a file's excerpt, mirroring Translator._read_compressed()"""
+    if features.tokens <= excerpt_tokens:
+        return features.tokens
+    return min(excerpt_tokens, features.summary_tokens or excerpt_tokens)
@@ -0,0 +1,293 @@
+"""
+Section-level incremental translation module
+
+Splits Markdown documents into heading-delimited sections and tracks which
+sections changed since the previous translation run.
+"""
+
+import re
+import json
+import hashlib
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union
+from ..utils.logger import debug, info, warning
+
+
+HEADING_PATTERN = re.compile(r'^ {0,3}#{1,6}(?:[ \t]|$)')
+FENCE_PATTERN = re.compile(r'^ {0,3}(`{3,}|~{3,})')
+
+
+def split_sections(text: str) -> List[str]:
+    """
+    Split Markdown text into heading-delimited sections
+
+    Headings inside fenced code blocks are ignored. Content before the first
+    heading forms its own section. Empty sections are dropped.
+
+    Args:
+        text: Markdown text
+
+    Returns:
+        List[str]: Section texts without surrounding blank lines
+    """
+    sections = []
+    current: List[str] = []
+    fence = None
+
+    for line in text.split('\n'):
+        fence_match = FENCE_PATTERN.match(line)
+        if fence:
+            marker = fence_match.group(1) if fence_match else ""
+            if marker and marker[0] == fence[0] and len(marker) >= len(fence):
+                fence = None
+        elif fence_match:
+            fence = fence_match.group(1)
+        elif HEADING_PATTERN.match(line) and current:
+            sections.append('\n'.join(current).strip())
+            current = []
+        current.append(line)
+
+    if current:
+        sections.append('\n'.join(current).strip())
+
+    return [section for section in sections if section]
+
+
+def join_sections(sections: List[str]) -> str:
+    """
+    Join sections back into a Markdown document
+
+    Args:
+        sections: Section texts
+
+    Returns:
+        str: Markdown document
+    """
+    return "\n\n".join(sections)
+
+
+def section_hash(section: str) -> str:
+    """
+    Get content hash of a section
+
+    Args:
+        section: Section text
+
+    Returns:
+        str: SHA-256 hex digest
+    """
+    return hashlib.sha256(section.encode("utf-8")).hexdigest()
+
+
+class SectionPlan:
+    """Incremental translation plan for one source document"""
+
+    MANIFEST_NAME = ".duoreadme-sections.json"
+    MANIFEST_VERSION = 1
+
+    def __init__(self, text: str, manifest_path: Union[str, Path],
+                 load_translation: Callable[[str], Optional[str]], incremental: bool = True):
+        """
+        Initialize section plan
+
+        Args:
+            text: Source Markdown document
+            manifest_path: Path of the section manifest from previous runs
+            load_translation: Callback returning the existing translated document for a language
+            incremental: Whether unchanged sections may be reused, if False every language is translated in full
+        """
+        self.sections = split_sections(text)
+        self.hashes = [section_hash(section) for section in self.sections]
+        self.manifest_path = Path(manifest_path)
+        self.incremental = incremental
+        self._load_translation = load_translation
+        self._manifest = self._load_manifest()
+
+        # Per-language state, filled by prepare()
+        self.changed: Dict[str, List[int]] = {}
+        self.reused: Dict[str, Dict[int, str]] = {}
+        self.partial_languages: Set[str] = set()
+        self._recorded: Dict[str, List[str]] = {}
+        self._forgotten: Set[str] = set()
+
+    def _load_manifest(self) -> Dict[str, List[str]]:
+        """Load per-language source section hashes of the previous run"""
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            warning(f"⚠ Ignoring unreadable section manifest {self.manifest_path}: {e}")
+            return {}
+
+        if data.get("version") != self.MANIFEST_VERSION:
+            return {}
+        return data.get("languages", {})
+
+    def prepare(self, languages: List[str]):
+        """
+        Compute changed sections for every target language
+
+        Args:
+            languages: Target language codes
+        """
+        for lang in languages:
+            previous_hashes = self._manifest.get(lang) if self.incremental else None
+            previous_text = self._load_translation(lang) if previous_hashes else None
+
+            if not previous_text:
+                self.changed[lang] = list(range(len(self.sections)))
+                continue
+
+            previous_sections = split_sections(previous_text)
+            if len(previous_sections) != len(previous_hashes):
+                debug(f"{lang}: existing translation no longer matches section manifest, translating in full")
+                self.changed[lang] = list(range(len(self.sections)))
+                continue
+
+            previous_index: Dict[str, int] = {}
+            for index, digest in enumerate(previous_hashes):
+                previous_index.setdefault(digest, index)
+
+            changed = []
+            reused = {}
+            for index, digest in enumerate(self.hashes):
+                if digest in previous_index:
+                    reused[index] = previous_sections[previous_index[digest]]
+                else:
+                    changed.append(index)
+
+            self.changed[lang] = changed
+            self.reused[lang] = reused
+            info(f"{lang}: {len(changed)}/{len(self.sections)} sections changed since last translation")
+
+    def is_full(self, lang: str) -> bool:
+        """Whether the language needs a full translation"""
+        return len(self.changed.get(lang, [])) == len(self.sections)
+
+    def groups(self, languages: Optional[List[str]] = None) -> List[Tuple[List[int], List[str]]]:
+        """
+        Group incremental languages sharing the same changed sections
+
+        Args:
+            languages: Only consider these languages, None for all prepared languages
+
+        Returns:
+            List[Tuple[List[int], List[str]]]: (changed section indices, language codes) pairs
+        """
+        grouped: Dict[Tuple[int, ...], List[str]] = {}
+        for lang, changed in self.changed.items():
+            if languages is not None and lang not in languages:
+                continue
+            if not self.is_full(lang):
+                grouped.setdefault(tuple(changed), []).append(lang)
+        return [(list(changed), langs) for changed, langs in grouped.items()]
+
+    def full_languages(self, languages: Optional[List[str]] = None) -> List[str]:
+        """Languages that need a full translation, optionally restricted to the given ones"""
+        return [lang for lang in self.changed if self.is_full(lang) and (languages is None or lang in languages)]
+
+    def changed_text(self, changed: List[int]) -> str:
+        """
+        Build the document containing only the changed sections
+
+        Args:
+            changed: Changed section indices
+
+        Returns:
+            str: Markdown text to send to the provider
+        """
+        return join_sections([self.sections[index] for index in changed])
+
+    def mark_partial(self, lang: str):
+        """Mark that the translation result of a language only contains changed sections"""
+        self.partial_languages.add(lang)
+
+    def assemble(self, lang: str, translated_changed: str = "") -> Optional[str]:
+        """
+        Re-assemble a full translation from reused and freshly translated sections
+
+        Args:
+            lang: Language code
+            translated_changed: Translation of the changed sections
+
+        Returns:
+            Optional[str]: Full translated document, None if the translated sections do not line up
+        """
+        changed = self.changed.get(lang, [])
+        translated_sections = split_sections(translated_changed) if changed else []
+
+        if len(translated_sections) != len(changed):
+            warning(f"⚠ {lang}: expected {len(changed)} translated sections, got {len(translated_sections)}")
+            return None
+
+        fresh = dict(zip(changed, translated_sections))
+        reused = self.reused.get(lang, {})
+        return join_sections([fresh[index] if index in fresh else reused[index] for index in range(len(self.sections))])
+
+    def record(self, lang: str, translated: str):
+        """
+        Record that a language's output now corresponds to the current source
+
+        Args:
+            lang: Language code
+            translated: Full translated document that was written
+        """
+        if len(split_sections(translated)) == len(self.sections):
+            self._recorded[lang] = self.hashes
+        else:
+            # Sections do not line up, next run has to translate this language in full
+            self.forget(lang)
+
+    def forget(self, lang: str):
+        """Drop a language from the manifest so it is translated in full next time"""
+        self._recorded.pop(lang, None)
+        self._forgotten.add(lang)
+
+    def save(self):
+        """Save manifest with the languages recorded in this run"""
+        languages = {lang: hashes for lang, hashes in self._manifest.items() if lang not in self._forgotten}
+        languages.update(self._recorded)
+        self.write_manifest(self.manifest_path, languages)
+
+    @classmethod
+    def write_manifest(cls, manifest_path: Union[str, Path], languages: Dict[str, List[str]]):
+        """
+        Write section manifest
+
+        Args:
+            manifest_path: Manifest file path
+            languages: Language code to source section hashes mapping
+        """
+        manifest_path = Path(manifest_path)
+        try:
+            manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(manifest_path, "w", encoding="utf-8") as f:
+                json.dump({"version": cls.MANIFEST_VERSION, "languages": languages}, f, indent=2, sort_keys=True)
+            debug(f"Section manifest saved to {manifest_path}")
+        except OSError as e:
+            warning(f"⚠ Failed to save section manifest: {e}")
+
+    @classmethod
+    def invalidate(cls, manifest_path: Union[str, Path], languages: List[str]):
+        """
+        Remove languages from an existing manifest
+
+        Used when output files are rewritten without a section plan, e.g. by `gen`.
+
+        Args:
+            manifest_path: Manifest file path
+            languages: Language codes to remove
+        """
+        manifest_path = Path(manifest_path)
+        if not manifest_path.exists():
+            return
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        remaining = {lang: hashes for lang, hashes in data.get("languages", {}).items() if lang not in languages}
+        cls.write_manifest(manifest_path, remaining)
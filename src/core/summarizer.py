@@ -0,0 +1,238 @@
+"""
+Code summarizer module
+
+Reduces source files to their structure: module docstring, class and
+function signatures and the first line of their docstrings. Python files
+are summarized from their syntax tree, other languages by matching
+declaration lines, so license headers and import blocks no longer take up
+the excerpt of a file.
+"""
+
+import ast
+import re
+from pathlib import Path
+from typing import List, Optional, Union
+
+
+PYTHON_SUFFIXES = (".py", ".pyi")
+
+# Languages summarized by declaration lines
+DECLARATION_SUFFIXES = (
+    ".js", ".jsx", ".ts", ".tsx", ".mjs", ".cjs", ".go", ".rs", ".java", ".kt", ".swift",
+    ".c", ".h", ".cpp", ".hpp", ".cc", ".cs", ".rb", ".php", ".scala", ".dart"
+)
+
+_DECLARATION = re.compile(
+    r"^[ \t]*(?:export[ \t]+(?:default[ \t]+)?|pub(?:\([^)]*\))?[ \t]+|public[ \t]+|protected[ \t]+|internal[ \t]+|"
+    r"static[ \t]+|abstract[ \t]+|final[ \t]+|sealed[ \t]+|open[ \t]+|data[ \t]+|async[ \t]+|unsafe[ \t]+)*"
+    r"(?:function\*?|class|interface|type|enum|struct|trait|impl|fn|func|def|module|namespace|object|record)[ \t]"
+)
+# Methods of Java-like languages, which have modifiers but no keyword
+_METHOD = re.compile(r"^[ \t]*(?:public|protected|internal)[ \t]+[\w<>\[\],.? \t]*?\w+[ \t]*\(")
+_LEADING_COMMENT = re.compile(r"^[ \t]*(?:/\*|\*|//|#)")
+_LICENSE = re.compile(r"licen[sc]e|copyright|spdx", re.I)
+_WHITESPACE = re.compile(r"\s+")
+
+# Nesting depth of declarations kept by the declaration matcher
+MAX_DECLARATION_INDENT = 8
+# Module constants kept in a Python summary
+MAX_CONSTANTS = 10
+
+
+def summarize(path: Union[str, Path], text: str) -> Optional[str]:
+    """
+    Summarize a source file
+
+    Args:
+        path: File path, the suffix selects the summarizer
+        text: File content
+
+    Returns:
+        Optional[str]: Summary, None if the file type is not supported or
+            nothing structural was found
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix in PYTHON_SUFFIXES:
+        return summarize_python(text)
+    if suffix in DECLARATION_SUFFIXES:
+        return summarize_declarations(text)
+    return None
+
+
+def summarize_python(text: str) -> Optional[str]:
+    """
+    Summarize a Python module from its syntax tree
+
+    Keeps the module docstring, decorators, class and function signatures
+    (public ones and __init__) and the first line of their docstrings.
+
+    Args:
+        text: Python source
+
+    Returns:
+        Optional[str]: Summary, None if the source does not parse
+    """
+    try:
+        tree = ast.parse(text)
+    except (SyntaxError, ValueError):
+        return None
+
+    lines = text.splitlines()
+    output: List[str] = []
+
+    docstring = ast.get_docstring(tree)
+    if docstring:
+        # First paragraph only
+        paragraph = docstring.strip().split("\n\n")[0].strip()
+        output.append(f'"""{paragraph}"""')
+        output.append("")
+
+    constants = 0
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            _summarize_definition(node, lines, output, "")
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)) and _is_constant(node) and constants < MAX_CONSTANTS:
+            output.append(_source_line(lines, node.lineno))
+            constants += 1
+
+    if not output:
+        return None
+    return "\n".join(output).strip() + "\n"
+
+
+def _summarize_definition(node: ast.AST, lines: List[str], output: List[str], indent: str):
+    """Append the signature and docstring line of a class or function, recursing into classes"""
+    name = node.name
+    if name.startswith("_") and name != "__init__":
+        return
+
+    for decorator in node.decorator_list:
+        output.append(indent + _source_line(lines, decorator.lineno))
+    output.append(indent + _signature(node, lines))
+
+    docstring = ast.get_docstring(node)
+    if docstring:
+        output.append(f'{indent}    """{docstring.strip().splitlines()[0].strip()}"""')
+
+    if isinstance(node, ast.ClassDef):
+        for child in node.body:
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                _summarize_definition(child, lines, output, indent + "    ")
+        output.append("")
+
+
+def _signature(node: ast.AST, lines: List[str]) -> str:
+    """Get the header of a class or function as one line, from the source"""
+    first = node.body[0]
+    start_line, end_line = node.lineno - 1, first.lineno - 1
+    if start_line == end_line:
+        # One-liner such as "def f(): pass"
+        header = [lines[start_line][:first.col_offset]]
+    else:
+        header = [line for line in lines[start_line:end_line] if not line.strip().startswith("#")]
+        if first.col_offset and end_line < len(lines) and lines[end_line][:first.col_offset].strip():
+            header.append(lines[end_line][:first.col_offset])
+
+    signature = _WHITESPACE.sub(" ", " ".join(_strip_comment(part).strip() for part in header)).strip()
+    return signature.replace("( ", "(").replace(" )", ")").replace(", )", ")").replace(",)", ")")
+
+
+def _strip_comment(line: str) -> str:
+    """Remove a trailing # comment from a source line, ignoring # inside strings"""
+    quote = None
+    for i, char in enumerate(line):
+        if quote:
+            if char == quote and line[i - 1] != "\\":
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char == "#":
+            return line[:i]
+    return line
+
+
+def _is_constant(node: ast.AST) -> bool:
+    """Whether an assignment defines a module constant such as VERSION = "1.0" """
+    targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+    return (
+        len(targets) == 1
+        and isinstance(targets[0], ast.Name)
+        and targets[0].id.isupper()
+        and node.lineno == getattr(node, "end_lineno", node.lineno)
+    )
+
+
+def _source_line(lines: List[str], lineno: int) -> str:
+    """Get a source line without indentation"""
+    return lines[lineno - 1].strip() if 0 < lineno <= len(lines) else ""
+
+
+def summarize_declarations(text: str) -> Optional[str]:
+    """
+    Summarize a source file by its declaration lines
+
+    Keeps the leading file comment unless it is a license header, and every
+    class, function, type or module declaration with the doc comment line
+    right before it.
+
+    Args:
+        text: Source code
+
+    Returns:
+        Optional[str]: Summary, None if no declarations were found
+    """
+    lines = text.splitlines()
+    output: List[str] = []
+
+    header = []
+    for line in lines:
+        if not line.strip():
+            if header:
+                break
+            continue
+        if not _LEADING_COMMENT.match(line):
+            break
+        header.append(line.rstrip())
+    if header and not any(_LICENSE.search(line) for line in header):
+        output.extend(header[:5])
+        output.append("")
+
+    declarations = 0
+    for i, line in enumerate(lines):
+        indent = len(line) - len(line.lstrip())
+        if indent > MAX_DECLARATION_INDENT or not (_DECLARATION.match(line) or _METHOD.match(line)):
+            continue
+        doc = _doc_line(lines, i)
+        if doc:
+            output.append(line[:indent] + doc)
+        # Cut bodies that start on the declaration line
+        brace = line.find("{")
+        output.append((line[:brace + 1] + " ... }" if brace != -1 else line).rstrip())
+        declarations += 1
+
+    if not declarations:
+        return None
+    return "\n".join(output).strip() + "\n"
+
+
+def _doc_line(lines: List[str], index: int) -> str:
+    """Get the first text line of the doc comment right before a declaration"""
+    previous = lines[index - 1].strip() if index else ""
+    if previous.startswith("///") or previous.startswith("//!") or previous.startswith("##"):
+        return previous
+    if previous.startswith("/**"):
+        return previous
+    if not previous.endswith("*/"):
+        return ""
+
+    # Multi-line block comment, take its first line with text
+    start = index - 1
+    while start > 0 and not lines[start].strip().startswith("/*"):
+        start -= 1
+    if not lines[start].strip().startswith("/**"):
+        return ""
+    for line in lines[start:index]:
+        text = line.strip().lstrip("/*").strip()
+        if text:
+            return f"/** {text} */"
+    return ""
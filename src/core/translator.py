@@ -7,25 +7,39 @@ Responsible for generating project content in multiple languages.
 import os
 import json
 import re
+import asyncio
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from ..services.providers import get_provider, TranslationProvider
+from ..services.http_client import run_sync
 from ..utils.config import Config
 from ..utils.file_utils import FileUtils
+from ..utils.ingest import FileRecord, bounded_map
+from ..utils.scan_index import ScanIndex
+from ..utils.tokens import TokenCounter, pack_batches
 from ..models.types import TranslationRequest, TranslationResponse
+from ..utils.json_extractor import extract_json_content
 from ..utils.logger import debug, info, warning, error
+from ..utils.metrics import span
+from .sections import SectionPlan, join_sections, split_sections
+from .ranking import rank_files, select_within_budget
+from .summarizer import summarize
 
 
 class Translator:
     """Generator class, responsible for project content generation"""
     
+    # Token budgets of the README and of each other selected file in project content
+    README_EXCERPT_TOKENS = 750
+    FILE_EXCERPT_TOKENS = 375
+    
     def __init__(self, config: Optional[Config] = None, provider: Optional[str] = None):
         """
         Initialize translator
         
         Args:
             config: Configuration object, if None then use default configuration
-            provider: Provider name ("tencent" or "siliconflow"), if None use config default
+            provider: Provider name ("tencent", "siliconflow", "openai" or a plugin), if None use config default
         """
         self.config = config or Config()
         
@@ -36,6 +50,48 @@ class Translator:
         self.provider: TranslationProvider = get_provider(self.config)
         self.file_utils = FileUtils()
         info(f"Using translation provider: {self.provider.name}")
+    
+    @property
+    def token_counter(self) -> TokenCounter:
+        """
+        Get token counter of the current provider's model
+        
+        Returns:
+            TokenCounter: Token counter, calibrated by the provider's reported usage
+        """
+        return self.provider.token_counter
+    
+    def request_concurrency(self, configured: int) -> int:
+        """
+        Get how many requests to send at once
+        
+        Args:
+            configured: Configured concurrency
+            
+        Returns:
+            int: The configured concurrency, 1 if the provider is not parallel-safe
+        """
+        capabilities = getattr(self.provider, "capabilities", None)
+        if capabilities is not None and not capabilities.parallel_safe:
+            return 1
+        return max(1, configured)
+    
+    def _input_token_budget(self) -> int:
+        """
+        Get the content token budget of one generation request
+        
+        Returns:
+            int: translation.max_input_tokens capped at the model's context window,
+                or the provider's budget if unset
+        """
+        configured = int(self.config.get("translation.max_input_tokens", 0) or 0)
+        if not configured:
+            return self.provider.input_token_budget()
+        capabilities = getattr(self.provider, "capabilities", None)
+        if capabilities is not None and configured > capabilities.max_context:
+            warning(f"translation.max_input_tokens exceeds the {capabilities.max_context} token context of {self.provider.name}, using the context size")
+            return capabilities.max_context
+        return configured
         
     def translate_project(self, project_path: str, languages: Optional[List[str]] = None) -> TranslationResponse:
         """
@@ -49,41 +105,182 @@ class Translator:
             TranslationResponse: Generation response object
         """
         # Read project content
-        project_content = self._read_project_content(project_path)
+        with span("read") as read_span:
+            project_content = self._read_project_content(project_path)
+            read_span.set(bytes_out=len(project_content.encode("utf-8")))
+        
+        with span("translate"):
+            # Check content size, if it does not fit one request then process in batches
+            max_tokens = self._input_token_budget()
+            content_tokens = self.token_counter.count(project_content)
+            if content_tokens > max_tokens:
+                warning(f"⚠ Content too long ({content_tokens} tokens, budget {max_tokens}), will process in batches")
+                return self._translate_project_in_batches(project_content, languages, max_tokens)
+            else:
+                # Build generation request
+                request = self._build_translation_request(project_content, languages)
+                
+                # Execute generation
+                response = self._execute_translation(request)
+                
+                return response
+    
+    async def atranslate_project_content(self, project_content: str, languages: Optional[List[str]] = None) -> TranslationResponse:
+        """
+        Generate README from already read project content asynchronously
         
-        # Check content length, if too long then process in batches
-        max_content_length = 15000  # 15KB limit
+        Args:
+            project_content: Project content as returned by _read_project_content
+            languages: List of languages to generate, if None then use default languages
+            
+        Returns:
+            TranslationResponse: Generation response object
+        """
+        max_tokens = self._input_token_budget()
+        content_tokens = self.token_counter.count(project_content)
+        if content_tokens > max_tokens:
+            warning(f"⚠ Content too long ({content_tokens} tokens, budget {max_tokens}), will process in batches")
+            return await self._atranslate_project_in_batches(project_content, languages, max_tokens)
+        
+        request = self._build_translation_request(project_content, languages)
+        return await self._aexecute_translation(request)
+    
+    def translate_text_only(self, text: str, languages: Optional[List[str]] = None, section_plan: Optional[SectionPlan] = None,
+                            stream_writer_factory: Optional[Callable[[str], Any]] = None) -> TranslationResponse:
+        """
+        Pure text translation function
         
-        if len(project_content) > max_content_length:
-            warning(f"⚠ Content too long ({len(project_content)} characters), will process in batches")
-            return self._translate_project_in_batches(project_content, languages, max_content_length)
-        else:
-            # Build generation request
-            request = self._build_translation_request(project_content, languages)
+        Args:
+            text: Text content to translate
+            languages: Target language list
+            section_plan: Incremental translation plan, if given only changed sections are sent to the provider
+            stream_writer_factory: Callback opening a per-language writer, used by providers that stream full translations to disk
+            
+        Returns:
+            TranslationResponse: Translation response object
+        """
+        # Build pure translation request
+        request = self._build_text_translation_request(text, languages)
+        if stream_writer_factory is not None:
+            request.additional_params["stream_writer_factory"] = stream_writer_factory
+        
+        with span("translate"):
+            if section_plan is not None:
+                return self._translate_sections(request, section_plan)
             
-            # Execute generation
+            # Execute translation
             response = self._execute_translation(request)
             
             return response
     
-    def translate_text_only(self, text: str, languages: Optional[List[str]] = None) -> TranslationResponse:
+    async def atranslate_text_only(self, text: str, languages: Optional[List[str]] = None, section_plan: Optional[SectionPlan] = None,
+                                   stream_writer_factory: Optional[Callable[[str], Any]] = None) -> TranslationResponse:
         """
-        Pure text translation function
+        Pure text translation function, executed asynchronously
+        
+        Several calls may share one section plan as long as their languages do not overlap.
         
         Args:
             text: Text content to translate
             languages: Target language list
+            section_plan: Incremental translation plan, if given only changed sections are sent to the provider
+            stream_writer_factory: Callback opening a per-language writer, used by providers that stream full translations to disk
             
         Returns:
             TranslationResponse: Translation response object
         """
-        # Build pure translation request
         request = self._build_text_translation_request(text, languages)
+        if stream_writer_factory is not None:
+            request.additional_params["stream_writer_factory"] = stream_writer_factory
+        
+        if section_plan is not None:
+            return await self._atranslate_sections(request, section_plan)
+        
+        return await self._aexecute_translation(request)
+    
+    def _translate_sections(self, request: TranslationRequest, section_plan: SectionPlan) -> TranslationResponse:
+        """
+        Translate only the sections that changed since the previous run
+        
+        Args:
+            request: Full text translation request
+            section_plan: Incremental translation plan
+            
+        Returns:
+            TranslationResponse: Translation response with a JSON object of per-language content
+        """
+        return run_sync(self._atranslate_sections(request, section_plan))
+    
+    async def _atranslate_sections(self, request: TranslationRequest, section_plan: SectionPlan) -> TranslationResponse:
+        """
+        Translate only the sections that changed since the previous run, asynchronously
         
-        # Execute translation
-        response = self._execute_translation(request)
+        Languages with unchanged sections get their full document re-assembled right away,
+        languages with changed sections get only those sections translated and are marked
+        as partial in the plan so the generator can re-assemble them.
         
-        return response
+        Args:
+            request: Full text translation request
+            section_plan: Incremental translation plan
+            
+        Returns:
+            TranslationResponse: Translation response with a JSON object of per-language content
+        """
+        section_plan.prepare(request.languages)
+        
+        results: Dict[str, str] = {}
+        raw_responses = []
+        
+        # Build sub-requests: full translation plus one per group of languages sharing the same changes
+        sub_requests = []
+        full_languages = section_plan.full_languages(request.languages)
+        if full_languages:
+            sub_requests.append((request.content, full_languages, False))
+        
+        for changed, group_languages in section_plan.groups(request.languages):
+            if not changed:
+                for lang in group_languages:
+                    results[lang] = section_plan.assemble(lang)
+                info(f"✓ No changes for {', '.join(group_languages)}, reusing existing translations")
+                continue
+            sub_requests.append((section_plan.changed_text(changed), group_languages, True))
+        
+        # Sub-requests are independent, send them together if the provider handles parallel requests
+        semaphore = asyncio.Semaphore(self.request_concurrency(len(sub_requests)))
+        
+        async def run_sub_request(content: str, group_languages: List[str], partial: bool) -> TranslationResponse:
+            sub_request = self._build_text_translation_request(content, group_languages)
+            if not partial and "stream_writer_factory" in request.additional_params:
+                # Only full translations may be streamed into the final files
+                sub_request.additional_params["stream_writer_factory"] = request.additional_params["stream_writer_factory"]
+            async with semaphore:
+                return await self._aexecute_translation(sub_request)
+        
+        responses = await asyncio.gather(*[run_sub_request(*sub_request) for sub_request in sub_requests])
+        
+        for (content, group_languages, partial), response in zip(sub_requests, responses):
+            if not response.success:
+                return TranslationResponse(
+                    success=False,
+                    error=response.error,
+                    languages=request.languages
+                )
+            
+            raw_responses.append(response.raw_response)
+            _, language_content = extract_json_content(response.content)
+            for lang in group_languages:
+                if lang in language_content:
+                    results[lang] = language_content[lang]
+                    if partial:
+                        section_plan.mark_partial(lang)
+        
+        content = json.dumps(results, ensure_ascii=False, indent=2)
+        return TranslationResponse(
+            success=True,
+            content=content,
+            languages=request.languages,
+            raw_response="\n\n".join(raw_responses) or content
+        )
     
     def _read_project_content(self, project_path: str) -> str:
         """
@@ -105,51 +302,100 @@ class Translator:
         else:
             warning(f"⚠ No .gitignore file found, will read all text files")
         
-        # Get project file list (apply .gitignore filtering)
-        project_files = self.file_utils.get_project_files(project_path, include_gitignore=True)
-        
-        # Prioritize reading README.md
-        readme_files = [f for f in project_files if f.name.lower() == "readme.md"]
-        if readme_files:
-            readme_path = readme_files[0]
-            try:
-                readme_content = readme_path.read_text(encoding="utf-8")
-                # Compress README content, keep important parts
-                compressed_readme = self._compress_content(readme_content, max_length=3000)
-                content += "=== README.md ===\n"
-                content += compressed_readme
+        # Stat, sniff, hash and score project files on a worker pool (apply .gitignore filtering);
+        # with the scan index only files whose stat changed since the last run are opened
+        max_workers = self.config.get("ingest.max_workers", 8)
+        index = ScanIndex.open(project_path) if self.config.get("ingest.index", True) else None
+        try:
+            records = self.file_utils.ingest_project_files(project_path, include_gitignore=True, max_workers=max_workers, index=index)
+            
+            # Prioritize reading README.md
+            readme_records = [r for r in records if r.path.name.lower() == "readme.md"]
+            other_records = [r for r in records if r.path.name.lower() != "readme.md"]
+            
+            # Rank files by entry points, imports, public symbols and docstrings and
+            # select the best ones that fit the token budget
+            important_records = self._select_important_files(other_records, project_path, index, max_workers)
+            
+            if not readme_records:
+                warning(f"⚠ README.md not found")
+            if important_records:
+                debug(f"✓ Selected {len(important_records)} important files from {len(other_records)} files")
+            else:
+                warning(f"⚠ No other readable files found")
+            
+            # Compress README (keeping its important parts) and the selected files, reusing indexed excerpts
+            selected = [(record, self.README_EXCERPT_TOKENS) for record in readme_records[:1]]
+            selected += [(record, self.FILE_EXCERPT_TOKENS) for record in important_records]
+            excerpts = [index.get_excerpt(record, max_tokens) if index else None for record, max_tokens in selected]
+            texts = bounded_map(
+                lambda item: self._read_compressed(*item),
+                [(record.path, max_tokens) for (record, max_tokens), excerpt in zip(selected, excerpts) if excerpt is None],
+                max_workers
+            )
+            
+            for (record, max_tokens), compressed in zip(selected, excerpts):
+                relative_path = record.path.relative_to(project_path)
+                if compressed is None:
+                    compressed, read_error = next(texts)
+                    if read_error is not None:
+                        error(f"✗ Failed to read {relative_path}: {read_error}")
+                        continue
+                    if index is not None:
+                        index.set_excerpt(record, max_tokens, compressed)
+                
+                name = "README.md" if record.path.name.lower() == "readme.md" else relative_path
+                content += f"=== {name} ===\n"
+                content += compressed
                 content += "\n\n"
-                debug(f"✓ Read and compressed {readme_path.relative_to(project_path)} ({len(compressed_readme)} characters)")
-            except Exception as e:
-                error(f"✗ Failed to read README.md: {e}")
-        else:
-            warning(f"⚠ README.md not found")
+                debug("✓ Read and compressed %s (%d characters)", relative_path, len(compressed))
+        finally:
+            if index is not None:
+                index.close()
         
-        # Intelligently select the most important files
-        other_files = [f for f in project_files if f.name.lower() != "readme.md"]
-        important_files = self._select_important_files(other_files, max_files=2)
+        return content
+    
+    def _read_compressed(self, file_path: Path, max_tokens: int) -> Tuple[str, Optional[Exception]]:
+        """
+        Read and compress a file, runs on an ingestion worker
         
-        if important_files:
-            debug(f"✓ Selected {len(important_files)} important files from {len(other_files)} files")
+        Source files over the budget are reduced to their signatures and
+        docstrings first, see summarizer.summarize().
+        
+        Args:
+            file_path: File path
+            max_tokens: Maximum tokens after compression
             
-            for file_path in important_files:
-                try:
-                    relative_path = file_path.relative_to(project_path)
-                    file_content = file_path.read_text(encoding="utf-8")
-                    
-                    # Intelligently compress file content
-                    compressed_content = self._compress_content(file_content, max_length=1500)
-                    
-                    content += f"=== {relative_path} ===\n"
-                    content += compressed_content
-                    content += "\n\n"
-                    debug(f"✓ Read and compressed {relative_path} ({len(compressed_content)} characters)")
-                except Exception as e:
-                    error(f"✗ Failed to read {file_path}: {e}")
-        else:
-            warning(f"⚠ No other readable files found")
+        Returns:
+            Tuple[str, Optional[Exception]]: (compressed content, read error)
+        """
+        try:
+            text = file_path.read_text(encoding="utf-8")
+            if self.token_counter.count_raw(text) > max_tokens:
+                # Too long to send whole: send the file's structure rather than its head and tail
+                text = summarize(file_path, text) or text
+            return self._compress_content(text, max_length=self._token_char_limit(text, max_tokens)), None
+        except Exception as e:
+            return "", e
+    
+    def _token_char_limit(self, text: str, max_tokens: int) -> int:
+        """
+        Convert a token budget into a character limit for a text
         
-        return content
+        Uses the uncalibrated count, so excerpts (and the cache keys derived
+        from them) do not depend on usage seen earlier in the process.
+        
+        Args:
+            text: Text to be compressed
+            max_tokens: Token budget
+            
+        Returns:
+            int: Number of characters of this text that cost about max_tokens
+        """
+        tokens = self.token_counter.count_raw(text)
+        if tokens <= max_tokens:
+            return len(text)
+        return max(1, len(text) * max_tokens // tokens)
     
     def _read_readme_file(self, project_path: str) -> str:
         """
@@ -188,65 +434,35 @@ class Translator:
             error(f"Failed to read README file: {e}")
             return ""
     
-    def _select_important_files(self, files: List[Path], max_files: int = 2) -> List[Path]:
+    def _select_important_files(self, files: List[FileRecord], project_path: Path, index: Optional[ScanIndex] = None,
+                                max_workers: int = 8) -> List[FileRecord]:
         """
-        Intelligently select the most important files
+        Select the most informative files whose excerpts fit the selection token budget
         
         Args:
-            files: File list
-            max_files: Maximum number of files
+            files: Ingested file records, README excluded
+            project_path: Project path
+            index: Scan index to reuse ranking features from
+            max_workers: Worker threads for feature extraction
             
         Returns:
-            List[Path]: List of important files
+            List[FileRecord]: Records of the selected files, most important first
         """
-        if not files:
-            return []
-        
-        # Define file importance scoring rules
-        importance_scores = {}
-        
-        for file_path in files:
-            score = 0
-            file_name = file_path.name.lower()
-            relative_path = str(file_path.relative_to(file_path.parents[-2] if len(file_path.parts) > 2 else file_path.parent))
-            
-            # Core files get highest score
-            if any(keyword in file_name for keyword in ['main', 'core', 'translator', 'generator', 'parser']):
-                score += 100
-            
-            # Configuration files get higher score
-            if any(keyword in file_name for keyword in ['config', 'settings', 'setup']):
-                score += 80
-            
-            # Utility files get medium score
-            if any(keyword in file_name for keyword in ['utils', 'helpers', 'tools']):
-                score += 60
-            
-            # Model files get medium score
-            if any(keyword in file_name for keyword in ['models', 'types', 'schema']):
-                score += 50
-            
-            # Service files get medium score
-            if any(keyword in file_name for keyword in ['services', 'api', 'client']):
-                score += 40
-            
-            # CLI files get lower score
-            if any(keyword in file_name for keyword in ['cli', 'commands']):
-                score += 30
-            
-            # Test files get lowest score
-            if any(keyword in file_name for keyword in ['test', 'spec']):
-                score += 10
-            
-            # Path depth affects score (shallower is better)
-            depth_penalty = len(file_path.parts) * 5
-            score -= depth_penalty
-            
-            importance_scores[file_path] = score
+        ranked = rank_files(files, project_path, index=index, counter=self.token_counter, max_workers=max_workers)
+        selected = select_within_budget(ranked, self._selection_token_budget(), self.FILE_EXCERPT_TOKENS)
+        for item in selected:
+            debug(f"  {item.record.path.name}: score {item.score:.0f} (entry point: {item.entry_point}, imported by {item.importers})")
+        return [item.record for item in selected]
+    
+    def _selection_token_budget(self) -> int:
+        """
+        Get the token budget of the selected files' excerpts
         
-        # Sort by score and return top N files
-        sorted_files = sorted(files, key=lambda f: importance_scores[f], reverse=True)
-        return sorted_files[:max_files]
+        Returns:
+            int: translation.selection_tokens, reduced so README and files fit one request
+        """
+        budget = int(self.config.get("translation.selection_tokens", 3000))
+        return max(self.FILE_EXCERPT_TOKENS, min(budget, self._input_token_budget() - self.README_EXCERPT_TOKENS))
     
     def _compress_content(self, content: str, max_length: int = 2000) -> str:
         """
@@ -303,14 +519,28 @@ class Translator:
         
         return content
     
-    def _translate_project_in_batches(self, project_content: str, languages: Optional[List[str]] = None, max_length: int = 30000) -> TranslationResponse:
+    def _translate_project_in_batches(self, project_content: str, languages: Optional[List[str]] = None, max_tokens: int = 8000) -> TranslationResponse:
         """
         Generate project content in batches
         
         Args:
             project_content: Project content
             languages: Target language list
-            max_length: Maximum length per batch
+            max_tokens: Maximum tokens per batch
+            
+        Returns:
+            TranslationResponse: Generation response object
+        """
+        return run_sync(self._atranslate_project_in_batches(project_content, languages, max_tokens))
+    
+    async def _atranslate_project_in_batches(self, project_content: str, languages: Optional[List[str]] = None, max_tokens: int = 8000) -> TranslationResponse:
+        """
+        Generate project content in batches asynchronously
+        
+        Args:
+            project_content: Project content
+            languages: Target language list
+            max_tokens: Maximum tokens per batch
             
         Returns:
             TranslationResponse: Generation response object
@@ -330,37 +560,66 @@ class Translator:
         debug(f"📦 Content split into {len(content_parts)} parts")
         
         # Merge small parts, ensure each batch doesn't exceed limit
-        batches = self._create_batches(content_parts, max_length)
+        batches = self._create_batches(content_parts, max_tokens)
         
         debug(f"📦 Will process in {len(batches)} batches")
         
-        all_responses = []
+        batch_requests = [
+            self._build_batch_translation_request(batch_content, languages, i, len(batches))
+            for i, batch_content in enumerate(batches, 1)
+        ]
+        batch_responses = await self._run_batches(batch_requests)
         
-        for i, batch_content in enumerate(batches, 1):
-            debug(f"📦 Processing batch {i}/{len(batches)} (length: {len(batch_content)} characters)")
-            
-            # Build batch request
-            batch_request = self._build_batch_translation_request(batch_content, languages, i, len(batches))
-            
-            # Execute generation
-            batch_response = self._execute_translation(batch_request)
-            
-            if not batch_response.success:
-                error(f"❌ Batch {i} generation failed: {batch_response.error}")
-                return batch_response
-            
-            all_responses.append(batch_response.content)
+        all_responses = [response.content for response in batch_responses if response.success]
+        failed = [i for i, response in enumerate(batch_responses, 1) if not response.success]
+        
+        if not all_responses:
+            error(f"❌ All {len(batches)} batches failed")
+            return batch_responses[0]
+        if failed:
+            warning(f"⚠ Batches {', '.join(map(str, failed))} of {len(batches)} failed, merging the remaining ones")
         
         # Merge all responses
-        combined_response = self._combine_batch_responses(all_responses, languages)
+        combined_response = self._combine_batch_responses(all_responses, batch_requests[0].languages)
         
         return TranslationResponse(
             success=True,
             content=combined_response,
-            languages=languages or [],
+            languages=batch_requests[0].languages,
             raw_response="\n\n".join(all_responses)
         )
     
+    async def _run_batches(self, batch_requests: List[TranslationRequest]) -> List[TranslationResponse]:
+        """
+        Execute batch requests concurrently, retrying failed batches
+        
+        Args:
+            batch_requests: Batch generation requests in order
+            
+        Returns:
+            List[TranslationResponse]: Batch responses in the same order
+        """
+        concurrency = self.request_concurrency(int(self.config.get("translation.batch_concurrency", 3)))
+        retries = max(0, int(self.config.get("translation.batch_retries", 2)))
+        semaphore = asyncio.Semaphore(concurrency)
+        total = len(batch_requests)
+        
+        async def run_batch(batch_num: int, batch_request: TranslationRequest) -> TranslationResponse:
+            async with semaphore:
+                for attempt in range(retries + 1):
+                    debug("📦 Processing batch %d/%d (length: %d characters)", batch_num, total, len(batch_request.content))
+                    response = await self._aexecute_translation(batch_request)
+                    if response.success:
+                        return response
+                    if attempt < retries:
+                        delay = 2 ** attempt
+                        warning(f"⚠ Batch {batch_num} failed: {response.error}, retrying in {delay}s")
+                        await asyncio.sleep(delay)
+                error(f"❌ Batch {batch_num} generation failed: {response.error}")
+                return response
+        
+        return await asyncio.gather(*[run_batch(i, request) for i, request in enumerate(batch_requests, 1)])
+    
     def _split_content_by_files(self, content: str) -> List[str]:
         """
         Split content by files
@@ -372,56 +631,36 @@ class Translator:
             List[str]: Split content parts
         """
         parts = []
-        current_part = ""
+        current_lines: List[str] = []
         
-        lines = content.split('\n')
-        
-        for line in lines:
-            # Check if it's a file separator
-            if line.startswith('===') and line.endswith('==='):
-                # Save current part
-                if current_part.strip():
-                    parts.append(current_part.strip())
-                current_part = line + '\n'
-            else:
-                current_part += line + '\n'
+        for line in content.split('\n'):
+            # A file separator starts a new part
+            if line.startswith('===') and line.endswith('===') and current_lines:
+                part = '\n'.join(current_lines).strip()
+                if part:
+                    parts.append(part)
+                current_lines = []
+            current_lines.append(line)
         
         # Add last part
-        if current_part.strip():
-            parts.append(current_part.strip())
+        part = '\n'.join(current_lines).strip()
+        if part:
+            parts.append(part)
         
         return parts
     
-    def _create_batches(self, content_parts: List[str], max_length: int) -> List[str]:
+    def _create_batches(self, content_parts: List[str], max_tokens: int) -> List[str]:
         """
-        Create batches, ensure each batch doesn't exceed length limit
+        Create batches, ensure each batch doesn't exceed the token budget
         
         Args:
             content_parts: Content parts list
-            max_length: Maximum length per batch
+            max_tokens: Maximum tokens per batch
             
         Returns:
             List[str]: Batch list
         """
-        batches = []
-        current_batch = ""
-        
-        for part in content_parts:
-            # If current batch plus new part would exceed limit, and current batch is not empty, start new batch
-            if current_batch and len(current_batch + part) > max_length:
-                batches.append(current_batch.strip())
-                current_batch = part
-            else:
-                if current_batch:
-                    current_batch += "\n\n" + part
-                else:
-                    current_batch = part
-        
-        # Add last batch
-        if current_batch.strip():
-            batches.append(current_batch.strip())
-        
-        return batches
+        return pack_batches(content_parts, max_tokens, self.token_counter)
     
     def _build_batch_translation_request(self, content: str, languages: Optional[List[str]] = None, batch_num: int = 1, total_batches: int = 1) -> TranslationRequest:
         """
@@ -502,12 +741,33 @@ Please strictly follow the following format to generate complete README document
         if len(responses) == 1:
             return responses[0]
         
-        # Simple merge, keep the last complete response
-        # More complex merge logic can be implemented here as needed
         print(f"📦 Merging {len(responses)} batch responses")
         
-        # Return the last response, as it's usually the most complete
-        return responses[-1]
+        # Every batch describes part of the project, so merge per language section by section.
+        # Sections are keyed by their heading line, a repeated section keeps its longest version.
+        merged: Dict[str, List[str]] = {}
+        positions: Dict[str, Dict[str, int]] = {}
+        for response in responses:
+            _, language_content = extract_json_content(response)
+            for lang, content in language_content.items():
+                sections = merged.setdefault(lang, [])
+                index = positions.setdefault(lang, {})
+                for section in split_sections(content):
+                    key = section.split('\n', 1)[0].strip().lower()
+                    if key not in index:
+                        index[key] = len(sections)
+                        sections.append(section)
+                    elif len(section) > len(sections[index[key]]):
+                        sections[index[key]] = section
+        
+        if not merged:
+            # Responses are not in the JSON format, keep the most complete one
+            warning("⚠ Batch responses could not be merged per language, keeping the longest one")
+            return max(responses, key=len)
+        
+        ordered = [lang for lang in (languages or []) if lang in merged]
+        ordered += [lang for lang in merged if lang not in ordered]
+        return json.dumps({lang: join_sections(merged[lang]) for lang in ordered}, ensure_ascii=False, indent=2)
     
     def _build_translation_request(self, content: str, languages: Optional[List[str]] = None) -> TranslationRequest:
         """
@@ -574,6 +834,52 @@ Format:
             additional_params={"workflow_variables": workflow_variables}
         )
     
+    def _provider_kwargs(self, request: TranslationRequest) -> Dict[str, Any]:
+        """Build provider keyword arguments from a request"""
+        params = request.additional_params or {}
+        capabilities = getattr(self.provider, "capabilities", None)
+        # Only providers that stream whole translations may write the README files themselves
+        streaming = capabilities is not None and capabilities.streaming
+        return {
+            "mode": params.get("mode", "gen"),
+            "workflow_variables": params.get("workflow_variables"),
+            "stream_writer_factory": params.get("stream_writer_factory") if streaming else None
+        }
+    
+    async def _aexecute_translation(self, request: TranslationRequest) -> TranslationResponse:
+        """
+        Execute generation asynchronously
+        
+        Args:
+            request: Generation request object
+            
+        Returns:
+            TranslationResponse: Generation response object
+        """
+        print(f"Sending generation request via {self.provider.name}...")
+        
+        try:
+            response_text = await self.provider.atranslate(
+                content=request.content,
+                languages=request.languages,
+                **self._provider_kwargs(request)
+            )
+            
+            return TranslationResponse(
+                success=True,
+                content=response_text,
+                languages=request.languages,
+                raw_response=response_text
+            )
+            
+        except Exception as e:
+            print(f"❌ Generation failed: {e}")
+            return TranslationResponse(
+                success=False,
+                error=str(e),
+                languages=request.languages
+            )
+    
     def _execute_translation(self, request: TranslationRequest) -> TranslationResponse:
         """
         Execute generation
@@ -591,8 +897,7 @@ Format:
             response_text = self.provider.translate(
                 content=request.content,
                 languages=request.languages,
-                mode=request.additional_params.get("mode", "gen") if request.additional_params else "gen",
-                workflow_variables=request.additional_params.get("workflow_variables") if request.additional_params else None
+                **self._provider_kwargs(request)
             )
             
             return TranslationResponse(
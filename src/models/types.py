@@ -88,4 +88,27 @@ class ProjectInfo:
     
     def __post_init__(self):
         if self.files is None:
-            self.files = [] 
\ No newline at end of file
+            self.files = [] 
+
+
+@dataclass
+class BatchRepository:
+    """Repository entry of a batch manifest"""
+    path: str
+    languages: Optional[List[str]] = None
+    mode: str = "trans"
+
+
+@dataclass
+class BatchRepositoryResult:
+    """Batch result of one repository"""
+    path: str
+    mode: str
+    languages: List[str]
+    generation: Optional[GenerationResult] = None
+    errors: Dict[str, str] = None
+    error: str = ""
+    
+    def __post_init__(self):
+        if self.errors is None:
+            self.errors = {}
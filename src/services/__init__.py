@@ -4,7 +4,16 @@ External service integration module
 Contains integrations with external services (such as Tencent Cloud, SSE, etc.).
 """
 
-from .tencent_cloud import TencentCloudService
-from .sse_client import SSEClient
+from typing import TYPE_CHECKING
+from ..utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .tencent_cloud import TencentCloudService
+    from .sse_client import SSEClient
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "TencentCloudService": ".tencent_cloud",
+    "SSEClient": ".sse_client",
+})
 
 __all__ = ["TencentCloudService", "SSEClient"] 
\ No newline at end of file
@@ -0,0 +1,139 @@
+"""
+Shared HTTP client module
+
+Provides a process-wide pooled HTTP session and the executor that runs
+blocking provider requests from async code.
+"""
+
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from ..utils.logger import debug
+
+
+T = TypeVar("T")
+
+DEFAULT_MAX_CONNECTIONS = 32
+DEFAULT_MAX_CONCURRENCY = 16
+
+_lock = threading.Lock()
+_session: Optional[requests.Session] = None
+_executor: Optional[ThreadPoolExecutor] = None
+_max_connections = DEFAULT_MAX_CONNECTIONS
+_max_concurrency = DEFAULT_MAX_CONCURRENCY
+
+
+def configure(config: Any):
+    """
+    Apply pool limits from configuration
+
+    Only takes effect before the shared session and executor are first used.
+
+    Args:
+        config: Configuration object
+    """
+    global _max_connections, _max_concurrency
+    with _lock:
+        _max_connections = max(1, int(config.get("http.max_connections", DEFAULT_MAX_CONNECTIONS)))
+        _max_concurrency = max(1, int(config.get("http.max_concurrency", DEFAULT_MAX_CONCURRENCY)))
+
+
+def get_session() -> requests.Session:
+    """
+    Get the shared HTTP session
+
+    Connections are kept alive and reused across providers, languages and batches.
+
+    Returns:
+        requests.Session: Pooled session
+    """
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=_max_connections)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+                debug(f"HTTP session created with pool size {_max_connections}")
+    return _session
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """
+    Get the shared executor for blocking requests
+
+    Its worker count is the global limit on in-flight provider requests.
+
+    Returns:
+        ThreadPoolExecutor: Shared executor
+    """
+    global _executor
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=_max_concurrency, thread_name_prefix="duoreadme-http")
+                debug(f"HTTP executor created with {_max_concurrency} workers")
+    return _executor
+
+
+async def run_blocking(func: Callable[..., T], *args, **kwargs) -> T:
+    """
+    Run a blocking call on the shared executor
+
+    The call runs in a copy of the caller's context, so context variables
+    such as the open metrics span carry over to the worker thread.
+
+    Args:
+        func: Blocking function, e.g. a function sending a request
+        *args: Positional arguments
+        **kwargs: Keyword arguments
+
+    Returns:
+        T: Return value of the function
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(get_executor(), functools.partial(context.run, func, *args, **kwargs))
+
+
+def run_sync(coroutine: Awaitable[T]) -> T:
+    """
+    Run a coroutine to completion from synchronous code
+
+    If the calling thread already runs an event loop, the coroutine is run on
+    a fresh loop in a helper thread instead.
+
+    Args:
+        coroutine: Coroutine to run
+
+    Returns:
+        T: Result of the coroutine
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+
+    result = {}
+
+    def runner():
+        try:
+            result["value"] = asyncio.run(coroutine)
+        except BaseException as e:
+            result["error"] = e
+
+    thread = threading.Thread(target=runner, name="duoreadme-async")
+    thread.start()
+    thread.join()
+    if "error" in result:
+        raise result["error"]
+    return result["value"]
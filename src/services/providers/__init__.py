@@ -2,39 +2,133 @@
 Translation providers module
 
 Provides different translation service providers.
+
+Providers are looked up by name: built-in ones in PROVIDERS, third-party
+ones through entry points in the "duoreadme.providers" group, e.g. in a
+plugin's pyproject.toml:
+
+    [project.entry-points."duoreadme.providers"]
+    myprovider = "my_package.provider:MyProvider"
+
+Only the selected provider's module is imported.
 """
 
-from typing import TYPE_CHECKING
+import importlib
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Type
+
+from .. import http_client
+from ...utils.lazy import lazy_exports
+from .base import ProviderCapabilities, TranslationProvider
 
 if TYPE_CHECKING:
     from ...utils.config import Config
+    from .tencent_provider import TencentProvider
+    from .siliconflow_provider import SiliconFlowProvider
+    from .openai_provider import OpenAICompatibleProvider
+
+
+# Built-in provider name to (module, class), a provider's module is imported when it is first used
+PROVIDERS: Dict[str, Tuple[str, str]] = {
+    "tencent": (".tencent_provider", "TencentProvider"),
+    "siliconflow": (".siliconflow_provider", "SiliconFlowProvider"),
+    "openai": (".openai_provider", "OpenAICompatibleProvider"),
+}
+
+DEFAULT_PROVIDER = "tencent"
+
+# Entry point group of provider plugins
+ENTRY_POINT_GROUP = "duoreadme.providers"
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    class_name: module for module, class_name in PROVIDERS.values()
+})
 
-from .base import TranslationProvider
-from .tencent_provider import TencentProvider
-from .siliconflow_provider import SiliconFlowProvider
+
+@lru_cache(maxsize=None)
+def _entry_points() -> Dict[str, Any]:
+    """Get provider entry points of installed distributions by name"""
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:
+        return {}
+
+    found = entry_points()
+    if hasattr(found, "select"):
+        selected = found.select(group=ENTRY_POINT_GROUP)
+    else:
+        # Python < 3.10 returns a dict of groups
+        selected = found.get(ENTRY_POINT_GROUP, [])
+    return {entry_point.name: entry_point for entry_point in selected}
+
+
+def available_providers() -> List[str]:
+    """
+    List names of built-in and installed providers
+
+    Returns:
+        List[str]: Provider names, built-in ones first
+    """
+    return list(PROVIDERS) + sorted(name for name in _entry_points() if name not in PROVIDERS)
+
+
+def get_provider_class(name: str) -> Type[TranslationProvider]:
+    """
+    Import and get the class of a provider
+
+    Built-in providers take precedence over plugins of the same name.
+
+    Args:
+        name: Provider name
+
+    Returns:
+        Type[TranslationProvider]: Provider class
+
+    Raises:
+        ValueError: No provider of that name is installed
+        TypeError: The entry point is not a TranslationProvider subclass
+    """
+    if name in PROVIDERS:
+        module, class_name = PROVIDERS[name]
+        return getattr(importlib.import_module(module, __name__), class_name)
+
+    entry_point = _entry_points().get(name)
+    if entry_point is None:
+        raise ValueError(f"Unknown translation provider '{name}', available: {', '.join(available_providers())}")
+
+    provider_class = entry_point.load()
+    if not (isinstance(provider_class, type) and issubclass(provider_class, TranslationProvider)):
+        raise TypeError(f"Provider '{name}' ({entry_point.value}) is not a TranslationProvider subclass")
+    return provider_class
 
 
 def get_provider(config: "Config") -> TranslationProvider:
     """
     Get translation provider based on configuration
-    
+
     Args:
         config: Configuration object
-        
+
     Returns:
         TranslationProvider: Translation provider instance
+
+    Raises:
+        ValueError: The configured provider is not installed
     """
-    provider_name = config.get("provider", "tencent")
-    
-    if provider_name == "siliconflow":
-        return SiliconFlowProvider(config)
-    else:
-        return TencentProvider(config)
+    provider_name = config.get("provider") or DEFAULT_PROVIDER
+    http_client.configure(config)
+
+    return get_provider_class(provider_name)(config)
 
 
 __all__ = [
     "TranslationProvider",
-    "TencentProvider", 
+    "ProviderCapabilities",
+    "TencentProvider",
     "SiliconFlowProvider",
-    "get_provider"
+    "OpenAICompatibleProvider",
+    "PROVIDERS",
+    "available_providers",
+    "get_provider",
+    "get_provider_class"
 ]
@@ -5,12 +5,47 @@ Provides abstract base class for translation providers.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Type
+
+from ..http_client import run_sync
+from ...utils.cache import TranslationCache
+from ...utils.sanitizer import OutputSanitizer
+from ...utils.tokens import TokenCounter, get_token_counter
+
+
+@dataclass(frozen=True)
+class ProviderCapabilities:
+    """What a provider supports, used by the translator to pick a strategy"""
+    
+    # Context window of the model in tokens
+    max_context: int
+    # Concurrent requests to the provider are safe and worthwhile
+    parallel_safe: bool
+    # Output can be streamed into the README files as it arrives
+    streaming: bool
 
 
 class TranslationProvider(ABC):
     """Abstract base class for translation providers"""
     
+    # Bump whenever prompt templates change so stale cached translations are not reused
+    PROMPT_VERSION = "1"
+    
+    # Cleaner for raw model output, None for providers returning structured results
+    sanitizer_class: Optional[Type[OutputSanitizer]] = None
+    
+    # Model context window and response budget in tokens, see input_token_budget()
+    context_window = 8192
+    max_output_tokens = 4096
+    # Tokens kept free for the prompt template around the content
+    PROMPT_RESERVE_TOKENS = 512
+    
+    # Capabilities, see ProviderCapabilities; providers that must not get
+    # concurrent requests set parallel_safe to False
+    parallel_safe = True
+    supports_streaming = False
+    
     @property
     @abstractmethod
     def name(self) -> str:
@@ -23,9 +58,9 @@ class TranslationProvider(ABC):
         pass
     
     @abstractmethod
-    def translate(self, content: str, languages: List[str], **kwargs) -> str:
+    async def atranslate(self, content: str, languages: List[str], **kwargs) -> str:
         """
-        Execute translation
+        Execute translation asynchronously
         
         Args:
             content: Content to translate
@@ -37,6 +72,20 @@ class TranslationProvider(ABC):
         """
         pass
     
+    def translate(self, content: str, languages: List[str], **kwargs) -> str:
+        """
+        Execute translation, blocking until it completes
+        
+        Args:
+            content: Content to translate
+            languages: Target language list
+            **kwargs: Additional parameters
+            
+        Returns:
+            str: Translated content
+        """
+        return run_sync(self.atranslate(content, languages, **kwargs))
+    
     @abstractmethod
     def validate_credentials(self) -> bool:
         """
@@ -47,6 +96,112 @@ class TranslationProvider(ABC):
         """
         pass
     
+    def create_sanitizer(self) -> Optional[OutputSanitizer]:
+        """
+        Create an output sanitizer for one response
+        
+        Returns:
+            Optional[OutputSanitizer]: Fresh sanitizer, None if the provider does not clean output
+        """
+        return self.sanitizer_class() if self.sanitizer_class is not None else None
+    
+    def get_model_id(self) -> str:
+        """
+        Get identifier of the model behind this provider
+        
+        Returns:
+            str: Model identifier, used as part of cache keys
+        """
+        return getattr(self, "model", "") or ""
+    
+    @property
+    def token_counter(self) -> TokenCounter:
+        """
+        Get token counter of the model, shared with the translator's budgeting
+        
+        Returns:
+            TokenCounter: Token counter selected by translation.tokenizer
+        """
+        config = getattr(self, "config", None)
+        tokenizer = config.get("translation.tokenizer", "approx") if config is not None else "approx"
+        return get_token_counter(f"{self.name}:{self.get_model_id()}", tokenizer)
+    
+    @property
+    def capabilities(self) -> ProviderCapabilities:
+        """
+        Get what this provider supports
+        
+        Returns:
+            ProviderCapabilities: Capabilities of the provider and its model
+        """
+        return ProviderCapabilities(
+            max_context=self.context_window,
+            parallel_safe=self.parallel_safe,
+            streaming=self.supports_streaming
+        )
+    
+    def input_token_budget(self) -> int:
+        """
+        Get how many content tokens fit into one request
+        
+        Returns:
+            int: Context window minus the response budget and the prompt reserve
+        """
+        return max(self.PROMPT_RESERVE_TOKENS, self.context_window - self.max_output_tokens - self.PROMPT_RESERVE_TOKENS)
+    
+    @property
+    def cache(self) -> Optional[TranslationCache]:
+        """
+        Get translation cache, created lazily from configuration
+        
+        Returns:
+            Optional[TranslationCache]: Cache instance, None if caching is disabled
+        """
+        if "_cache" not in self.__dict__:
+            config = getattr(self, "config", None)
+            self._cache = TranslationCache.from_config(config) if config is not None else None
+        return self._cache
+    
+    def _cache_key(self, content: str, language: str, mode: str) -> str:
+        """Build cache key for a translation of this provider"""
+        return TranslationCache.make_key(
+            self.name, self.get_model_id(), mode, language, self.PROMPT_VERSION, content
+        )
+    
+    def get_cached_translation(self, content: str, language: str, mode: str) -> Optional[str]:
+        """
+        Look up a previous translation before sending any request
+        
+        Args:
+            content: Content to translate
+            language: Target language code (or comma-joined language codes)
+            mode: Translation mode ("gen" or "trans")
+            
+        Returns:
+            Optional[str]: Cached translation, None on miss or if caching is disabled
+        """
+        if self.cache is None:
+            return None
+        return self.cache.get(self._cache_key(content, language, mode))
+    
+    def store_cached_translation(self, content: str, language: str, mode: str, translated: str):
+        """
+        Store a successful translation in the cache
+        
+        Args:
+            content: Content that was translated
+            language: Target language code (or comma-joined language codes)
+            mode: Translation mode ("gen" or "trans")
+            translated: Translated content
+        """
+        if self.cache is None or not translated:
+            return
+        self.cache.set(
+            self._cache_key(content, language, mode),
+            translated,
+            metadata={"provider": self.name, "mode": mode, "language": language}
+        )
+    
     def get_language_name(self, lang_code: str) -> str:
         """
         Get language name corresponding to language code
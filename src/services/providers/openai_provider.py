@@ -0,0 +1,69 @@
+"""
+OpenAI-compatible translation provider module
+
+Provides translation through any OpenAI-compatible chat-completions
+endpoint, such as a self-hosted vLLM or TGI server.
+"""
+
+from typing import List
+
+from .siliconflow_provider import SiliconFlowProvider
+from ...utils.config import Config
+from ...utils.logger import error
+
+
+class OpenAICompatibleProvider(SiliconFlowProvider):
+    """Translation provider for OpenAI-compatible endpoints, one parallel request per language"""
+
+    API_URL = "https://api.openai.com/v1/chat/completions"
+    DEFAULT_MODEL = "gpt-4o-mini"
+    CONFIG_SECTION = "openai"
+    DISPLAY_NAME = "OpenAI-compatible"
+    CREDENTIALS_ERROR = "OpenAI-compatible endpoint not configured, set openai.base_url or openai.api_key"
+
+    # Unknown models get the context window from openai.context_window or this default
+    CONTEXT_WINDOWS = {}
+
+    def __init__(self, config: Config):
+        """
+        Initialize OpenAI-compatible provider
+
+        Args:
+            config: Configuration object
+        """
+        super().__init__(config)
+        # Sampling parameters outside the OpenAI API are only sent when configured
+        self.top_k = config.get("openai.top_k")
+        self.frequency_penalty = config.get("openai.frequency_penalty", 0.0)
+
+    def _get_api_url(self) -> str:
+        """Get the chat-completions endpoint below openai.base_url"""
+        base_url = (self.config.get("openai.base_url", "") or "").rstrip("/")
+        if not base_url:
+            return self.API_URL
+        if base_url.endswith("/chat/completions"):
+            return base_url
+        return f"{base_url}/chat/completions"
+
+    def validate_credentials(self) -> bool:
+        """
+        Validate that an endpoint is usable
+
+        Self-hosted endpoints often need no API key, the public OpenAI API does.
+
+        Returns:
+            bool: Whether credentials are valid
+        """
+        if not self.api_key and self.api_url == self.API_URL:
+            error(self.CREDENTIALS_ERROR)
+            return False
+        return True
+
+    def list_available_models(self) -> List[str]:
+        """
+        List the configured model
+
+        Returns:
+            List[str]: Model names, the endpoint decides what is served
+        """
+        return [self.model]
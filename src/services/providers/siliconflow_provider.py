@@ -5,19 +5,43 @@ Provides SiliconFlow API based translation service with async parallel requests.
 """
 
 import json
+import time
+import asyncio
 import requests
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Dict, Any, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from .base import TranslationProvider
+from ..http_client import get_session, run_blocking
+from ..rate_limiter import RETRYABLE_STATUS_CODES, get_rate_limiter, parse_retry_after
 from ...utils.config import Config
 from ...utils.logger import debug, info, warning, error
+from ...utils.metrics import current_span, span
+from ...utils.sanitizer import OutputSanitizer
 
 
 class SiliconFlowProvider(TranslationProvider):
     """SiliconFlow API translation provider with async parallel requests"""
     
     API_URL = "https://api.siliconflow.cn/v1/chat/completions"
+    DEFAULT_MODEL = "deepseek-ai/DeepSeek-R1-0528-Qwen3-8B"
+    # Configuration section, also the provider name and rate limiter key
+    CONFIG_SECTION = "siliconflow"
+    DISPLAY_NAME = "SiliconFlow"
+    CREDENTIALS_ERROR = "SiliconFlow API key not configured"
+    sanitizer_class = OutputSanitizer
+    
+    # One request per language, streamed when enabled
+    supports_streaming = True
+    
+    # Context windows of common models in tokens, others default to 32K
+    CONTEXT_WINDOWS = {
+        "deepseek-ai/DeepSeek-R1-0528-Qwen3-8B": 131072,
+        "deepseek-ai/DeepSeek-V2.5": 32768,
+        "Qwen/Qwen2.5-7B-Instruct": 32768,
+        "Qwen/Qwen2.5-72B-Instruct": 32768,
+        "meta-llama/Meta-Llama-3.1-8B-Instruct": 32768,
+        "meta-llama/Meta-Llama-3.1-70B-Instruct": 32768,
+    }
     
     def __init__(self, config: Config):
         """
@@ -27,20 +51,31 @@ class SiliconFlowProvider(TranslationProvider):
             config: Configuration object
         """
         self.config = config
-        self.api_key = config.get("siliconflow.api_key", "")
-        self.model = config.get("siliconflow.model", "deepseek-ai/DeepSeek-R1-0528-Qwen3-8B")
-        self.timeout = config.get("siliconflow.timeout", 120)
-        self.max_tokens = config.get("siliconflow.max_tokens", 4096)
-        self.temperature = config.get("siliconflow.temperature", 0.1)
-        self.top_p = config.get("siliconflow.top_p", 0.7)
-        self.top_k = config.get("siliconflow.top_k", 50)
-        self.frequency_penalty = config.get("siliconflow.frequency_penalty", 1.0)
-        self.max_workers = config.get("siliconflow.max_workers", 3)
-        debug(f"SiliconFlow provider initialized with model: {self.model}")
+        section = self.CONFIG_SECTION
+        self.api_key = config.get(f"{section}.api_key", "")
+        self.api_url = self._get_api_url()
+        self.model = config.get(f"{section}.model", self.DEFAULT_MODEL)
+        self.timeout = config.get(f"{section}.timeout", 120)
+        self.max_tokens = config.get(f"{section}.max_tokens", 4096)
+        self.max_output_tokens = self.max_tokens
+        self.context_window = config.get(f"{section}.context_window", 0) or self.CONTEXT_WINDOWS.get(self.model, 32768)
+        self.temperature = config.get(f"{section}.temperature", 0.1)
+        self.top_p = config.get(f"{section}.top_p", 0.7)
+        self.top_k = config.get(f"{section}.top_k", 50)
+        self.frequency_penalty = config.get(f"{section}.frequency_penalty", 1.0)
+        self.max_workers = config.get(f"{section}.max_workers", 3)
+        self.stream = config.get(f"{section}.stream", False)
+        self.repetition_abort_window = config.get(f"{section}.repetition_abort_window", 600)
+        self.rate_limiter = get_rate_limiter(config, section, self.max_workers)
+        debug(f"{self.DISPLAY_NAME} provider initialized with model: {self.model}")
     
     @property
     def name(self) -> str:
-        return "siliconflow"
+        return self.CONFIG_SECTION
+    
+    def _get_api_url(self) -> str:
+        """Get the chat-completions endpoint, api_url of the config section overrides the default"""
+        return self.config.get(f"{self.CONFIG_SECTION}.api_url", "") or self.API_URL
     
     def _build_single_language_prompt(self, content: str, language: str, mode: str = "gen") -> str:
         """
@@ -90,81 +125,187 @@ STRICT RULES:
         """
         Clean up unwanted patterns from translation output
         """
-        import re
-        
-        # Remove prompt contamination patterns at the beginning
-        content = re.sub(r'^Please translate.*?(?:format|日本語)[:\s]*\n*', '', content, flags=re.IGNORECASE | re.DOTALL)
-        content = re.sub(r'^Original text:\s*', '', content, flags=re.IGNORECASE)
-        content = re.sub(r'^Translate.*?:\s*\n*', '', content, flags=re.IGNORECASE)
-        
-        lines = content.split('\n')
-        cleaned_lines = []
-        skip_until_content = True
+        return self.sanitizer_class.sanitize(content)
+    
+    def _is_degenerate(self, tail: str) -> bool:
+        """
+        Check whether streamed output ends in a repetition loop
         
-        for line in lines:
-            # Skip language headers at the beginning
-            if skip_until_content:
-                if re.match(r'^#{1,3}\s*(中文|English|日本語|简体中文|繁體中文|Japanese|Chinese)', line, re.IGNORECASE):
-                    continue
-                if line.strip() == '':
-                    continue
-                if line.strip() in ('```markdown', '```'):
-                    continue
-                skip_until_content = False
+        Args:
+            tail: Last characters of the output, at least the abort window long
             
-            # Clean repetition patterns within a line (e.g., "debug debug debug debug")
-            cleaned_line = self._remove_repetitions(line)
-            cleaned_lines.append(cleaned_line)
-        
-        result = '\n'.join(cleaned_lines)
-        
-        # Remove trailing ```
-        result = re.sub(r'\n```\s*$', '', result)
-        
-        # Remove (Note: ...) patterns
-        result = re.sub(r'\s*\(Note:.*?\)', '', result)
-        
-        # Remove repeated "Requirements:" blocks at the end
-        result = re.sub(r'(Requirements:.*?structure\.)\s*\1+', r'\1', result, flags=re.DOTALL)
-        
-        # Remove CRITICAL RULES prompt contamination at the end
-        result = re.sub(r'\n*CRITICAL RULES.*$', '', result, flags=re.DOTALL | re.IGNORECASE)
-        
-        # Remove any trailing prompt-like instructions
-        result = re.sub(r'\n*(?:Do NOT|ONLY|Keep exact|Start directly).*$', '', result, flags=re.DOTALL)
+        Returns:
+            bool: Whether the whole window repeats a short unit
+        """
+        window = self.repetition_abort_window
+        if window <= 0 or len(tail) < window:
+            return False
         
-        return result.strip()
+        tail = tail[-window:]
+        for period in range(1, min(64, window // 4) + 1):
+            # A string has period p exactly when it equals itself shifted by p
+            if tail[period:] == tail[:-period]:
+                return True
+        return False
     
-    def _remove_repetitions(self, line: str) -> str:
-        """Remove word/phrase repetitions within a line"""
-        import re
-        
-        # Match patterns like "word word word word" (3+ repetitions)
-        result = re.sub(r'\b(\w+(?:\s+\w+)?)\s+(?:\1\s*){2,}', r'\1', line)
+    def _stream_translation(self, response: Any, language: str, writer: Optional[Any]) -> Tuple[str, Dict[str, Any]]:
+        """
+        Consume a chat-completions SSE stream
         
-        # Match patterns like "[-o file.yaml] [-o file.yaml] [-o file.yaml]"
-        result = re.sub(r'(\[.*?\])\s*(?:\1\s*){1,}', r'\1', result)
+        Output is cleaned line by line as it arrives and appended to the writer,
+        so progress is visible on disk before the stream finishes.
         
-        # Japanese repetition patterns (ますます, ですがですが, しかししかし, etc.)
-        result = re.sub(r'(ます){3,}', 'ます', result)
-        result = re.sub(r'(です){3,}', 'です', result)
-        result = re.sub(r'(ですが){2,}', 'ですが', result)
-        result = re.sub(r'(しかし){2,}', 'しかし', result)
-        result = re.sub(r'(However\s*){2,}', 'However ', result)
+        Args:
+            response: Streaming HTTP response
+            language: Target language code
+            writer: Atomic file writer, or None to only collect the output
+            
+        Returns:
+            Tuple[str, Dict[str, Any]]: (cleaned translated content, usage information)
+            
+        Raises:
+            ValueError: Output degenerated into a repetition loop
+        """
+        chunks: List[str] = []
+        received = 0
+        usage: Dict[str, Any] = {}
+        sanitizer = self.create_sanitizer()
+        tail = ""
+        first_chunk = True
+        
+        request_span = current_span()
+        for raw_line in response.iter_lines(decode_unicode=True):
+            if not raw_line or not raw_line.startswith("data:"):
+                continue
+            request_span.add("bytes_out", len(raw_line.encode("utf-8")))
+            data = raw_line[5:].strip()
+            if data == "[DONE]":
+                break
+            
+            try:
+                event = json.loads(data)
+            except json.JSONDecodeError:
+                debug("[%s] Skipping malformed stream event", language)
+                continue
+            
+            if event.get("usage"):
+                usage = event["usage"]
+            choices = event.get("choices") or []
+            if not choices:
+                continue
+            delta = (choices[0].get("delta") or {}).get("content")
+            if not delta:
+                continue
+            
+            if first_chunk:
+                info(f"[{language}] Receiving streamed translation...")
+                first_chunk = False
+            received += len(delta)
+            
+            tail = (tail + delta)[-self.repetition_abort_window:]
+            if self._is_degenerate(tail):
+                response.close()
+                raise ValueError(f"Output degenerated into a repetition loop after {received} characters")
+            
+            cleaned = sanitizer.feed(delta)
+            if cleaned:
+                chunks.append(cleaned)
+                if writer is not None:
+                    writer.write(cleaned)
+        
+        cleaned = sanitizer.finish()
+        if cleaned:
+            chunks.append(cleaned)
+            if writer is not None:
+                writer.write(cleaned)
+        
+        return "".join(chunks), usage
+    
+    def _post_with_retry(self, payload: Dict[str, Any], headers: Dict[str, str], language: str, estimated_tokens: int) -> Any:
+        """
+        Send a chat-completions request within the rate limits, retrying throttled and transient failures
         
-        # Generic: any 2+ char sequence repeated 3+ times
-        result = re.sub(r'(.{2,}?)\1{2,}', r'\1', result)
+        Args:
+            payload: Request body
+            headers: Request headers
+            language: Target language code, used for logging
+            estimated_tokens: Token budget reserved for the request
+            
+        Returns:
+            Response: Final response; its rate limiter slot is still held and must be released by the caller
+            
+        Raises:
+            requests.exceptions.RequestException: The request failed after all retries, its slot is already released
+        """
+        limiter = self.rate_limiter
+        request_span = current_span()
+        attempt = 0
+        while True:
+            queued = time.perf_counter()
+            limiter.acquire(estimated_tokens)
+            request_span.add("queue_wait_seconds", time.perf_counter() - queued)
+            try:
+                response = get_session().post(
+                    self.api_url,
+                    json=payload,
+                    headers=headers,
+                    timeout=self.timeout,
+                    stream=self.stream
+                )
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                # Transient failure: free the slot and retry
+                limiter.release(estimated_tokens, 0)
+                if attempt >= limiter.max_retries:
+                    raise
+                delay = limiter.backoff_delay(attempt)
+                warning(f"[{language}] Request failed ({e}), retry {attempt + 1}/{limiter.max_retries} in {delay:.1f}s")
+            except BaseException:
+                # No response to hand to the caller, so the slot is freed here
+                limiter.release(estimated_tokens, 0)
+                raise
+            else:
+                request_span.add("bytes_in", len(response.request.body or b""))
+                if response.status_code not in RETRYABLE_STATUS_CODES or attempt >= limiter.max_retries:
+                    return response
+                
+                if response.status_code == 429:
+                    limiter.concurrency.on_throttle()
+                delay = limiter.backoff_delay(attempt, parse_retry_after(response.headers.get("Retry-After")))
+                response.close()
+                limiter.release(estimated_tokens, 0)
+                warning(f"[{language}] API returned {response.status_code}, retry {attempt + 1}/{limiter.max_retries} in {delay:.1f}s")
+            
+            request_span.add("retries")
+            time.sleep(delay)
+            attempt += 1
+    
+    def _translate_single_language(self, content: str, language: str, mode: str, stream_writer_factory: Optional[Callable[[str], Any]] = None) -> Tuple[str, str, Optional[str]]:
+        """
+        Translate content to a single language within a "request" metrics span
         
-        return result
+        Args:
+            content: Content to translate
+            language: Target language code
+            mode: Translation mode
+            stream_writer_factory: Callback opening an atomic writer for the language's README, used in streaming mode
+            
+        Returns:
+            Tuple[str, str, Optional[str]]: (language_code, translated_content, error_message)
+        """
+        with span("request", provider=self.name, language=language) as request_span:
+            result = self._request_translation(content, language, mode, stream_writer_factory)
+            request_span.error = result[2]
+            return result
     
-    def _translate_single_language(self, content: str, language: str, mode: str) -> Tuple[str, str, Optional[str]]:
+    def _request_translation(self, content: str, language: str, mode: str, stream_writer_factory: Optional[Callable[[str], Any]] = None) -> Tuple[str, str, Optional[str]]:
         """
-        Translate content to a single language
+        Send the translation request for a single language
         
         Args:
             content: Content to translate
             language: Target language code
             mode: Translation mode
+            stream_writer_factory: Callback opening an atomic writer for the language's README, used in streaming mode
             
         Returns:
             Tuple[str, str, Optional[str]]: (language_code, translated_content, error_message)
@@ -174,71 +315,89 @@ STRICT RULES:
         
         prompt = self._build_single_language_prompt(content, language, mode)
         
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
+        headers = {"Content-Type": "application/json"}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
         
-        language_name = self.get_language_name(language)
+        system_prompt = f"You are a Markdown translator. Translate into {language_name}. Output ONLY the translated document. No language headers. No notes. No code block wrappers. Keep all formatting unchanged."
         payload = {
             "model": self.model,
             "messages": [
                 {
                     "role": "system",
-                    "content": f"You are a Markdown translator. Translate into {language_name}. Output ONLY the translated document. No language headers. No notes. No code block wrappers. Keep all formatting unchanged."
+                    "content": system_prompt
                 },
                 {
                     "role": "user", 
                     "content": prompt
                 }
             ],
-            "stream": False,
+            "stream": self.stream,
             "max_tokens": self.max_tokens,
             "temperature": self.temperature,
             "top_p": self.top_p,
-            "top_k": self.top_k,
             "frequency_penalty": self.frequency_penalty,
             "n": 1,
             "response_format": {"type": "text"}
         }
-        
+        if self.top_k is not None:
+            # Not part of the OpenAI API, only sent where it is configured
+            payload["top_k"] = self.top_k
+        
+        # Translations are about as long as their source, so reserve prompt plus source tokens
+        counter = self.token_counter
+        prompt_tokens = counter.count_raw(system_prompt) + counter.count_raw(prompt)
+        estimated_tokens = counter.count(system_prompt + prompt) + min(self.max_tokens, counter.count(content))
+        used_tokens = None
+        response = None
+        writer = None
         try:
-            debug(f"[{language}] Sending request to: {self.API_URL}")
+            debug("[%s] Sending request to: %s", language, self.api_url)
             
-            response = requests.post(
-                self.API_URL,
-                json=payload,
-                headers=headers,
-                timeout=self.timeout
-            )
+            response = self._post_with_retry(payload, headers, language, estimated_tokens)
             
-            debug(f"[{language}] Response status code: {response.status_code}")
+            debug("[%s] Response status code: %s", language, response.status_code)
             
             if response.status_code != 200:
                 error_msg = response.text
                 error(f"[{language}] API error: {error_msg}")
                 return (language, "", f"API error: {response.status_code}")
             
-            result = response.json()
-            
-            if "error" in result:
-                error_msg = result["error"].get("message", "Unknown error")
-                return (language, "", f"API error: {error_msg}")
+            if self.stream:
+                writer = stream_writer_factory(language) if stream_writer_factory else None
+                translated_content, usage = self._stream_translation(response, language, writer)
+            else:
+                result = response.json()
+                
+                if "error" in result:
+                    error_msg = result["error"].get("message", "Unknown error")
+                    return (language, "", f"API error: {error_msg}")
+                
+                current_span().add("bytes_out", len(response.content))
+                translated_content = result["choices"][0]["message"]["content"]
+                usage = result.get("usage")
+                
+                # Post-process: clean up unwanted patterns
+                translated_content = self._clean_translation_output(translated_content)
             
-            translated_content = result["choices"][0]["message"]["content"]
+            if writer is not None:
+                # The streamed output is already the cleaned document, publish it
+                writer.commit()
+                debug("[%s] Streamed translation written to %s", language, writer.file_path)
             
-            # Post-process: clean up unwanted patterns
-            translated_content = self._clean_translation_output(translated_content)
+            self.rate_limiter.concurrency.on_success()
             
             # Log usage info
-            if "usage" in result:
-                usage = result["usage"]
+            if usage:
+                used_tokens = usage.get("total_tokens")
+                counter.calibrate(prompt_tokens, usage.get("prompt_tokens", 0))
+                current_span().set(prompt_tokens=usage.get("prompt_tokens"), completion_tokens=usage.get("completion_tokens"))
                 info(f"[{language}] API usage - prompt_tokens: {usage.get('prompt_tokens', 0)}, completion_tokens: {usage.get('completion_tokens', 0)}")
             
             info(f"[{language}] Translation completed, length: {len(translated_content)}")
-            debug(f"[{language}] ========== Response Start ==========")
-            debug(f"{translated_content[:500]}..." if len(translated_content) > 500 else translated_content)
-            debug(f"[{language}] ========== Response End ==========")
+            debug("[%s] ========== Response Start ==========", language)
+            debug(lambda: f"{translated_content[:500]}..." if len(translated_content) > 500 else translated_content)
+            debug("[%s] ========== Response End ==========", language)
             
             return (language, translated_content, None)
             
@@ -248,8 +407,14 @@ STRICT RULES:
             return (language, "", f"Network error: {e}")
         except Exception as e:
             return (language, "", f"Translation failed: {e}")
+        finally:
+            if writer is not None:
+                # No-op after a successful commit, otherwise drops the partial file
+                writer.abort()
+            if response is not None:
+                self.rate_limiter.release(estimated_tokens, used_tokens)
     
-    def translate(self, content: str, languages: List[str], **kwargs) -> str:
+    async def atranslate(self, content: str, languages: List[str], **kwargs) -> str:
         """
         Execute translation using SiliconFlow API with parallel requests
         
@@ -262,9 +427,10 @@ STRICT RULES:
             str: JSON string with translations for each language
         """
         if not self.validate_credentials():
-            raise Exception("SiliconFlow API key not configured")
+            raise Exception(self.CREDENTIALS_ERROR)
         
         mode = kwargs.get("mode", "gen")
+        stream_writer_factory = kwargs.get("stream_writer_factory")
         results: Dict[str, str] = {}
         errors: List[str] = []
         
@@ -274,48 +440,55 @@ STRICT RULES:
             if lang == "en":
                 results["en"] = content
                 info(f"✓ en: Using original content (no translation needed)")
+                continue
+            
+            cached = self.get_cached_translation(content, lang, mode)
+            if cached is not None:
+                results[lang] = cached
+                info(f"✓ {lang}: Using cached translation")
             else:
                 languages_to_translate.append(lang)
         
         if not languages_to_translate:
-            # All languages are English, return directly
+            # All languages are English or cached, return directly
             json_result = json.dumps(results, ensure_ascii=False, indent=2)
             return json_result
         
         info(f"Starting parallel translation for {len(languages_to_translate)} languages: {', '.join(languages_to_translate)}")
         
-        # Use ThreadPoolExecutor for parallel requests
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all translation tasks
-            future_to_lang = {
-                executor.submit(self._translate_single_language, content, lang, mode): lang 
-                for lang in languages_to_translate
-            }
-            
-            # Collect results as they complete
-            for future in as_completed(future_to_lang):
-                lang = future_to_lang[future]
+        # Requests run on the shared HTTP executor, max_workers caps this provider's share of it
+        semaphore = asyncio.Semaphore(self.max_workers)
+        
+        async def translate_language(lang: str) -> Tuple[str, str, Optional[str]]:
+            async with semaphore:
                 try:
-                    language, translated, err = future.result()
-                    if err:
-                        errors.append(f"[{language}] {err}")
-                        warning(f"Translation failed for {language}: {err}")
-                    else:
-                        results[language] = translated
-                        info(f"✓ {language} translation completed")
+                    return await run_blocking(self._translate_single_language, content, lang, mode, stream_writer_factory)
                 except Exception as e:
-                    errors.append(f"[{lang}] Unexpected error: {e}")
                     error(f"Unexpected error for {lang}: {e}")
+                    return (lang, "", f"Unexpected error: {e}")
+        
+        # Collect results as they complete
+        for future in asyncio.as_completed([translate_language(lang) for lang in languages_to_translate]):
+            language, translated, err = await future
+            if err:
+                errors.append(f"[{language}] {err}")
+                warning(f"Translation failed for {language}: {err}")
+            else:
+                results[language] = translated
+                self.store_cached_translation(content, language, mode, translated)
+                info(f"✓ {language} translation completed")
         
         # Report results
         info(f"Translation completed: {len(results)} successful, {len(errors)} failed")
         if errors:
             for err in errors:
                 warning(err)
+            missing = [lang for lang in languages_to_translate if lang not in results]
+            warning(f"⚠ Missing translations for: {', '.join(missing)}")
         
         # Return as JSON string for compatibility with existing parser
         json_result = json.dumps(results, ensure_ascii=False, indent=2)
-        debug(f"Final JSON result length: {len(json_result)}")
+        debug("Final JSON result length: %d", len(json_result))
         
         return json_result
     
@@ -4,16 +4,18 @@ Tencent Cloud translation provider module
 Provides Tencent Cloud based translation service.
 """
 
+import asyncio
 import json
-import time
 import uuid
-import sseclient
-import requests
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 
 from .base import TranslationProvider
+from ..http_client import run_blocking
+from ..sse_stream import ReplyChunk, collect_reply, stream_reply
 from ...utils.config import Config
+from ...utils.json_extractor import extract_json_content
 from ...utils.logger import debug, info, warning, error
+from ...utils.metrics import span
 
 
 class TencentProvider(TranslationProvider):
@@ -31,16 +33,20 @@ class TencentProvider(TranslationProvider):
         self.config = config
         self.streaming_throttle = config.get("sse.streaming_throttle", 1)
         self.timeout = config.get("sse.timeout", 60)
+        self.sse_url = config.get("sse.url", "") or self.SSE_URL
         debug("Tencent provider initialized")
     
     @property
     def name(self) -> str:
         return "tencent"
     
-    def translate(self, content: str, languages: List[str], **kwargs) -> str:
+    async def atranslate(self, content: str, languages: List[str], **kwargs) -> str:
         """
         Execute translation using Tencent Cloud
         
+        With sse.languages_per_request set, languages are split into groups
+        sent as separate concurrent requests and the replies are merged.
+        
         Args:
             content: Content to translate
             languages: Target language list
@@ -50,15 +56,69 @@ class TencentProvider(TranslationProvider):
             str: Translated content
         """
         mode = kwargs.get("mode", "gen")
-        prompt = self.build_translation_prompt(content, languages, mode)
+        workflow_variables = kwargs.get("workflow_variables")
+        
+        groups = self._language_groups(languages)
+        if len(groups) > 1:
+            return await self._atranslate_fan_out(content, groups, mode, workflow_variables)
+        
+        req_data, cache_content, cache_language = self._build_request(content, languages, mode, workflow_variables)
+        cached = self.get_cached_translation(cache_content, cache_language, mode)
+        if cached is not None:
+            info(f"✓ Using cached translation for: {cache_language}")
+            return cached
+        
+        response_text = await run_blocking(self._send_sse_request, req_data)
+        if self._reply_languages(response_text, languages):
+            # Refusals and truncated JSON are not cached, so they are requested again next time
+            self.store_cached_translation(cache_content, cache_language, mode, response_text)
+        else:
+            warning("Reply contains none of the requested languages, not caching it")
+        return response_text
+    
+    @staticmethod
+    def _reply_languages(response_text: str, languages: List[str]) -> Dict[str, str]:
+        """
+        Get the requested languages found in a reply
         
-        language_names = [self.get_language_name(lang) for lang in languages]
-        languages_str = "、".join(language_names)
+        Args:
+            response_text: Reply of the workflow
+            languages: Requested language codes
+            
+        Returns:
+            Dict[str, str]: Language code to content mapping, empty if the reply did not parse
+        """
+        _, language_content = extract_json_content(response_text)
+        return {lang: text for lang, text in language_content.items() if lang in languages}
+    
+    def _language_groups(self, languages: List[str]) -> List[List[str]]:
+        """Split languages into the groups sent as separate requests"""
+        size = int(self.config.get("sse.languages_per_request", 0) or 0)
+        if size <= 0 or size >= len(languages):
+            return [list(languages)]
+        return [languages[i:i + size] for i in range(0, len(languages), size)]
+    
+    def _build_request(self, content: str, languages: List[str], mode: str,
+                       workflow_variables: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, Any], str, str]:
+        """
+        Build the request for a group of languages
+        
+        Args:
+            content: Content to translate
+            languages: Target languages of this request
+            mode: Translation mode ("gen" or "trans")
+            workflow_variables: Workflow variables from the caller
+            
+        Returns:
+            Tuple[Dict[str, Any], str, str]: (request data, cache content, cache language)
+        """
+        prompt = self.build_translation_prompt(content, languages, mode)
         
-        workflow_variables = kwargs.get("workflow_variables", {
-            "code_text": content,
-            "language": languages_str
-        })
+        if not workflow_variables:
+            workflow_variables = {
+                "code_text": content,
+                "language": "、".join(self.get_language_name(lang) for lang in languages)
+            }
         
         req_data = {
             "content": prompt,
@@ -67,7 +127,104 @@ class TencentProvider(TranslationProvider):
             "workflow_variables": workflow_variables
         }
         
-        return self._send_sse_request(req_data)
+        # The whole prompt and workflow variables determine the reply, so both are part of the cache key
+        cache_content = prompt + json.dumps(workflow_variables, ensure_ascii=False, sort_keys=True)
+        return req_data, cache_content, ",".join(languages)
+    
+    async def _atranslate_fan_out(self, content: str, groups: List[List[str]], mode: str,
+                                  workflow_variables: Optional[Dict[str, Any]]) -> str:
+        """
+        Translate language groups with concurrent requests and merge the replies
+        
+        Each request gets its own session. A group whose reply fails or holds
+        none of its languages is reported and left out, the others are kept.
+        
+        Args:
+            content: Content to translate
+            groups: Language groups, one request each
+            mode: Translation mode ("gen" or "trans")
+            workflow_variables: Workflow variables from the caller
+            
+        Returns:
+            str: JSON object with one key per translated language
+        """
+        info(f"Sending {len(groups)} parallel requests for {sum(len(group) for group in groups)} languages")
+        
+        # Requests run on the shared HTTP executor, max_workers caps this provider's share of it
+        semaphore = asyncio.Semaphore(max(1, int(self.config.get("sse.max_workers", 4) or 1)))
+        
+        async def translate_group(group: List[str]) -> Tuple[List[str], Dict[str, str], Optional[str]]:
+            async with semaphore:
+                try:
+                    return group, await self._atranslate_group(content, group, mode, workflow_variables), None
+                except Exception as e:
+                    return group, {}, str(e)
+        
+        results: Dict[str, str] = {}
+        errors: List[str] = []
+        for future in asyncio.as_completed([translate_group(group) for group in groups]):
+            group, translations, err = await future
+            if err:
+                errors.append(f"[{','.join(group)}] {err}")
+                warning(f"Translation failed for {','.join(group)}: {err}")
+            else:
+                results.update(translations)
+                info(f"✓ {','.join(group)} translation completed")
+        
+        if not results:
+            raise Exception(f"All Tencent requests failed: {'; '.join(errors)}")
+        if errors:
+            missing = [lang for group in groups for lang in group if lang not in results]
+            warning(f"⚠ Missing translations for: {', '.join(missing)}")
+        
+        # Same shape as a single multi-language reply, for the parser
+        return json.dumps(results, ensure_ascii=False, indent=2)
+    
+    async def _atranslate_group(self, content: str, languages: List[str], mode: str,
+                                workflow_variables: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Translate one language group
+        
+        Args:
+            content: Content to translate
+            languages: Languages of the group
+            mode: Translation mode ("gen" or "trans")
+            workflow_variables: Workflow variables from the caller
+            
+        Returns:
+            Dict[str, str]: Language code to content mapping of the group
+            
+        Raises:
+            Exception: Request failed or the reply has none of the languages
+        """
+        if workflow_variables and "language" in workflow_variables:
+            # Narrow the caller's language list to this group
+            workflow_variables = dict(workflow_variables)
+            workflow_variables["language"] = "、".join(self.get_language_name(lang) for lang in languages)
+        
+        req_data, cache_content, cache_language = self._build_request(content, languages, mode, workflow_variables)
+        response_text = self.get_cached_translation(cache_content, cache_language, mode)
+        cached = response_text is not None
+        if not cached:
+            response_text = await run_blocking(self._send_sse_request, req_data)
+        
+        translations = self._reply_languages(response_text, languages)
+        if not translations:
+            raise Exception("Reply contains none of the requested languages")
+        
+        if not cached:
+            # Only replies that parsed are cached, so a malformed one is requested again next time
+            self.store_cached_translation(cache_content, cache_language, mode, response_text)
+        return translations
+    
+    def get_model_id(self) -> str:
+        """
+        Get identifier of the workflow behind this provider
+        
+        Returns:
+            str: Bot application key, which selects the workflow and its model
+        """
+        return self.config.get("app.bot_app_key", "") or ""
     
     def validate_credentials(self) -> bool:
         """
@@ -89,92 +246,41 @@ class TencentProvider(TranslationProvider):
         
         return True
     
-    def _send_sse_request(self, req_data: Dict[str, Any]) -> str:
+    def stream_reply(self, req_data: Dict[str, Any]) -> Iterator[ReplyChunk]:
         """
-        Send SSE request to Tencent Cloud
+        Send a request to Tencent Cloud and stream the reply
         
         Args:
             req_data: Request data
             
         Returns:
-            str: Response content
+            Iterator[ReplyChunk]: Reply chunks as they arrive, the final one
+                carries the complete reply
         """
-        session_id = str(uuid.uuid4())
-        
         request_data = {
             "content": req_data["content"],
             "bot_app_key": req_data["bot_app_key"],
             "visitor_biz_id": req_data["visitor_biz_id"],
-            "session_id": session_id,
+            "session_id": str(uuid.uuid4()),
             "streaming_throttle": self.streaming_throttle
         }
         
         if "workflow_variables" in req_data:
             request_data["custom_variables"] = req_data["workflow_variables"]
         
-        headers = {"Accept": "text/event-stream"}
+        return stream_reply(self.sse_url, request_data, self.timeout)
+    
+    def _send_sse_request(self, req_data: Dict[str, Any]) -> str:
+        """
+        Send SSE request to Tencent Cloud
         
-        try:
-            debug(f"Sending request to: {self.SSE_URL}")
-            debug(f"Request data: {json.dumps(request_data, ensure_ascii=False, indent=2)}")
-            
-            response = requests.post(
-                self.SSE_URL, 
-                data=json.dumps(request_data),
-                stream=True,
-                headers=headers,
-                timeout=self.timeout
-            )
-            
-            debug(f"Response status code: {response.status_code}")
-            
-            if response.status_code != 200:
-                error(f"Response content: {response.text}")
-                raise Exception(f"HTTP request failed: {response.status_code} - {response.text}")
-            
-            client = sseclient.SSEClient(response)
-            response_text = ""
-            
-            debug("Starting to process SSE response...")
-            
-            for event in client.events():
-                debug(f"Received event: {event.event}")
-                debug(f"Event data: {event.data}")
-                
-                try:
-                    data = json.loads(event.data)
-                    if event.event == "reply":
-                        if data["payload"]["is_from_self"]:
-                            debug(f'Sent content: {data["payload"]["content"]}')
-                        elif data["payload"]["is_final"]:
-                            info(f"Received event: {event.event}")
-                            debug(f"Event data: {event.data}")
-                            info("Polishing completed")
-                            response_text = data["payload"]["content"]
-                            break
-                        else:
-                            content = data["payload"]["content"]
-                            response_text += content
-                            
-                            if self.streaming_throttle > 0:
-                                time.sleep(self.streaming_throttle / 1000.0)
-                    else:
-                        debug(f"Unhandled event type: {event.event}")
-                
-                except json.JSONDecodeError as e:
-                    error(f"JSON parsing failed: {e}")
-                    continue
-                except Exception as e:
-                    error(f"Failed to process SSE event: {e}")
-                    continue
-            
-            debug(f"Final response text length: {len(response_text)}")
-            info(f"Final response text length: {len(response_text)}")
-            return response_text
+        Args:
+            req_data: Request data
             
-        except requests.exceptions.Timeout:
-            raise Exception("Request timeout")
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"Network request failed: {e}")
-        except Exception as e:
-            raise Exception(f"SSE request failed: {e}")
+        Returns:
+            str: Response content
+        """
+        with span("request", provider=self.name):
+            response_text = collect_reply(self.stream_reply(req_data))
+        info(f"Final response text length: {len(response_text)}")
+        return response_text
@@ -0,0 +1,270 @@
+"""
+Rate limiting module
+
+Provides token-bucket request/token budgets, adaptive concurrency and
+retry backoff shared by all worker threads of a provider.
+"""
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+from ..utils.logger import debug, warning
+
+
+# HTTP status codes worth retrying: throttling and transient server errors
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Roughly estimate the token count of a text
+
+    Args:
+        text: Text to estimate
+
+    Returns:
+        int: Estimated token count, about 4 UTF-8 bytes per token
+    """
+    return max(1, len(text.encode("utf-8")) // 4)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header
+
+    Args:
+        value: Header value, either delay seconds or an HTTP date
+
+    Returns:
+        Optional[float]: Delay in seconds, None if missing or invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at a per-minute rate"""
+
+    def __init__(self, per_minute: float):
+        """
+        Initialize token bucket
+
+        Args:
+            per_minute: Budget per minute, also the bucket capacity
+        """
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, amount: float = 1.0):
+        """
+        Take tokens, blocking until enough are available
+
+        Requests larger than the capacity wait for a full bucket.
+
+        Args:
+            amount: Number of tokens to take
+        """
+        amount = min(float(amount), self.capacity)
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return
+                wait = (amount - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def adjust(self, amount: float):
+        """
+        Correct an earlier reservation, e.g. with the actual token usage
+
+        Args:
+            amount: Tokens to take (positive) or give back (negative), may leave the bucket in debt
+        """
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.capacity, self._tokens - amount)
+
+
+class AdaptiveConcurrency:
+    """Concurrency limit that halves when throttled and grows back on success"""
+
+    def __init__(self, max_limit: int, cooldown: float = 1.0):
+        """
+        Initialize adaptive concurrency limit
+
+        Args:
+            max_limit: Upper bound for concurrent requests
+            cooldown: Seconds during which further throttling signals are ignored after a decrease
+        """
+        self.max_limit = max(1, int(max_limit))
+        self.limit = float(self.max_limit)
+        self.active = 0
+        self.cooldown = cooldown
+        self._last_decrease = float("-inf")
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        """Wait for a free slot"""
+        with self._condition:
+            while self.active >= int(self.limit):
+                self._condition.wait()
+            self.active += 1
+
+    def release(self):
+        """Free a slot"""
+        with self._condition:
+            self.active -= 1
+            self._condition.notify_all()
+
+    def on_success(self):
+        """Additively increase the limit, by one slot per limit successes"""
+        with self._condition:
+            self.limit = min(float(self.max_limit), self.limit + 1.0 / self.limit)
+            self._condition.notify_all()
+
+    def on_throttle(self):
+        """Multiplicatively decrease the limit"""
+        with self._condition:
+            # Requests in flight are throttled together, treat their 429s as one signal
+            now = time.monotonic()
+            if now - self._last_decrease < self.cooldown:
+                return
+            self._last_decrease = now
+            previous = int(self.limit)
+            self.limit = max(1.0, self.limit / 2)
+            if int(self.limit) < previous:
+                warning(f"⚠ Throttled by provider, reducing concurrency to {int(self.limit)}")
+
+
+class RateLimiter:
+    """Request and token budgets, adaptive concurrency and retry policy of one provider"""
+
+    def __init__(self, requests_per_minute: float = 0, tokens_per_minute: float = 0, max_concurrency: int = 3,
+                 max_retries: int = 5, backoff_base: float = 1.0, backoff_max: float = 60.0):
+        """
+        Initialize rate limiter
+
+        Args:
+            requests_per_minute: Request budget, 0 for unlimited
+            tokens_per_minute: Token budget, 0 for unlimited
+            max_concurrency: Upper bound for concurrent requests
+            max_retries: Retries for throttled or transiently failing requests
+            backoff_base: Base delay in seconds for exponential backoff
+            backoff_max: Maximum backoff delay in seconds
+        """
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute and requests_per_minute > 0 else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute and tokens_per_minute > 0 else None
+        self.concurrency = AdaptiveConcurrency(max_concurrency)
+        self.max_retries = max(0, int(max_retries))
+        self.backoff_base = float(backoff_base)
+        self.backoff_max = float(backoff_max)
+
+    @classmethod
+    def from_config(cls, config: Any, section: str, max_concurrency: int) -> "RateLimiter":
+        """
+        Create rate limiter from configuration
+
+        Args:
+            config: Configuration object
+            section: Configuration section of the provider, e.g. "siliconflow"
+            max_concurrency: Upper bound for concurrent requests
+
+        Returns:
+            RateLimiter: Rate limiter instance
+        """
+        return cls(
+            requests_per_minute=config.get(f"{section}.rate_limit.requests_per_minute", 0),
+            tokens_per_minute=config.get(f"{section}.rate_limit.tokens_per_minute", 0),
+            max_concurrency=max_concurrency,
+            max_retries=config.get(f"{section}.rate_limit.max_retries", 5),
+            backoff_base=config.get(f"{section}.rate_limit.backoff_base", 1.0),
+            backoff_max=config.get(f"{section}.rate_limit.backoff_max", 60.0),
+        )
+
+    def acquire(self, estimated_tokens: int = 0):
+        """
+        Wait until a request may be sent
+
+        Args:
+            estimated_tokens: Estimated prompt plus completion tokens of the request
+        """
+        self.concurrency.acquire()
+        try:
+            if self.requests:
+                self.requests.acquire(1)
+            if self.tokens and estimated_tokens:
+                self.tokens.acquire(estimated_tokens)
+        except BaseException:
+            self.concurrency.release()
+            raise
+
+    def release(self, estimated_tokens: int = 0, used_tokens: Optional[int] = None):
+        """
+        Finish a request started with acquire()
+
+        Args:
+            estimated_tokens: Tokens reserved by acquire()
+            used_tokens: Actual tokens reported by the provider, None if unknown
+        """
+        if self.tokens and used_tokens is not None:
+            self.tokens.adjust(used_tokens - estimated_tokens)
+        self.concurrency.release()
+
+    def backoff_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Get delay before the next retry
+
+        Args:
+            attempt: Number of the failed attempt, starting at 0
+            retry_after: Delay requested by the server, takes precedence
+
+        Returns:
+            float: Delay in seconds, exponential with full jitter
+        """
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max) + random.uniform(0, self.backoff_base)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(config: Any, section: str, max_concurrency: int) -> RateLimiter:
+    """
+    Get the rate limiter shared by all instances of a provider
+
+    Args:
+        config: Configuration object, only used when the limiter is first created
+        section: Configuration section of the provider
+        max_concurrency: Upper bound for concurrent requests
+
+    Returns:
+        RateLimiter: Shared rate limiter
+    """
+    with _limiters_lock:
+        if section not in _limiters:
+            _limiters[section] = RateLimiter.from_config(config, section, max_concurrency)
+            debug(f"Rate limiter created for {section}")
+        return _limiters[section]
@@ -4,11 +4,9 @@ SSE client module
 Provides Server-Sent Events client implementation.
 """
 
-import json
-import time
-import sseclient
-import requests
-from typing import Dict, Any, Optional
+import uuid
+from typing import Dict, Any, Iterator, Optional
+from .sse_stream import ReplyChunk, collect_reply, stream_reply
 from ..utils.config import Config
 from ..models.types import TranslationRequest
 from ..utils.logger import debug, info, warning, error
@@ -17,6 +15,8 @@ from ..utils.logger import debug, info, warning, error
 class SSEClient:
     """SSE client class"""
     
+    SSE_URL = "https://wss.lke.cloud.tencent.com/v1/qbot/chat/sse"
+    
     def __init__(self, config: Config):
         """
         Initialize SSE client
@@ -27,6 +27,7 @@ class SSEClient:
         self.config = config
         self.streaming_throttle = config.get("sse.streaming_throttle", 1)
         self.timeout = config.get("sse.timeout", 60)
+        self.sse_url = config.get("sse.url", "") or self.SSE_URL
     
     def send_request(self, request: TranslationRequest) -> str:
         """
@@ -57,28 +58,23 @@ class SSEClient:
         
         return response_text
     
-    def _send_sse_request(self, req_data: Dict[str, Any]) -> str:
+    def stream_reply(self, req_data: Dict[str, Any]) -> Iterator[ReplyChunk]:
         """
-        Specific implementation of sending SSE request
+        Send SSE request and stream the reply
         
         Args:
             req_data: Request data
             
         Returns:
-            str: Response content
+            Iterator[ReplyChunk]: Reply chunks as they arrive, the final one
+                carries the complete reply
         """
-        url = "https://wss.lke.cloud.tencent.com/v1/qbot/chat/sse"
-        
-        # Add session_id
-        import uuid
-        session_id = str(uuid.uuid4())
-        
         # Build request data
         request_data = {
             "content": req_data["content"],
             "bot_app_key": req_data["bot_app_key"],
             "visitor_biz_id": req_data["visitor_biz_id"],
-            "session_id": session_id,
+            "session_id": str(uuid.uuid4()),
             "streaming_throttle": self.streaming_throttle
         }
         
@@ -86,78 +82,22 @@ class SSEClient:
         if "workflow_variables" in req_data:
             request_data["custom_variables"] = req_data["workflow_variables"]
         
-        headers = {"Accept": "text/event-stream"}
+        return stream_reply(self.sse_url, request_data, self.timeout)
+    
+    def _send_sse_request(self, req_data: Dict[str, Any]) -> str:
+        """
+        Specific implementation of sending SSE request
         
-        try:
-            debug(f"Sending request to: {url}")
-            debug(f"Request data: {json.dumps(request_data, ensure_ascii=False, indent=2)}")
-            
-            # Send request
-            response = requests.post(
-                url, 
-                data=json.dumps(request_data),
-                stream=True,
-                headers=headers,
-                timeout=self.timeout
-            )
-            
-            debug(f"Response status code: {response.status_code}")
-            
-            if response.status_code != 200:
-                error(f"Response content: {response.text}")
-                raise Exception(f"HTTP request failed: {response.status_code} - {response.text}")
-            
-            # Process SSE response
-            client = sseclient.SSEClient(response)
-            response_text = ""
-            
-            debug("Starting to process SSE response...")
-            
-            for event in client.events():
-                debug(f"Received event: {event.event}")
-                debug(f"Event data: {event.data}")
-                
-                try:
-                    data = json.loads(event.data)
-                    if event.event == "reply":
-                        if data["payload"]["is_from_self"]:
-                            debug(f'Sent content: {data["payload"]["content"]}')
-                        elif data["payload"]["is_final"]:
-                            # Use INFO level for the last event
-                            info(f"Received event: {event.event}")
-                            debug(f"Event data: {event.data}")
-                            info("Polishing completed")
-                            response_text = data["payload"]["content"]
-                            break
-                        else:
-                            content = data["payload"]["content"]
-                            response_text += content
-                            # Keep streaming output as is, don't log
-                            
-                            # Throttle control
-                            if self.streaming_throttle > 0:
-                                time.sleep(self.streaming_throttle / 1000.0)
-                    else:
-                        debug(f"Unhandled event type: {event.event}")
-                
-                except json.JSONDecodeError as e:
-                    error(f"JSON parsing failed: {e}")
-                    continue
-                except Exception as e:
-                    error(f"Failed to process SSE event: {e}")
-                    continue
-            
-            debug(f"Final response text length: {len(response_text)}")
-            # Set final JSON response to INFO level
-            info(f"Final response text length: {len(response_text)}")
-            return response_text
+        Args:
+            req_data: Request data
             
-        except requests.exceptions.Timeout:
-            raise Exception("Request timeout")
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"Network request failed: {e}")
-        except Exception as e:
-            raise Exception(f"SSE request failed: {e}")
+        Returns:
+            str: Response content
+        """
+        response_text = collect_reply(self.stream_reply(req_data))
+        # Set final JSON response to INFO level
+        info(f"Final response text length: {len(response_text)}")
+        return response_text
     
     def test_connection(self) -> bool:
         """
@@ -0,0 +1,208 @@
+"""
+SSE stream module
+
+Incremental Server-Sent Events parsing for the Tencent Cloud chat endpoint.
+Events are parsed straight from the response bytes, only reply events are
+decoded, and reply chunks are yielded as they arrive so callers can stream
+them or collect them into one string.
+"""
+
+import json
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple
+
+import requests
+
+from .http_client import get_session
+from ..utils.logger import debug, info, error
+from ..utils.metrics import Span, current_span
+
+
+class SSEEvent(NamedTuple):
+    """A dispatched Server-Sent Event, data is left undecoded"""
+
+    event: str
+    data: bytes
+
+
+class ReplyChunk(NamedTuple):
+    """Content of a reply event"""
+
+    content: str
+    is_final: bool
+
+
+def iter_sse_events(chunks: Iterable[bytes]) -> Iterator[SSEEvent]:
+    """
+    Parse Server-Sent Events from a byte stream
+
+    Lines may be split across chunks; only the unfinished tail of a chunk is
+    kept until the next one arrives.
+
+    Args:
+        chunks: Raw response body chunks
+
+    Returns:
+        Iterator[SSEEvent]: Events in stream order
+    """
+    pending: List[bytes] = []
+    event = b""
+    data: List[bytes] = []
+
+    def dispatch() -> Iterator[SSEEvent]:
+        if data:
+            yield SSEEvent(event.decode("utf-8", "replace") or "message", b"\n".join(data))
+
+    for chunk in chunks:
+        start = 0
+        while True:
+            end = chunk.find(b"\n", start)
+            if end == -1:
+                if start < len(chunk):
+                    pending.append(chunk[start:])
+                break
+
+            line = chunk[start:end]
+            start = end + 1
+            if pending:
+                pending.append(line)
+                line = b"".join(pending)
+                pending = []
+            if line.endswith(b"\r"):
+                line = line[:-1]
+
+            if not line:
+                yield from dispatch()
+                event, data = b"", []
+            elif not line.startswith(b":"):
+                field, _, value = line.partition(b":")
+                if value.startswith(b" "):
+                    value = value[1:]
+                if field == b"data":
+                    data.append(value)
+                elif field == b"event":
+                    event = value
+
+    # The server may close the stream without a trailing blank line
+    if pending:
+        line = b"".join(pending).rstrip(b"\r")
+        field, _, value = line.partition(b":")
+        if field == b"data":
+            data.append(value[1:] if value.startswith(b" ") else value)
+    yield from dispatch()
+
+
+def iter_reply_chunks(events: Iterable[SSEEvent]) -> Iterator[ReplyChunk]:
+    """
+    Extract bot reply content from chat events
+
+    Only "reply" events are JSON-decoded, and the echo of the sent message
+    is skipped. Iteration stops after the final reply.
+
+    Args:
+        events: Parsed SSE events
+
+    Returns:
+        Iterator[ReplyChunk]: Reply chunks, the last one has is_final set
+    """
+    for event in events:
+        if event.event != "reply":
+            debug("Unhandled event type: %s", event.event)
+            continue
+
+        try:
+            payload = json.loads(event.data)["payload"]
+        except (ValueError, KeyError, TypeError) as e:
+            error(f"Failed to parse SSE reply event: {e}")
+            continue
+
+        if payload.get("is_from_self"):
+            continue
+        is_final = bool(payload.get("is_final"))
+        yield ReplyChunk(payload.get("content") or "", is_final)
+        if is_final:
+            return
+
+
+def collect_reply(chunks: Iterable[ReplyChunk]) -> str:
+    """
+    Join streamed reply chunks into the reply text
+
+    The final reply carries the complete content and replaces the chunks
+    received before it.
+
+    Args:
+        chunks: Reply chunks
+
+    Returns:
+        str: Reply text
+    """
+    parts: List[str] = []
+    for chunk in chunks:
+        if chunk.is_final:
+            info("Polishing completed")
+            return chunk.content
+        parts.append(chunk.content)
+    return "".join(parts)
+
+
+def _counted(chunks: Iterable[bytes], request_span: Span) -> Iterator[bytes]:
+    """Pass chunks through, adding their size to the span's bytes_out"""
+    for chunk in chunks:
+        request_span.add("bytes_out", len(chunk))
+        yield chunk
+
+
+def stream_reply(url: str, request_data: Dict[str, Any], timeout: float) -> Iterator[ReplyChunk]:
+    """
+    Post a chat request and stream the reply
+
+    The response is closed when the final reply arrives or the caller stops
+    iterating.
+
+    Args:
+        url: SSE endpoint
+        request_data: Request body
+        timeout: Request timeout in seconds
+
+    Returns:
+        Iterator[ReplyChunk]: Reply chunks as they arrive
+
+    Raises:
+        Exception: Request failed
+    """
+    debug("Sending request to: %s", url)
+    debug(lambda: f"Request data: {json.dumps(request_data, ensure_ascii=False, indent=2)}")
+
+    body = json.dumps(request_data)
+    request_span = current_span()
+    request_span.add("bytes_in", len(body))
+    try:
+        response = get_session().post(
+            url,
+            data=body,
+            stream=True,
+            headers={"Accept": "text/event-stream"},
+            timeout=timeout
+        )
+    except requests.exceptions.Timeout:
+        raise Exception("Request timeout")
+    except requests.exceptions.RequestException as e:
+        raise Exception(f"Network request failed: {e}")
+
+    try:
+        debug("Response status code: %s", response.status_code)
+        if response.status_code != 200:
+            error(f"Response content: {response.text}")
+            raise Exception(f"HTTP request failed: {response.status_code} - {response.text}")
+
+        yield from iter_reply_chunks(iter_sse_events(_counted(response.iter_content(chunk_size=None), request_span)))
+    except requests.exceptions.Timeout:
+        raise Exception("Request timeout")
+    except requests.exceptions.RequestException as e:
+        raise Exception(f"Network request failed: {e}")
+    except GeneratorExit:
+        raise
+    except Exception as e:
+        raise Exception(f"SSE request failed: {e}")
+    finally:
+        response.close()
@@ -4,16 +4,217 @@ Tencent Cloud service module
 Provides Tencent Cloud API integration services.
 """
 
-import os
-from typing import Dict, Any, Optional
-from tencentcloud.common.common_client import CommonClient
-from tencentcloud.common import credential
-from tencentcloud.common.exception.tencent_cloud_sdk_exception import TencentCloudSDKException
-from tencentcloud.common.profile.client_profile import ClientProfile
-from tencentcloud.common.profile.http_profile import HttpProfile
+import json
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, Any, Optional, Tuple
+from .http_client import get_executor
 from ..utils.config import Config
 from ..utils.logger import debug, info, warning, error
 
+if TYPE_CHECKING:
+    # The SDK is slow to import, it is loaded when the first client is created
+    from tencentcloud.common.common_client import CommonClient
+
+
+# Token lifetime assumed when the configuration does not set one, in seconds
+DEFAULT_TOKEN_TTL = 60
+# Fraction of the lifetime after which a token is refreshed in the background
+REFRESH_AFTER = 0.8
+
+
+class _CachedToken:
+    """A token with its fetch time, guarded by the manager's lock"""
+    
+    def __init__(self):
+        self.token = ""
+        self.fetched_at = 0.0
+        self.refreshing = False
+        self.lock = threading.Lock()
+
+
+class TokenManager:
+    """
+    Cache of GetWsToken tokens shared by all workers
+    
+    Tokens are reused until shortly before they expire and refreshed in the
+    background once REFRESH_AFTER of their lifetime has passed. One
+    CommonClient is kept per region, credentials and HTTP profile.
+    """
+    
+    def __init__(self, ttl: float = DEFAULT_TOKEN_TTL, service: str = "lke", api_version: str = "2023-11-30"):
+        """
+        Initialize token manager
+        
+        Args:
+            ttl: Token lifetime in seconds
+            service: Tencent Cloud service name
+            api_version: API version
+        """
+        self.ttl = ttl
+        self.service = service
+        self.api_version = api_version
+        self._lock = threading.Lock()
+        self._clients: Dict[Tuple, "CommonClient"] = {}
+        self._tokens: Dict[Tuple, _CachedToken] = {}
+        self.fetches = 0
+    
+    def get_client(self, secret_id: str, secret_key: str, region: str, profile: Dict[str, str]) -> "CommonClient":
+        """
+        Get the shared client of a region
+        
+        Args:
+            secret_id: Secret ID
+            secret_key: Secret key
+            region: Region string
+            profile: HTTP profile with domain, scheme and method
+            
+        Returns:
+            CommonClient: Client, created on first use
+        """
+        domain = profile.get("domain", "")
+        scheme = profile.get("scheme", "https")
+        method = profile.get("method", "POST")
+        key = (secret_id, secret_key, region, domain, scheme, method)
+        
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                from tencentcloud.common import credential
+                from tencentcloud.common.common_client import CommonClient
+                from tencentcloud.common.profile.client_profile import ClientProfile
+                from tencentcloud.common.profile.http_profile import HttpProfile
+                
+                http_profile = HttpProfile()
+                http_profile.rootDomain = domain
+                http_profile.scheme = scheme
+                http_profile.reqMethod = method
+                
+                client_profile = ClientProfile()
+                client_profile.httpProfile = http_profile
+                
+                client = CommonClient(
+                    self.service,
+                    self.api_version,
+                    credential.Credential(secret_id, secret_key),
+                    region,
+                    profile=client_profile
+                )
+                self._clients[key] = client
+                debug(f"Tencent Cloud client created: region={region}, domain={domain}, scheme={scheme}, method={method}")
+        return client
+    
+    def get_token(self, secret_id: str, secret_key: str, region: str, profile: Dict[str, str], params: Dict[str, Any]) -> str:
+        """
+        Get a token, from the cache while it is valid
+        
+        Concurrent callers missing the same token wait for one request
+        instead of each sending their own.
+        
+        Args:
+            secret_id: Secret ID
+            secret_key: Secret key
+            region: Region string
+            profile: HTTP profile with domain, scheme and method
+            params: GetWsToken request parameters
+            
+        Returns:
+            str: Token string, returns empty string on failure
+        """
+        # Keyed by the full credentials like the clients, so a rotated key never gets the old key's token
+        key = (secret_id, secret_key, region, tuple(sorted(profile.items())), json.dumps(params, sort_keys=True, default=str))
+        with self._lock:
+            entry = self._tokens.setdefault(key, _CachedToken())
+        
+        age = time.monotonic() - entry.fetched_at
+        if entry.token and age < self.ttl:
+            if age >= self.ttl * REFRESH_AFTER:
+                self._refresh_in_background(entry, secret_id, secret_key, region, profile, params)
+            return entry.token
+        
+        with entry.lock:
+            # Another worker may have fetched it while this one waited
+            if entry.token and time.monotonic() - entry.fetched_at < self.ttl:
+                return entry.token
+            return self._fetch(entry, secret_id, secret_key, region, profile, params)
+    
+    def _refresh_in_background(self, entry: _CachedToken, secret_id: str, secret_key: str, region: str,
+                               profile: Dict[str, str], params: Dict[str, Any]):
+        """Fetch a fresh token on the shared executor, at most one refresh per token at a time"""
+        with self._lock:
+            if entry.refreshing:
+                return
+            entry.refreshing = True
+        
+        def refresh():
+            try:
+                with entry.lock:
+                    self._fetch(entry, secret_id, secret_key, region, profile, params)
+            finally:
+                entry.refreshing = False
+        
+        debug("Refreshing Tencent Cloud token in the background")
+        get_executor().submit(refresh)
+    
+    def _fetch(self, entry: _CachedToken, secret_id: str, secret_key: str, region: str,
+               profile: Dict[str, str], params: Dict[str, Any]) -> str:
+        """Request a token and store it in the entry, the caller holds entry.lock"""
+        from tencentcloud.common.exception.tencent_cloud_sdk_exception import TencentCloudSDKException
+        
+        try:
+            client = self.get_client(secret_id, secret_key, region, profile)
+            self.fetches += 1
+            resp = client.call_json("GetWsToken", params)
+            debug("Tencent Cloud API call successful")
+        except TencentCloudSDKException as err:
+            error(f"Tencent Cloud SDK exception: {err}")
+            return ""
+        except Exception as err:
+            error(f"Failed to get token: {err}")
+            return ""
+        
+        token = resp.get("Response", {}).get("Token", "") if isinstance(resp, dict) else ""
+        if not token:
+            warning("Token field not found in API response")
+            return ""
+        
+        entry.token = token
+        entry.fetched_at = time.monotonic()
+        debug("Successfully extracted token")
+        return token
+    
+    def clear(self):
+        """Drop all cached tokens and clients"""
+        with self._lock:
+            self._tokens.clear()
+            self._clients.clear()
+
+
+_manager_lock = threading.Lock()
+_managers: Dict[Tuple, TokenManager] = {}
+
+
+def get_token_manager(config: Config) -> TokenManager:
+    """
+    Get the token manager shared by all services with the same settings
+    
+    Args:
+        config: Configuration object
+        
+    Returns:
+        TokenManager: Shared token manager
+    """
+    key = (
+        float(config.get("tencent_cloud.token_ttl", DEFAULT_TOKEN_TTL) or DEFAULT_TOKEN_TTL),
+        config.get("tencent_cloud.service", "lke") or "lke",
+        config.get("tencent_cloud.api_version", "2023-11-30") or "2023-11-30"
+    )
+    with _manager_lock:
+        manager = _managers.get(key)
+        if manager is None:
+            manager = _managers[key] = TokenManager(*key)
+    return manager
+
 
 class TencentCloudService:
     """Tencent Cloud service class"""
@@ -28,6 +229,7 @@ class TencentCloudService:
         self.config = config
         self._service = "lke"
         self._api_version = "2023-11-30"
+        self.token_manager = get_token_manager(config)
         debug("Tencent Cloud service initialized")
     
     def get_token(self, secret: Dict[str, str], profile: Dict[str, str], region: str, params: Dict[str, Any]) -> str:
@@ -41,73 +243,16 @@ class TencentCloudService:
             params: Request parameters
             
         Returns:
-            str: Token string, returns empty string on failure
+            str: Token string, cached until shortly before it expires,
+                returns empty string on failure
         """
         debug(f"Starting to get Tencent Cloud token: profile={profile}, region={region}")
         
-        try:
-            # Get secret information
-            secret_id = secret.get("secret_id", "")
-            secret_key = secret.get("secret_key", "")
-            
-            # If not provided in secret, get from configuration
-            if not secret_id:
-                secret_id = self.config.get("tencent_cloud.secret_id", "")
-            if not secret_key:
-                secret_key = self.config.get("tencent_cloud.secret_key", "")
-            
-            debug("Tencent Cloud credentials configured")
-            
-            # Create credentials
-            cred = credential.Credential(secret_id, secret_key)
-            
-            # Configure HTTP configuration
-            http_profile = HttpProfile()
-            domain = profile.get("domain", "")
-            scheme = profile.get("scheme", "https")
-            method = profile.get("method", "POST")
-            
-            http_profile.rootDomain = domain
-            http_profile.scheme = scheme
-            http_profile.reqMethod = method
-            
-            debug(f"HTTP configuration: domain={domain}, scheme={scheme}, method={method}")
-            
-            # Create client configuration
-            client_profile = ClientProfile()
-            client_profile.httpProfile = http_profile
-            
-            # Instantiate common client
-            common_client = CommonClient(
-                self._service, 
-                self._api_version, 
-                cred, 
-                region, 
-                profile=client_profile
-            )
-            
-            debug("Tencent Cloud client created, starting API call")
-            
-            # Call API
-            resp = common_client.call_json("GetWsToken", params)
-            debug("Tencent Cloud API call successful")
-            
-            # Extract token
-            token = ""
-            if "Response" in resp and "Token" in resp["Response"]:
-                token = resp["Response"]["Token"]
-                debug("Successfully extracted token")
-            else:
-                warning("Token field not found in API response")
-            
-            return token
-            
-        except TencentCloudSDKException as err:
-            error(f"Tencent Cloud SDK exception: {err}")
-            return ""
-        except Exception as err:
-            error(f"Failed to get token: {err}")
-            return ""
+        # If not provided in secret, get from configuration
+        secret_id = secret.get("secret_id", "") or self.config.get("tencent_cloud.secret_id", "")
+        secret_key = secret.get("secret_key", "") or self.config.get("tencent_cloud.secret_key", "")
+        
+        return self.token_manager.get_token(secret_id, secret_key, region, profile, params)
     
     def validate_credentials(self) -> bool:
         """
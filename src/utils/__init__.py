@@ -4,7 +4,16 @@ Utility functions module
 Contains various utility functions used in the project.
 """
 
-from .config import Config
-from .file_utils import FileUtils
+from typing import TYPE_CHECKING
+from .lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .config import Config
+    from .file_utils import FileUtils
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "Config": ".config",
+    "FileUtils": ".file_utils",
+})
 
 __all__ = ["Config", "FileUtils"] 
\ No newline at end of file
@@ -0,0 +1,252 @@
+"""
+Translation cache module
+
+Provides a persistent, content-addressed on-disk cache for translation results.
+"""
+
+import os
+import json
+import time
+import hashlib
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from .logger import debug, warning
+
+
+class TranslationCache:
+    """Content-addressed translation cache with size and age eviction"""
+
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None, max_size_mb: float = 200, max_age_days: float = 30):
+        """
+        Initialize translation cache
+
+        Args:
+            cache_dir: Cache directory, if None then use the user cache directory
+            max_size_mb: Maximum total cache size in megabytes
+            max_age_days: Entries not used for this many days are evicted
+        """
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else self.default_cache_dir()
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.max_age_seconds = max_age_days * 86400
+        self._pruned = False
+
+    @staticmethod
+    def default_cache_dir() -> Path:
+        """
+        Get default cache directory
+
+        Returns:
+            Path: $XDG_CACHE_HOME/duoreadme/translations or ~/.cache/duoreadme/translations
+        """
+        xdg_cache = os.environ.get("XDG_CACHE_HOME")
+        base_dir = Path(xdg_cache) if xdg_cache else Path.home() / ".cache"
+        return base_dir / "duoreadme" / "translations"
+
+    @classmethod
+    def from_config(cls, config: Any) -> Optional["TranslationCache"]:
+        """
+        Create cache from configuration
+
+        Args:
+            config: Configuration object
+
+        Returns:
+            Optional[TranslationCache]: Cache instance, None if caching is disabled
+        """
+        if not config.get("cache.enabled", True):
+            return None
+
+        return cls(
+            cache_dir=config.get("cache.dir") or None,
+            max_size_mb=config.get("cache.max_size_mb", 200),
+            max_age_days=config.get("cache.max_age_days", 30)
+        )
+
+    @staticmethod
+    def make_key(provider: str, model: str, mode: str, language: str, prompt_version: str, content: str) -> str:
+        """
+        Build cache key
+
+        Args:
+            provider: Provider name
+            model: Model identifier
+            mode: Translation mode ("gen" or "trans")
+            language: Target language (or comma-joined language list)
+            prompt_version: Prompt template version
+            content: Source content
+
+        Returns:
+            str: Hex digest identifying the translation
+        """
+        content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        key_material = json.dumps([provider, model, mode, language, prompt_version, content_hash])
+        return hashlib.sha256(key_material.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        """Get file path of a cache entry"""
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up cached translation
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Optional[str]: Cached translation, None on miss
+        """
+        path = self._entry_path(key)
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+
+        if time.time() - stat.st_mtime > self.max_age_seconds:
+            self._remove(path)
+            return None
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            # Touch entry so size eviction removes least recently used entries first
+            os.utime(path, None)
+        except (OSError, ValueError) as e:
+            debug(f"Discarding unreadable cache entry {path}: {e}")
+            self._remove(path)
+            return None
+
+        return entry.get("value")
+
+    def set(self, key: str, value: str, metadata: Optional[Dict[str, Any]] = None):
+        """
+        Store translation in cache
+
+        Args:
+            key: Cache key
+            value: Translated content
+            metadata: Additional information stored alongside the entry
+        """
+        path = self._entry_path(key)
+        entry = {
+            "value": value,
+            "created_at": time.time(),
+            "metadata": metadata or {}
+        }
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first so concurrent readers never see partial entries
+            fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(entry, f, ensure_ascii=False)
+                os.replace(tmp_path, path)
+            except BaseException:
+                self._remove(Path(tmp_path))
+                raise
+        except OSError as e:
+            warning(f"Failed to write translation cache entry: {e}")
+            return
+
+        # Evict once per process, the first time something new is stored
+        if not self._pruned:
+            self._pruned = True
+            self.prune()
+
+    def _iter_entries(self) -> Iterator[Tuple[Path, os.stat_result]]:
+        """Iterate over cache entries and their stat results"""
+        if not self.cache_dir.is_dir():
+            return
+
+        for bucket in os.scandir(self.cache_dir):
+            if not bucket.is_dir():
+                continue
+            for entry in os.scandir(bucket.path):
+                if entry.name.endswith(".json"):
+                    try:
+                        yield Path(entry.path), entry.stat()
+                    except OSError:
+                        continue
+
+    def _remove(self, path: Path) -> bool:
+        """Remove a cache file, ignoring errors"""
+        try:
+            path.unlink()
+            return True
+        except OSError:
+            return False
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            Dict[str, Any]: Entry count, total size and age information
+        """
+        entries = list(self._iter_entries())
+        mtimes = [stat.st_mtime for _, stat in entries]
+
+        return {
+            "cache_dir": str(self.cache_dir),
+            "entries": len(entries),
+            "total_bytes": sum(stat.st_size for _, stat in entries),
+            "max_bytes": self.max_size_bytes,
+            "max_age_days": self.max_age_seconds / 86400,
+            "oldest_access": min(mtimes) if mtimes else None,
+            "newest_access": max(mtimes) if mtimes else None
+        }
+
+    def prune(self, max_age_days: Optional[float] = None, max_size_mb: Optional[float] = None) -> int:
+        """
+        Evict expired entries, then least recently used entries until under the size limit
+
+        Args:
+            max_age_days: Age limit override
+            max_size_mb: Size limit override
+
+        Returns:
+            int: Number of removed entries
+        """
+        max_age_seconds = max_age_days * 86400 if max_age_days is not None else self.max_age_seconds
+        max_size_bytes = int(max_size_mb * 1024 * 1024) if max_size_mb is not None else self.max_size_bytes
+
+        now = time.time()
+        removed = 0
+        remaining: List[Tuple[Path, os.stat_result]] = []
+
+        for path, stat in self._iter_entries():
+            if now - stat.st_mtime > max_age_seconds:
+                if self._remove(path):
+                    removed += 1
+            else:
+                remaining.append((path, stat))
+
+        total_bytes = sum(stat.st_size for _, stat in remaining)
+        if total_bytes > max_size_bytes:
+            remaining.sort(key=lambda item: item[1].st_mtime)
+            for path, stat in remaining:
+                if total_bytes <= max_size_bytes:
+                    break
+                if self._remove(path):
+                    removed += 1
+                    total_bytes -= stat.st_size
+
+        if removed:
+            debug(f"Translation cache pruned {removed} entries")
+        return removed
+
+    def clear(self) -> int:
+        """
+        Remove all cache entries
+
+        Returns:
+            int: Number of removed entries
+        """
+        removed = 0
+        for path, _ in list(self._iter_entries()):
+            if self._remove(path):
+                removed += 1
+        return removed
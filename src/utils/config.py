@@ -78,29 +78,78 @@ class Config:
                 "secret_key": "",
                 "region": "ap-beijing",
                 "service": "lke",
-                "api_version": "2023-11-30"
+                "api_version": "2023-11-30",
+                "token_ttl": 60
             },
             "siliconflow": {
+                "api_url": "",
                 "api_key": "",
                 "model": "deepseek-ai/DeepSeek-R1-0528-Qwen3-8B",
                 "timeout": 900,
                 "max_tokens": 8192,
+                "context_window": 0,
                 "temperature": 0.1,
                 "top_p": 0.7,
                 "top_k": 50,
                 "frequency_penalty": 1.0,
-                "max_workers": 10
+                "max_workers": 10,
+                "stream": False,
+                "repetition_abort_window": 600,
+                "rate_limit": {
+                    "requests_per_minute": 0,
+                    "tokens_per_minute": 0,
+                    "max_retries": 5,
+                    "backoff_base": 1.0,
+                    "backoff_max": 60.0
+                }
+            },
+            "openai": {
+                "base_url": "",
+                "api_key": "",
+                "model": "gpt-4o-mini",
+                "timeout": 900,
+                "max_tokens": 8192,
+                "context_window": 0,
+                "temperature": 0.1,
+                "top_p": 0.7,
+                "max_workers": 10,
+                "stream": False,
+                "repetition_abort_window": 600
             },
             "translation": {
                 "default_languages": [
                     "zh-Hans", "en", "ja", "ko", "es", "fr", "de", "it", "pt", "ru"
                 ],
                 "batch_size": 5,
+                "batch_concurrency": 3,
+                "batch_retries": 2,
+                "incremental": True,
+                "job_concurrency": 4,
+                "max_input_tokens": 0,
+                "selection_tokens": 3000,
+                "tokenizer": "approx",
                 "timeout": 30
             },
             "sse": {
+                "url": "",
                 "streaming_throttle": 1,
-                "timeout": 60
+                "timeout": 60,
+                "languages_per_request": 0,
+                "max_workers": 4
+            },
+            "ingest": {
+                "index": True,
+                "max_workers": 8
+            },
+            "http": {
+                "max_connections": 32,
+                "max_concurrency": 16
+            },
+            "cache": {
+                "enabled": True,
+                "dir": "",
+                "max_size_mb": 200,
+                "max_age_days": 30
             }
         }
     
@@ -127,6 +176,11 @@ class Config:
             # SiliconFlow config
             "SILICONFLOW_API_KEY": ("siliconflow", "api_key"),
             "SILICONFLOW_MODEL": ("siliconflow", "model"),
+            # OpenAI-compatible endpoint config
+            "OPENAI_BASE_URL": ("openai", "base_url"),
+            "OPENAI_API_KEY": ("openai", "api_key"),
+            # Translation cache config
+            "DUOREADME_CACHE_DIR": ("cache", "dir"),
         }
         
         for env_var, config_path in env_mappings.items():
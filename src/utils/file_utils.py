@@ -6,9 +6,112 @@ Provides file read/write and operation utility functions.
 
 import os
 import shutil
-import fnmatch
+import stat
+import tempfile
+import threading
 from pathlib import Path
 from typing import List, Optional, Union
+from .gitignore import GitIgnoreSpec, walk_project_files
+from .ingest import FileRecord, ingest_files
+from .scan_index import ScanIndex
+from .text_detect import classify, classify_many
+
+
+_umask_lock = threading.Lock()
+
+
+def _get_umask() -> int:
+    """Get the process umask without changing it where the platform reports it"""
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("Umask:"):
+                    return int(line.split()[1], 8)
+    except (OSError, ValueError, IndexError):
+        pass
+    # Reading the umask elsewhere means setting it, briefly
+    with _umask_lock:
+        umask = os.umask(0o022)
+        os.umask(umask)
+    return umask
+
+
+class AtomicFileWriter:
+    """Incrementally write a text file through a temporary file that replaces the target on commit"""
+    
+    def __init__(self, file_path: Union[str, Path], encoding: str = "utf-8"):
+        """
+        Initialize atomic file writer
+        
+        Args:
+            file_path: Target file path
+            encoding: File encoding
+            
+        Raises:
+            OSError: Temporary file creation failed
+        """
+        self.file_path = Path(file_path)
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Temporary file lives next to the target so the final rename stays on one filesystem
+        fd, temp_path = tempfile.mkstemp(dir=str(self.file_path.parent), prefix=f".{self.file_path.name}.", suffix=".part")
+        self.temp_path = Path(temp_path)
+        self._file = os.fdopen(fd, "w", encoding=encoding)
+    
+    def write(self, text: str):
+        """
+        Append text and flush it so progress is visible on disk
+        
+        Args:
+            text: Text to append
+        """
+        self._file.write(text)
+        self._file.flush()
+    
+    def rewrite(self, text: str):
+        """
+        Replace everything written so far
+        
+        Args:
+            text: New file content
+        """
+        self._file.seek(0)
+        self._file.truncate()
+        self.write(text)
+    
+    def commit(self):
+        """Close the temporary file and atomically move it to the target path"""
+        if self._file.closed:
+            return
+        self._file.close()
+        # mkstemp creates the file as 0600, give it the mode a plain write would
+        os.chmod(self.temp_path, self._target_mode())
+        os.replace(self.temp_path, self.file_path)
+    
+    def _target_mode(self) -> int:
+        """Get the mode of the existing target, or the default mode of a new file under the umask"""
+        try:
+            return stat.S_IMODE(os.stat(self.file_path).st_mode)
+        except OSError:
+            return 0o666 & ~_get_umask()
+    
+    def abort(self):
+        """Close and remove the temporary file, leaving the target untouched"""
+        if not self._file.closed:
+            self._file.close()
+        try:
+            self.temp_path.unlink()
+        except OSError:
+            pass
+    
+    def __enter__(self) -> "AtomicFileWriter":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
 
 
 class FileUtils:
@@ -311,33 +414,29 @@ class FileUtils:
         """
         Determine if it's a text file
         
+        Known text extensions are accepted without reading; other files are
+        judged from a small prefix, see text_detect.looks_like_text().
+        
         Args:
             file_path: File path
             
         Returns:
             Whether it's a text file
         """
-        file_path = Path(file_path)
-        
-        if not file_path.exists() or not file_path.is_file():
-            return False
-        
-        # Check file extension
-        text_extensions = {
-            '.txt', '.md', '.py', '.js', '.ts', '.html', '.css', '.json', 
-            '.xml', '.yaml', '.yml', '.ini', '.cfg', '.conf', '.log'
-        }
-        
-        if file_path.suffix.lower() in text_extensions:
-            return True
+        return classify(file_path)
+    
+    def classify_files(self, file_paths: List[Union[str, Path]], max_workers: int = 8) -> List[bool]:
+        """
+        Determine for many files whether they are text files, in parallel
         
-        # Try to read file beginning to determine if it's text
-        try:
-            with open(file_path, 'rb') as f:
-                chunk = f.read(1024)
-                return chunk.decode('utf-8', errors='ignore').isprintable()
-        except:
-            return False
+        Args:
+            file_paths: File paths
+            max_workers: Worker threads
+            
+        Returns:
+            Whether each file is a text file, in input order
+        """
+        return classify_many(file_paths, max_workers)
     
     def parse_gitignore(self, gitignore_path: Union[str, Path]) -> List[str]:
         """
@@ -392,25 +491,11 @@ class FileUtils:
         # Convert to string, use forward slash separator (gitignore standard)
         relative_path_str = str(relative_path).replace('\\', '/')
         
-        for pattern in gitignore_patterns:
-            # Handle directory patterns (ending with /)
-            if pattern.endswith('/'):
-                if relative_path_str.startswith(pattern[:-1]) or fnmatch.fnmatch(relative_path_str, pattern[:-1]):
-                    return True
-            
-            # Handle file patterns
-            if fnmatch.fnmatch(relative_path_str, pattern):
-                return True
-            
-            # Handle wildcard patterns
-            if fnmatch.fnmatch(relative_path_str, pattern):
-                return True
-        
-        return False
+        return GitIgnoreSpec(gitignore_patterns).is_ignored(relative_path_str, is_dir=file_path.is_dir())
     
     def get_project_files(self, project_path: Union[str, Path], include_gitignore: bool = True) -> List[Path]:
         """
-        Get project file list, supports .gitignore filtering
+        Get project file list, supports nested .gitignore filtering
         
         Args:
             project_path: Project path
@@ -419,25 +504,30 @@ class FileUtils:
         Returns:
             List of file paths
         """
+        return [record.path for record in self.ingest_project_files(project_path, include_gitignore)]
+    
+    def ingest_project_files(self, project_path: Union[str, Path], include_gitignore: bool = True, max_workers: int = 8,
+                             index: Optional[ScanIndex] = None) -> List[FileRecord]:
+        """
+        Stat, sniff, hash and score project text files in parallel
+        
+        Args:
+            project_path: Project path
+            include_gitignore: Whether to apply .gitignore filtering
+            max_workers: Worker threads
+            index: Scan index of the project, only files whose stat changed are re-inspected
+            
+        Returns:
+            List[FileRecord]: Records of the project's text files in walk order
+        """
         project_path = Path(project_path)
         
         if not project_path.exists():
             return []
         
-        files = []
-        gitignore_patterns = []
-        
-        # Read .gitignore file
-        if include_gitignore:
-            gitignore_path = project_path / ".gitignore"
-            gitignore_patterns = self.parse_gitignore(gitignore_path)
-        
-        # Traverse project files
-        for file_path in project_path.rglob("*"):
-            if file_path.is_file():
-                # If it's a text file and not ignored by .gitignore
-                if self.is_text_file(file_path):
-                    if not include_gitignore or not self.should_ignore_file(file_path, gitignore_patterns, project_path):
-                        files.append(file_path)
-        
-        return files 
\ No newline at end of file
+        # Single pass walk, ignored directories are pruned before descending;
+        # files are inspected on the pool while the walk continues
+        paths = walk_project_files(project_path, use_gitignore=include_gitignore)
+        if index is not None:
+            return index.scan(paths, max_workers)
+        return ingest_files(paths, max_workers, root=project_path)
@@ -0,0 +1,283 @@
+"""
+Gitignore matching module
+
+Provides gitignore pattern matching and a project walker that prunes
+ignored directories before descending into them.
+"""
+
+import os
+import re
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Pattern, Tuple, Union
+
+
+# Directories that are never part of the project content, including DuoReadme's own state
+ALWAYS_SKIP_DIRS = {".git", ".duoreadme"}
+
+
+def _translate_glob(pattern: str) -> str:
+    """
+    Translate the glob part of a gitignore pattern into a regular expression
+
+    Args:
+        pattern: Pattern without negation, leading or trailing slash
+
+    Returns:
+        str: Regular expression source without anchors
+    """
+    result = []
+    i = 0
+    length = len(pattern)
+
+    while i < length:
+        char = pattern[i]
+
+        if char == '*':
+            if pattern.startswith('**', i):
+                at_start = i == 0 or pattern[i - 1] == '/'
+                at_end = i + 2 == length
+                followed_by_slash = i + 2 < length and pattern[i + 2] == '/'
+                if at_start and followed_by_slash:
+                    # "**/" matches zero or more directories
+                    result.append('(?:.*/)?')
+                    i += 3
+                    continue
+                if at_start and at_end:
+                    # Trailing "/**" matches everything inside
+                    result.append('.*')
+                    i += 2
+                    continue
+                # Any other "**" behaves like a regular "*"
+                result.append('[^/]*')
+                i += 2
+                continue
+            result.append('[^/]*')
+        elif char == '?':
+            result.append('[^/]')
+        elif char == '[':
+            end = i + 1
+            if end < length and pattern[end] in '!^':
+                end += 1
+            if end < length and pattern[end] == ']':
+                end += 1
+            while end < length and pattern[end] != ']':
+                end += 1
+            if end >= length:
+                # Unterminated class is a literal bracket
+                result.append(re.escape(char))
+            else:
+                body = pattern[i + 1:end]
+                if body[:1] in ('!', '^'):
+                    body = '^' + body[1:]
+                result.append('[' + body.replace('\\', '\\\\') + ']')
+                i = end
+        elif char == '\\' and i + 1 < length:
+            i += 1
+            result.append(re.escape(pattern[i]))
+        else:
+            result.append(re.escape(char))
+        i += 1
+
+    return ''.join(result)
+
+
+def compile_pattern(line: str) -> Optional[Tuple[str, bool, bool]]:
+    """
+    Compile one gitignore line
+
+    Args:
+        line: Raw line from a .gitignore file
+
+    Returns:
+        Optional[Tuple[str, bool, bool]]: (regex source, negated, directory only), None for blank lines and comments
+    """
+    line = line.rstrip('\n').rstrip('\r')
+
+    # Trailing spaces are ignored unless escaped with a backslash
+    stripped = line.rstrip(' ')
+    if stripped.endswith('\\') and len(stripped) < len(line):
+        stripped += ' '
+    line = stripped
+
+    if not line or line.startswith('#'):
+        return None
+
+    negated = line.startswith('!')
+    if negated:
+        line = line[1:]
+
+    dir_only = line.endswith('/')
+    line = line.rstrip('/')
+    if not line:
+        return None
+
+    # A slash at the beginning or in the middle anchors the pattern to the .gitignore directory
+    anchored = '/' in line
+    line = line.lstrip('/')
+
+    regex = _translate_glob(line)
+    if not anchored and not regex.startswith('(?:.*/)?'):
+        regex = '(?:.*/)?' + regex
+
+    return regex, negated, dir_only
+
+
+class GitIgnoreSpec:
+    """Compiled patterns of a single .gitignore file"""
+
+    def __init__(self, lines: Iterable[str]):
+        """
+        Initialize gitignore spec
+
+        Args:
+            lines: Lines of a .gitignore file
+        """
+        self.patterns: List[Tuple[str, bool, bool]] = []
+        for line in lines:
+            compiled = compile_pattern(line)
+            if compiled:
+                self.patterns.append(compiled)
+
+        self._dir_regex, self._dir_negated = self._combine(self.patterns)
+        self._file_regex, self._file_negated = self._combine([p for p in self.patterns if not p[2]])
+
+    @classmethod
+    def from_file(cls, gitignore_path: Union[str, Path]) -> "GitIgnoreSpec":
+        """
+        Load spec from a .gitignore file
+
+        Args:
+            gitignore_path: .gitignore file path
+
+        Returns:
+            GitIgnoreSpec: Compiled spec, empty if the file cannot be read
+        """
+        try:
+            with open(gitignore_path, 'r', encoding='utf-8', errors='replace') as f:
+                return cls(f.readlines())
+        except OSError as e:
+            print(f"Warning: Failed to read .gitignore file: {e}")
+            return cls([])
+
+    @staticmethod
+    def _combine(patterns: List[Tuple[str, bool, bool]]) -> Tuple[Optional[Pattern], List[bool]]:
+        """
+        Combine patterns into a single regular expression
+
+        Alternatives are added in reverse order so that the first matching
+        alternative is the last matching pattern, which decides the result.
+        """
+        if not patterns:
+            return None, []
+
+        alternatives = []
+        negated = []
+        for index, (regex, is_negated, _) in enumerate(reversed(patterns)):
+            alternatives.append(f'(?P<p{index}>{regex})')
+            negated.append(is_negated)
+
+        return re.compile('^(?:' + '|'.join(alternatives) + ')$', re.DOTALL), negated
+
+    def match(self, relative_path: str, is_dir: bool = False) -> Optional[bool]:
+        """
+        Match a path against this spec
+
+        Args:
+            relative_path: Path relative to the .gitignore directory, using forward slashes
+            is_dir: Whether the path is a directory
+
+        Returns:
+            Optional[bool]: True if ignored, False if re-included by a negation, None if no pattern matches
+        """
+        regex, negated = (self._dir_regex, self._dir_negated) if is_dir else (self._file_regex, self._file_negated)
+        if regex is None:
+            return None
+
+        match = regex.match(relative_path)
+        if not match:
+            return None
+        return not negated[int(match.lastgroup[1:])]
+
+    def is_ignored(self, relative_path: str, is_dir: bool = False) -> bool:
+        """
+        Check whether a path or any of its parent directories is ignored
+
+        Args:
+            relative_path: Path relative to the .gitignore directory, using forward slashes
+            is_dir: Whether the path is a directory
+
+        Returns:
+            bool: Whether the path is ignored
+        """
+        parts = relative_path.strip('/').split('/')
+        for depth in range(1, len(parts)):
+            if self.match('/'.join(parts[:depth]), is_dir=True):
+                return True
+        return bool(self.match('/'.join(parts), is_dir=is_dir))
+
+
+def _is_ignored(relative_path: str, is_dir: bool, specs: List[Tuple[str, GitIgnoreSpec]]) -> bool:
+    """Check a path against nested specs, deeper .gitignore files take precedence"""
+    for prefix, spec in reversed(specs):
+        result = spec.match(relative_path[len(prefix):], is_dir)
+        if result is not None:
+            return result
+    return False
+
+
+def walk_project_files(project_path: Union[str, Path], use_gitignore: bool = True) -> Iterator[Path]:
+    """
+    Walk project files in a single pass, pruning ignored directories
+
+    Nested .gitignore files apply to their own directory and below, and
+    .git/info/exclude applies to the whole project.
+
+    Args:
+        project_path: Project root directory
+        use_gitignore: Whether to apply .gitignore rules
+
+    Yields:
+        Path: Paths of files that are not ignored
+    """
+    root = Path(project_path)
+    if not root.is_dir():
+        return
+
+    root_specs: List[Tuple[str, GitIgnoreSpec]] = []
+    if use_gitignore:
+        exclude_path = root / ".git" / "info" / "exclude"
+        if exclude_path.is_file():
+            root_specs.append(("", GitIgnoreSpec.from_file(exclude_path)))
+
+    stack = [(str(root), "", root_specs)]
+
+    while stack:
+        dir_path, prefix, specs = stack.pop()
+
+        try:
+            with os.scandir(dir_path) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            continue
+
+        if use_gitignore and any(entry.name == ".gitignore" for entry in entries):
+            specs = specs + [(prefix, GitIgnoreSpec.from_file(os.path.join(dir_path, ".gitignore")))]
+
+        subdirs = []
+        for entry in entries:
+            relative_path = prefix + entry.name
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name in ALWAYS_SKIP_DIRS:
+                        continue
+                    if use_gitignore and _is_ignored(relative_path, True, specs):
+                        continue
+                    subdirs.append((entry.path, relative_path + "/", specs))
+                elif entry.is_file():
+                    if use_gitignore and _is_ignored(relative_path, False, specs):
+                        continue
+                    yield Path(entry.path)
+            except OSError:
+                continue
+
+        stack.extend(reversed(subdirs))
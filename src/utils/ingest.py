@@ -0,0 +1,165 @@
+"""
+Project ingestion module
+
+Stats, sniffs, hashes and scores project files on a worker pool and keeps
+only a compact record per file, so large projects and slow filesystems
+are scanned in parallel with bounded memory.
+"""
+
+import hashlib
+import os
+import stat
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, Optional, TypeVar, Union
+
+from .logger import debug
+from .text_detect import SNIFF_SIZE, TEXT_EXTENSIONS, looks_like_text
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Source language by extension, used to describe the project
+LANGUAGES = {
+    '.py': 'Python', '.js': 'JavaScript', '.jsx': 'JavaScript', '.ts': 'TypeScript', '.tsx': 'TypeScript',
+    '.go': 'Go', '.rs': 'Rust', '.java': 'Java', '.kt': 'Kotlin', '.swift': 'Swift', '.rb': 'Ruby',
+    '.php': 'PHP', '.c': 'C', '.h': 'C', '.cpp': 'C++', '.hpp': 'C++', '.cs': 'C#', '.sh': 'Shell',
+    '.html': 'HTML', '.css': 'CSS', '.md': 'Markdown', '.json': 'JSON', '.yaml': 'YAML', '.yml': 'YAML',
+    '.toml': 'TOML', '.xml': 'XML', '.ini': 'INI', '.cfg': 'INI', '.conf': 'INI', '.txt': 'Text'
+}
+
+# Read size while hashing, also the most file content held in memory per worker
+CHUNK_SIZE = 64 * 1024
+
+# File name keywords and their importance, see score_file()
+SCORE_KEYWORDS = (
+    (('main', 'core', 'translator', 'generator', 'parser'), 100),
+    (('config', 'settings', 'setup'), 80),
+    (('utils', 'helpers', 'tools'), 60),
+    (('models', 'types', 'schema'), 50),
+    (('services', 'api', 'client'), 40),
+    (('cli', 'commands'), 30),
+    (('test', 'spec'), 10),
+)
+
+
+@dataclass
+class FileRecord:
+    """Compact description of a project file"""
+    path: Path
+    size: int
+    mtime: float
+    hash: str
+    language: str
+    score: int
+
+
+def score_file(path: Path) -> int:
+    """
+    Score how important a file is for describing the project
+
+    Core, configuration and utility files score highest, tests lowest, and
+    every path component costs 5 points so shallow files are preferred.
+
+    Args:
+        path: File path, preferably relative to the project root
+
+    Returns:
+        int: Importance score
+    """
+    file_name = path.name.lower()
+    score = 0
+    for keywords, points in SCORE_KEYWORDS:
+        if any(keyword in file_name for keyword in keywords):
+            score += points
+    return score - len(path.parts) * 5
+
+
+def inspect_file(path: Union[str, Path], root: Optional[Path] = None) -> Optional[FileRecord]:
+    """
+    Stat, sniff and hash a single file
+
+    The file is read in chunks, the first chunk doubles as the text sniff.
+
+    Args:
+        path: File path
+        root: Project root, scores use the depth below it
+
+    Returns:
+        Optional[FileRecord]: File record, None for missing, special or binary files
+    """
+    path = Path(path)
+    try:
+        st = os.stat(path)
+        if not stat.S_ISREG(st.st_mode):
+            return None
+
+        known_text = path.suffix.lower() in TEXT_EXTENSIONS
+        digest = hashlib.blake2b(digest_size=16)
+        with open(path, 'rb') as f:
+            chunk = f.read(CHUNK_SIZE)
+            if not known_text and not looks_like_text(chunk[:SNIFF_SIZE], truncated=st.st_size > SNIFF_SIZE):
+                return None
+            while chunk:
+                digest.update(chunk)
+                chunk = f.read(CHUNK_SIZE)
+    except OSError:
+        return None
+
+    return FileRecord(
+        path=path,
+        size=st.st_size,
+        mtime=st.st_mtime,
+        hash=digest.hexdigest(),
+        language=LANGUAGES.get(path.suffix.lower(), ''),
+        score=score_file(path.relative_to(root) if root is not None else path)
+    )
+
+
+def bounded_map(func: Callable[[T], R], items: Iterable[T], max_workers: int = 8, window: Optional[int] = None) -> Iterator[R]:
+    """
+    Map a function over items on a thread pool, yielding results in order
+
+    Unlike Executor.map the items are consumed lazily and at most `window`
+    calls are in flight, so neither the input nor pending results grow
+    with the number of items.
+
+    Args:
+        func: Function to apply
+        items: Input items, may be a generator
+        max_workers: Worker threads
+        window: Calls in flight, defaults to four per worker
+
+    Yields:
+        R: Results in input order
+    """
+    max_workers = max(1, int(max_workers))
+    window = window or max_workers * 4
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="duoreadme-ingest") as executor:
+        pending = deque()
+        for item in items:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def ingest_files(paths: Iterable[Union[str, Path]], max_workers: int = 8, root: Optional[Path] = None) -> List[FileRecord]:
+    """
+    Inspect files in parallel
+
+    Args:
+        paths: File paths, e.g. from walk_project_files()
+        max_workers: Worker threads
+        root: Project root the paths are below
+
+    Returns:
+        List[FileRecord]: Records of the text files, in input order
+    """
+    records = [record for record in bounded_map(lambda path: inspect_file(path, root), paths, max_workers) if record is not None]
+    debug(lambda: f"Ingested {len(records)} text files ({sum(record.size for record in records)} bytes)")
+    return records
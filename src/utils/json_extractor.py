@@ -6,7 +6,17 @@ Used to extract JSON content from various response formats.
 
 import re
 import json
-from typing import Dict, Any, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Characters the scanner has to look at, everything else is skipped by the regex engine
+_OBJECT_START = re.compile(r'\{')
+_STRUCTURAL = re.compile(r'[{}\[\]",]')
+_STRING_REST = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_CODE_BLOCK_MARKER = re.compile(r'```json')
+_CONTROL_CHARS = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]')
+# Literal newlines and tabs inside strings are common in model output, so decoding is not strict
+_DECODER = json.JSONDecoder(strict=False)
 
 
 class JSONExtractor:
@@ -17,6 +27,12 @@ class JSONExtractor:
         """
         Extract JSON content from response text
         
+        The text is scanned once for top-level JSON object spans. Spans after a
+        ```json marker are tried first, then the others in order, and a
+        truncated trailing object is recovered from the same scan. Only when an
+        unmatched brace before the marker swallowed the code block is the block
+        scanned again on its own.
+        
         Args:
             response_text: Response text
             
@@ -25,23 +41,45 @@ class JSONExtractor:
         """
         if not response_text or not response_text.strip():
             return None
+        
+        text = JSONExtractor._clean_json_text(response_text)
+        marker = _CODE_BLOCK_MARKER.search(text)
+        block_start = marker.end() if marker else -1
+        
+        json_data, truncated_start = JSONExtractor._extract_from(text, 0, block_start)
+        if json_data is None and truncated_start != -1 and truncated_start < block_start:
+            # A stray brace in the prose swallowed the code block, scan the block on its own
+            json_data, _ = JSONExtractor._extract_from(text, block_start, block_start)
+        
+        return json_data
+    
+    @staticmethod
+    def _extract_from(text: str, offset: int, block_start: int) -> Tuple[Optional[Dict[str, Any]], int]:
+        """
+        Decode the best JSON object found from offset on
+        
+        Args:
+            text: Cleaned response text
+            offset: Position to start scanning at
+            block_start: End of the ```json marker, -1 if there is none
             
-        # Method 1: Try to extract JSON code block
-        json_data = JSONExtractor._extract_json_code_block(response_text)
-        if json_data:
-            return json_data
-            
-        # Method 2: Try to extract complete JSON object
-        json_data = JSONExtractor._extract_complete_json_object(response_text)
-        if json_data:
-            return json_data
-            
-        # Method 3: Try to fix and parse incomplete JSON
-        json_data = JSONExtractor._extract_and_fix_incomplete_json(response_text)
-        if json_data:
-            return json_data
-            
-        return None
+        Returns:
+            Tuple[Optional[Dict[str, Any]], int]: (JSON data or None, start of a truncated trailing object or -1)
+        """
+        spans, truncated = JSONExtractor._scan_objects(text, offset)
+        
+        if block_start != -1:
+            # Prefer the object of the ```json code block, keep document order otherwise
+            spans.sort(key=lambda span: span[0] < block_start)
+        
+        for start, end in spans:
+            json_data = JSONExtractor._decode_object(text, start, end)
+            if json_data is not None:
+                return json_data, -1
+        
+        if truncated:
+            return JSONExtractor._recover_truncated(text, *truncated), truncated[0]
+        return None, -1
     
     @staticmethod
     def _clean_json_text(json_text: str) -> str:
@@ -50,152 +88,108 @@ class JSONExtractor:
         # Replace \r with empty string
         json_text = json_text.replace('\r', '')
         # Remove other control characters
-        json_text = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]', '', json_text)
+        json_text = _CONTROL_CHARS.sub('', json_text)
         return json_text
     
     @staticmethod
-    def _extract_json_code_block(response_text: str) -> Optional[Dict[str, Any]]:
-        """Extract JSON from code block"""
-        # Find ```json marker
-        json_start_match = re.search(r'```json\s*', response_text, re.DOTALL)
-        if json_start_match:
-            # Start from after ```json
-            content_start = json_start_match.end()
-            # Find the JSON object by brace matching (handles nested ``` in content)
-            remaining = response_text[content_start:]
+    def _scan_objects(text: str, offset: int = 0) -> Tuple[List[Tuple[int, int]], Optional[Tuple[int, int, bool]]]:
+        """
+        Find top-level JSON object spans in a single pass
+        
+        Args:
+            text: Cleaned response text
+            offset: Position to start scanning at
             
-            # Find the first { which starts the JSON
-            brace_start = remaining.find('{')
-            if brace_start != -1:
-                # Use brace matching to find complete JSON
-                brace_count = 0
+        Returns:
+            Tuple: (complete (start, end) spans, (start, last top-level comma, inside string) of a
+            trailing object that is never closed or None)
+        """
+        spans: List[Tuple[int, int]] = []
+        depth = 0
+        start = -1
+        last_comma = -1
+        in_string = False
+        position = offset
+        
+        while True:
+            if in_string:
+                # Jump straight to the closing quote, skipping escaped characters
+                match = _STRING_REST.match(text, position)
+                if not match:
+                    # Unterminated string, the object is truncated
+                    break
                 in_string = False
-                escape_next = False
-                json_end = -1
-                
-                for i in range(brace_start, len(remaining)):
-                    char = remaining[i]
-                    
-                    if escape_next:
-                        escape_next = False
-                        continue
-                    
-                    if char == '\\':
-                        escape_next = True
-                        continue
-                    
-                    if char == '"' and not escape_next:
-                        in_string = not in_string
-                        continue
-                    
-                    if not in_string:
-                        if char == '{':
-                            brace_count += 1
-                        elif char == '}':
-                            brace_count -= 1
-                            if brace_count == 0:
-                                json_end = i + 1
-                                break
-                
-                if json_end != -1:
-                    json_text = remaining[brace_start:json_end]
-                    json_text = JSONExtractor._clean_json_text(json_text)
-                    try:
-                        return json.loads(json_text)
-                    except json.JSONDecodeError as e:
-                        print(f"[DEBUG] JSON parse error: {e}")
-                        print(f"[DEBUG] JSON text length: {len(json_text)}")
+                position = match.end()
+                continue
+            
+            match = (_STRUCTURAL if depth else _OBJECT_START).search(text, position)
+            if not match:
+                break
+            index = match.start()
+            char = match.group()
+            position = index + 1
+            
+            if depth == 0:
+                # Outside objects only an opening brace matters, prose may contain anything else
+                start = index
+                last_comma = -1
+                depth = 1
+            elif char == '"':
+                in_string = True
+            elif char == ',':
+                if depth == 1:
+                    last_comma = index
+            elif char in '{[':
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    spans.append((start, index + 1))
         
-        return None
+        if depth == 0:
+            return spans, None
+        return spans, (start, last_comma, in_string)
     
     @staticmethod
-    def _extract_complete_json_object(response_text: str) -> Optional[Dict[str, Any]]:
-        """Extract complete JSON object"""
+    def _decode_object(text: str, start: int, end: int) -> Optional[Dict[str, Any]]:
+        """Decode the object at text[start:end], None if it is not valid JSON"""
         try:
-            # Find first { and last }
-            start = response_text.find('{')
-            if start == -1:
-                return None
-                
-            # Find matching closing brace
-            brace_count = 0
-            end = -1
-            for i in range(start, len(response_text)):
-                if response_text[i] == '{':
-                    brace_count += 1
-                elif response_text[i] == '}':
-                    brace_count -= 1
-                    if brace_count == 0:
-                        end = i + 1
-                        break
-            
-            if end != -1:
-                json_text = response_text[start:end]
-                json_text = JSONExtractor._clean_json_text(json_text)
-                return json.loads(json_text)
-        except (json.JSONDecodeError, IndexError):
-            pass
-        return None
+            json_data, decoded_end = _DECODER.raw_decode(text, start)
+        except json.JSONDecodeError:
+            return None
+        if decoded_end != end or not isinstance(json_data, dict):
+            return None
+        return json_data
     
     @staticmethod
-    def _extract_and_fix_incomplete_json(response_text: str) -> Optional[Dict[str, Any]]:
-        """Extract and fix incomplete JSON"""
-        try:
-            # Find JSON start position
-            json_start = response_text.find('"English readme"')
-            if json_start == -1:
-                return None
-                
-            # Look backward for object start
-            brace_start = response_text.rfind('{', 0, json_start)
-            if brace_start == -1:
-                return None
-                
-            # Try to find matching closing brace
-            brace_count = 0
-            brace_end = -1
-            for i in range(brace_start, len(response_text)):
-                if response_text[i] == '{':
-                    brace_count += 1
-                elif response_text[i] == '}':
-                    brace_count -= 1
-                    if brace_count == 0:
-                        brace_end = i + 1
-                        break
-            
-            if brace_end == -1:
-                # If no matching closing brace found, try to fix
-                return JSONExtractor._fix_truncated_json(response_text[brace_start:])
-            
-            json_text = response_text[brace_start:brace_end]
-            # Clean control characters
-            json_text = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', json_text)
-            return json.loads(json_text)
+    def _recover_truncated(text: str, start: int, last_comma: int, in_string: bool) -> Optional[Dict[str, Any]]:
+        """
+        Recover an object whose end was cut off
+        
+        Complete members before the last top-level comma are kept. Without such a
+        comma, an object truncated inside its first string value is closed as is.
+        
+        Args:
+            text: Cleaned response text
+            start: Start of the unclosed object
+            last_comma: Last comma separating top-level members, -1 if there is none
+            in_string: Whether the text ends inside a string
             
-        except (json.JSONDecodeError, IndexError):
+        Returns:
+            Optional[Dict[str, Any]]: Recovered JSON data, None if recovery fails
+        """
+        if last_comma != -1:
+            candidate = text[start:last_comma] + '}'
+        elif in_string:
+            candidate = text[start:] + '"}'
+        else:
             return None
-    
-    @staticmethod
-    def _fix_truncated_json(json_text: str) -> Optional[Dict[str, Any]]:
-        """Fix truncated JSON"""
+        
         try:
-            # Clean control characters
-            json_text = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', json_text)
-            
-            # If JSON is truncated, try to add necessary closing parts
-            if not json_text.endswith('}'):
-                # Find last complete key-value pair
-                last_comma = json_text.rfind(',')
-                if last_comma != -1:
-                    # Remove last comma and add closing brace
-                    json_text = json_text[:last_comma] + '}'
-                else:
-                    # If no comma, directly add closing brace
-                    json_text += '}'
-            
-            return json.loads(json_text)
-        except (json.JSONDecodeError, IndexError):
+            json_data = _DECODER.decode(candidate)
+        except json.JSONDecodeError:
             return None
+        return json_data if isinstance(json_data, dict) else None
     
     @staticmethod
     def extract_language_content(json_data: Dict[str, Any]) -> Dict[str, str]:
@@ -0,0 +1,37 @@
+"""
+Lazy import module
+
+Provides PEP 562 module attributes that import their module on first
+access, so importing a package does not load every submodule it exports.
+"""
+
+import importlib
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build the module __getattr__ and __dir__ of a package with lazy exports
+
+    Args:
+        package: Name of the package, i.e. its __name__
+        exports: Exported name to relative module mapping, e.g. {"Translator": ".translator"}
+
+    Returns:
+        Tuple[Callable[[str], Any], Callable[[], List[str]]]: (__getattr__, __dir__)
+    """
+    namespace = importlib.import_module(package).__dict__
+
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module, package), name)
+        # Cache on the package so later lookups skip this hook
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
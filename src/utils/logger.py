@@ -2,11 +2,20 @@
 Logging module
 
 Provides unified logging configuration and management.
+
+Messages are built only when their level is enabled: pass %-style
+arguments, debug("Event data: %s", data), or a callable returning the
+message, debug(lambda: json.dumps(payload, indent=2)). Use these instead
+of f-strings wherever the message is expensive or logged in a loop.
 """
 
 import logging
 import sys
-from typing import Optional
+from typing import Any, Callable, Optional, Union
+
+
+# A message, or a callable returning it that is only called when the level is enabled
+Message = Union[str, Callable[[], str]]
 
 
 class Logger:
@@ -49,25 +58,40 @@ class Logger:
         # Add handler to logger
         self._logger.addHandler(console_handler)
     
-    def debug(self, message: str):
+    def log(self, level: int, message: Message, *args: Any):
+        """
+        Output a log at the given level, building the message only if the level is enabled
+        
+        Args:
+            level: Logging level, e.g. logging.DEBUG
+            message: Message, %-style format with args, or a callable returning the message
+            *args: Arguments of a %-style format, formatted by logging
+        """
+        if not self._logger.isEnabledFor(level):
+            return
+        if callable(message):
+            message = message()
+        self._logger.log(level, message, *args)
+    
+    def debug(self, message: Message, *args: Any):
         """Output DEBUG level log"""
-        self._logger.debug(message)
+        self.log(logging.DEBUG, message, *args)
     
-    def info(self, message: str):
+    def info(self, message: Message, *args: Any):
         """Output INFO level log"""
-        self._logger.info(message)
+        self.log(logging.INFO, message, *args)
     
-    def warning(self, message: str):
+    def warning(self, message: Message, *args: Any):
         """Output WARNING level log"""
-        self._logger.warning(message)
+        self.log(logging.WARNING, message, *args)
     
-    def error(self, message: str):
+    def error(self, message: Message, *args: Any):
         """Output ERROR level log"""
-        self._logger.error(message)
+        self.log(logging.ERROR, message, *args)
     
-    def critical(self, message: str):
+    def critical(self, message: Message, *args: Any):
         """Output CRITICAL level log"""
-        self._logger.critical(message)
+        self.log(logging.CRITICAL, message, *args)
     
     def set_level(self, level: str):
         """Set log level"""
@@ -92,6 +116,10 @@ class Logger:
         """Disable debug mode, only output INFO and above level logs"""
         self.set_level('INFO')
     
+    def is_debug_enabled(self) -> bool:
+        """Whether DEBUG level logs are output"""
+        return self._logger.isEnabledFor(logging.DEBUG)
+    
     def get_logger(self) -> logging.Logger:
         """Get original logger object"""
         return self._logger
@@ -106,29 +134,29 @@ def get_logger() -> Logger:
     return logger
 
 
-def debug(message: str):
-    """Output DEBUG level log"""
-    logger.debug(message)
+def debug(message: Message, *args: Any):
+    """Output DEBUG level log, see the module docstring for lazy messages"""
+    logger.debug(message, *args)
 
 
-def info(message: str):
-    """Output INFO level log"""
-    logger.info(message)
+def info(message: Message, *args: Any):
+    """Output INFO level log, see the module docstring for lazy messages"""
+    logger.info(message, *args)
 
 
-def warning(message: str):
-    """Output WARNING level log"""
-    logger.warning(message)
+def warning(message: Message, *args: Any):
+    """Output WARNING level log, see the module docstring for lazy messages"""
+    logger.warning(message, *args)
 
 
-def error(message: str):
-    """Output ERROR level log"""
-    logger.error(message)
+def error(message: Message, *args: Any):
+    """Output ERROR level log, see the module docstring for lazy messages"""
+    logger.error(message, *args)
 
 
-def critical(message: str):
-    """Output CRITICAL level log"""
-    logger.critical(message)
+def critical(message: Message, *args: Any):
+    """Output CRITICAL level log, see the module docstring for lazy messages"""
+    logger.critical(message, *args)
 
 
 def enable_debug():
@@ -138,4 +166,9 @@ def enable_debug():
 
 def disable_debug():
     """Disable debug mode"""
-    logger.disable_debug() 
\ No newline at end of file
+    logger.disable_debug() 
+
+
+def is_debug_enabled() -> bool:
+    """Whether debug mode is enabled, to skip building expensive debug messages"""
+    return logger.is_debug_enabled()
@@ -0,0 +1,301 @@
+"""
+Metrics module
+
+Lightweight spans around pipeline stages and provider requests. Each span
+records its duration and numeric counters such as bytes in/out,
+prompt/completion tokens, retries and queue wait; the run is exported as
+JSON or as a Prometheus textfile.
+
+Spans nest through a context variable, so a request span opened while the
+"translate" stage runs records that stage as its parent, also on executor
+threads started with run_blocking().
+"""
+
+import json
+import math
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+
+# Prefix of exported Prometheus metric names
+METRIC_PREFIX = "duoreadme"
+
+
+@dataclass
+class Span:
+    """One timed stage or request"""
+
+    name: str
+    span_id: int
+    parent_id: Optional[int] = None
+    start: float = 0.0
+    duration: float = 0.0
+    error: Optional[str] = None
+    # Labels such as provider or language
+    labels: Dict[str, str] = field(default_factory=dict)
+    # Counters such as bytes_in, prompt_tokens or retries
+    counters: Dict[str, float] = field(default_factory=dict)
+
+    def add(self, counter: str, amount: float = 1):
+        """
+        Increase a counter
+
+        Args:
+            counter: Counter name, e.g. "retries"
+            amount: Amount to add
+        """
+        self.counters[counter] = self.counters.get(counter, 0) + amount
+
+    def set(self, **counters: float):
+        """Set counters, None values are ignored"""
+        for counter, value in counters.items():
+            if value is not None:
+                self.counters[counter] = value
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "id": self.span_id,
+            "parent": self.parent_id,
+            "start": round(self.start, 6),
+            "duration": round(self.duration, 6),
+            "error": self.error,
+            "labels": dict(self.labels),
+            "counters": dict(self.counters),
+        }
+
+
+class _NullSpan(Span):
+    """Span returned by current_span() outside any span, discards counters"""
+
+    def add(self, counter: str, amount: float = 1):
+        pass
+
+    def set(self, **counters: float):
+        pass
+
+
+_NULL_SPAN = _NullSpan("none", 0)
+_current: "ContextVar[Optional[Span]]" = ContextVar("duoreadme_current_span", default=None)
+
+
+class MetricsRecorder:
+    """Thread-safe collector of the spans of one run"""
+
+    def __init__(self):
+        """Initialize metrics recorder"""
+        self._lock = threading.Lock()
+        self._spans: List[Span] = []
+        self._next_id = 1
+        self.started = time.perf_counter()
+        self.started_at = time.time()
+
+    @contextmanager
+    def span(self, name: str, **labels: Any) -> Iterator[Span]:
+        """
+        Time a block of code
+
+        An exception escaping the block is recorded as the span's error and re-raised.
+
+        Args:
+            name: Span name, e.g. "translate" or "request"
+            **labels: Labels, converted to strings
+
+        Yields:
+            Span: The span, for adding counters
+        """
+        parent = _current.get()
+        with self._lock:
+            span_id = self._next_id
+            self._next_id += 1
+        span = Span(
+            name=name,
+            span_id=span_id,
+            parent_id=parent.span_id if parent is not None else None,
+            labels={key: str(value) for key, value in labels.items() if value is not None}
+        )
+        token = _current.set(span)
+        started = time.perf_counter()
+        span.start = started - self.started
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            span.duration = time.perf_counter() - started
+            _current.reset(token)
+            with self._lock:
+                self._spans.append(span)
+
+    @property
+    def spans(self) -> List[Span]:
+        """Finished spans in the order they finished"""
+        with self._lock:
+            return list(self._spans)
+
+    def reset(self):
+        """Drop recorded spans and restart the run clock"""
+        with self._lock:
+            self._spans.clear()
+            self._next_id = 1
+            self.started = time.perf_counter()
+            self.started_at = time.time()
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Aggregate spans by name
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Per span name the count, errors,
+                total/max/p50/p99 seconds and counter totals
+        """
+        grouped: Dict[str, List[Span]] = {}
+        for span in self.spans:
+            grouped.setdefault(span.name, []).append(span)
+
+        summary = {}
+        for name, spans in grouped.items():
+            durations = sorted(span.duration for span in spans)
+            counters: Dict[str, float] = {}
+            for span in spans:
+                for counter, value in span.counters.items():
+                    counters[counter] = counters.get(counter, 0) + value
+            summary[name] = {
+                "count": len(spans),
+                "errors": sum(1 for span in spans if span.error),
+                "seconds_total": round(sum(durations), 6),
+                "seconds_max": round(durations[-1], 6),
+                "seconds_p50": round(_percentile(durations, 0.5), 6),
+                "seconds_p99": round(_percentile(durations, 0.99), 6),
+                "counters": counters,
+            }
+        return summary
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Export the run
+
+        Returns:
+            Dict[str, Any]: Start time, wall time, per-stage summary and all spans
+        """
+        return {
+            "started_at": self.started_at,
+            "wall_seconds": round(time.perf_counter() - self.started, 6),
+            "stages": self.summary(),
+            "spans": [span.to_dict() for span in sorted(self.spans, key=lambda span: span.start)],
+        }
+
+    def to_prometheus(self) -> str:
+        """
+        Export the per-stage summary in the Prometheus text format
+
+        Returns:
+            str: Metrics text, one series per span name
+        """
+        summary = self.summary()
+        lines = [
+            f"# HELP {METRIC_PREFIX}_run_seconds Wall time of the run",
+            f"# TYPE {METRIC_PREFIX}_run_seconds gauge",
+            f"{METRIC_PREFIX}_run_seconds {time.perf_counter() - self.started:.6f}",
+            f"# HELP {METRIC_PREFIX}_run_timestamp_seconds Start of the run",
+            f"# TYPE {METRIC_PREFIX}_run_timestamp_seconds gauge",
+            f"{METRIC_PREFIX}_run_timestamp_seconds {self.started_at:.3f}",
+        ]
+        series = [
+            ("span_seconds_total", "Time spent in spans", lambda stage: stage["seconds_total"]),
+            ("spans_total", "Finished spans", lambda stage: stage["count"]),
+            ("span_errors_total", "Spans that failed", lambda stage: stage["errors"]),
+        ]
+        for metric, help_text, value in series:
+            lines.append(f"# HELP {METRIC_PREFIX}_{metric} {help_text}")
+            lines.append(f"# TYPE {METRIC_PREFIX}_{metric} counter")
+            for name, stage in summary.items():
+                lines.append(f'{METRIC_PREFIX}_{metric}{{span="{name}"}} {value(stage)}')
+
+        counter_names = sorted({counter for stage in summary.values() for counter in stage["counters"]})
+        for counter in counter_names:
+            metric = f"{METRIC_PREFIX}_{counter}_total"
+            lines.append(f"# HELP {metric} Sum of {counter} over spans")
+            lines.append(f"# TYPE {metric} counter")
+            for name, stage in summary.items():
+                if counter in stage["counters"]:
+                    lines.append(f'{metric}{{span="{name}"}} {stage["counters"][counter]}')
+        return "\n".join(lines) + "\n"
+
+    def write_json(self, path: Union[str, Path]):
+        """
+        Write the run as JSON
+
+        Args:
+            path: Output file path
+        """
+        _write_atomic(path, json.dumps(self.to_dict(), ensure_ascii=False, indent=2))
+
+    def write_prometheus(self, path: Union[str, Path]):
+        """
+        Write the run as a Prometheus textfile
+
+        The file is replaced atomically, as the node exporter textfile collector requires.
+
+        Args:
+            path: Output file path, conventionally ending in .prom
+        """
+        _write_atomic(path, self.to_prometheus())
+
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of sorted samples"""
+    if not ordered:
+        return 0.0
+    return ordered[max(0, min(len(ordered) - 1, math.ceil(fraction * len(ordered)) - 1))]
+
+
+def _write_atomic(path: Union[str, Path], text: str):
+    """Write a text file through a temporary file"""
+    from .file_utils import AtomicFileWriter
+
+    with AtomicFileWriter(path) as writer:
+        writer.write(text)
+
+
+_recorder = MetricsRecorder()
+
+
+def get_metrics() -> MetricsRecorder:
+    """
+    Get the process-wide metrics recorder
+
+    Returns:
+        MetricsRecorder: Shared recorder
+    """
+    return _recorder
+
+
+def span(name: str, **labels: Any):
+    """
+    Time a block of code with the process-wide recorder
+
+    Args:
+        name: Span name, e.g. "translate" or "request"
+        **labels: Labels, converted to strings
+
+    Returns:
+        ContextManager[Span]: Context manager yielding the span
+    """
+    return _recorder.span(name, **labels)
+
+
+def current_span() -> Span:
+    """
+    Get the innermost open span
+
+    Returns:
+        Span: Open span, or a span that discards counters outside any span
+    """
+    return _current.get() or _NULL_SPAN
@@ -0,0 +1,82 @@
+"""
+Repetition collapse module
+
+Collapses runs of a repeated unit ("abcabcabc" -> "abc") in model output
+without backtracking regular expressions.
+"""
+
+# Longest unit considered, longer repeated blocks are left untouched
+MAX_UNIT = 64
+
+
+def _collapse_line(line: str, min_unit: int, min_copies: int, max_unit: int) -> str:
+    """Collapse repeated units within a single line"""
+    length = len(line)
+    if length < min_unit * min_copies:
+        return line
+
+    parts = []
+    emitted = 0
+    i = 0
+    last_start = length - min_unit * min_copies
+
+    # A run of at least three copies of a unit of length L has period L over 3L >= L + 2 * min_unit
+    # characters, so the first 2 * min_unit characters reappear L characters later
+    probe_length = min_unit * min(2, min_copies - 1)
+
+    while i <= last_start:
+        probe = line[i:i + probe_length]
+        window_end = i + (length - i) // min_copies
+        if window_end > i + max_unit:
+            window_end = i + max_unit
+        window_end += probe_length
+
+        # Every unit length that can repeat here starts another copy of the probe,
+        # so candidates are exactly the probe occurrences, shortest first
+        j = line.find(probe, i + min_unit, window_end)
+        while j != -1:
+            unit_length = j - i
+            unit = line[i:j]
+            copies = 1
+            while copies < min_copies and line.startswith(unit, i + copies * unit_length):
+                copies += 1
+            if copies == min_copies:
+                end = i + min_copies * unit_length
+                while line.startswith(unit, end):
+                    end += unit_length
+                parts.append(line[emitted:j])
+                emitted = end
+                i = end
+                break
+            j = line.find(probe, j + 1, window_end)
+        else:
+            i += 1
+
+    if not parts:
+        return line
+    parts.append(line[emitted:])
+    return "".join(parts)
+
+
+def collapse_repeated_units(text: str, min_unit: int = 2, min_copies: int = 3, max_unit: int = MAX_UNIT) -> str:
+    """
+    Replace runs of a unit repeated at least min_copies times by a single unit
+
+    Matches the semantics of re.sub(r'(.{2,}?)\\1{2,}', r'\\1', text) for units of
+    up to max_unit characters: scanning left to right, the shortest repeating
+    unit at each position wins, copies are taken greedily, and units never
+    span a newline. Each position costs one bounded substring search, so the
+    running time is linear in the text length for a fixed max_unit.
+
+    Args:
+        text: Text to clean
+        min_unit: Minimum unit length
+        min_copies: Minimum number of consecutive copies to collapse
+        max_unit: Maximum unit length
+
+    Returns:
+        str: Cleaned text
+    """
+    if '\n' not in text:
+        return _collapse_line(text, min_unit, min_copies, max_unit)
+    return '\n'.join(_collapse_line(line, min_unit, min_copies, max_unit) for line in text.split('\n'))
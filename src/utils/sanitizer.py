@@ -0,0 +1,290 @@
+"""
+Output sanitizer module
+
+Cleans prompt contamination and degenerate repetitions from model output in
+a single streaming pass over lines.
+"""
+
+import re
+from typing import List, Optional, Pattern, Tuple
+
+from .repetition import collapse_repeated_units
+
+
+# Prompt echoes at the very beginning of the output
+PREFIX_PATTERNS: Tuple[Pattern, ...] = (
+    re.compile(r'^Please translate.*?(?:format|日本語)[:\s]*\n*', re.IGNORECASE | re.DOTALL),
+    re.compile(r'^Original text:\s*', re.IGNORECASE),
+    re.compile(r'^Translate.*?:\s*\n*', re.IGNORECASE),
+)
+
+# Language headers the model adds before the translated document
+LANGUAGE_HEADER = re.compile(r'^#{1,3}\s*(中文|English|日本語|简体中文|繁體中文|Japanese|Chinese)', re.IGNORECASE)
+FENCE_LINES = frozenset(('```', '```markdown'))
+
+# Repetition patterns applied to every line
+WORD_REPETITION = re.compile(r'\b(\w+(?:\s+\w+)?)\s+(?:\1\s*){2,}')
+# The group stops at the first "]" so badge-heavy lines stay linear
+BRACKET_REPETITION = re.compile(r'(\[[^\]\n]*\])\s*(?:\1\s*){1,}')
+PHRASE_REPETITIONS: Tuple[Tuple[Pattern, str], ...] = (
+    (re.compile(r'(ます){3,}'), 'ます'),
+    (re.compile(r'(です){3,}'), 'です'),
+    (re.compile(r'(ですが){2,}'), 'ですが'),
+    (re.compile(r'(しかし){2,}'), 'しかし'),
+    (re.compile(r'(However\s*){2,}'), 'However '),
+)
+
+# "(Note: ...)" remarks the model adds
+NOTE = re.compile(r'[ \t]*\(Note:.*?\)')
+
+# Prompt rules echoed at the end, everything from here on is dropped
+CRITICAL_RULES = re.compile(r'CRITICAL RULES', re.IGNORECASE)
+ECHOED_RULE = re.compile(r'^\s*(?:[-*]\s*)?(?:Do NOT|ONLY|Keep exact|Start directly)')
+
+# Repeated "Requirements: ... structure." blocks
+REQUIREMENTS_START = re.compile(r'^\s*Requirements:')
+REQUIREMENTS_END = re.compile(r'structure\.\s*$')
+
+
+def remove_repetitions(line: str) -> str:
+    """
+    Remove word/phrase repetitions within a line
+
+    Args:
+        line: Line of model output
+
+    Returns:
+        str: Cleaned line
+    """
+    # Match patterns like "word word word word" (3+ repetitions)
+    result = WORD_REPETITION.sub(r'\1', line)
+
+    # Match patterns like "[-o file.yaml] [-o file.yaml] [-o file.yaml]"
+    result = BRACKET_REPETITION.sub(r'\1', result)
+
+    # Japanese repetition patterns (ますます, ですがですが, しかししかし, etc.)
+    for pattern, replacement in PHRASE_REPETITIONS:
+        result = pattern.sub(replacement, result)
+
+    # Generic: any 2+ char sequence repeated 3+ times
+    return collapse_repeated_units(result)
+
+
+class OutputSanitizer:
+    """
+    Streaming cleaner for translated documents
+
+    Feed raw output chunks with feed() and collect the returned text, then call
+    finish() once. The concatenated result equals sanitize() on the whole text.
+    Providers pick a sanitizer through TranslationProvider.sanitizer_class and
+    subclasses can override clean_line() or the pattern attributes.
+    """
+
+    prefix_patterns = PREFIX_PATTERNS
+    language_header = LANGUAGE_HEADER
+
+    # Prefix patterns only look at this many leading characters
+    HEAD_SIZE = 2048
+    # Longest "Requirements:" block held back to detect a repetition
+    MAX_BLOCK_LINES = 50
+
+    def __init__(self):
+        """Initialize sanitizer state"""
+        self._head: Optional[List[str]] = []
+        self._head_size = 0
+        self._partial: List[str] = []
+        self._at_start = True
+        self._done = False
+        # Whitespace and a trailing fence held back until more content follows
+        self._pending = ""
+        self._pending_fence = False
+        self._emitted = False
+        self._block: Optional[List[str]] = None
+        self._last_block: Optional[List[str]] = None
+
+    @classmethod
+    def sanitize(cls, text: str) -> str:
+        """
+        Clean a complete document
+
+        Args:
+            text: Raw model output
+
+        Returns:
+            str: Cleaned document
+        """
+        sanitizer = cls()
+        return sanitizer.feed(text) + sanitizer.finish()
+
+    def clean_line(self, line: str) -> str:
+        """
+        Clean a single content line
+
+        Args:
+            line: Line without newline
+
+        Returns:
+            str: Cleaned line
+        """
+        return remove_repetitions(line)
+
+    def feed(self, chunk: str) -> str:
+        """
+        Process a chunk of raw output
+
+        Args:
+            chunk: Raw output chunk
+
+        Returns:
+            str: Cleaned text that is final, may be empty
+        """
+        if self._done or not chunk:
+            return ""
+
+        if self._head is not None:
+            # Hold the beginning back until the prefix patterns can be applied
+            self._head.append(chunk)
+            self._head_size += len(chunk)
+            if self._head_size < self.HEAD_SIZE:
+                return ""
+            chunk = self._release_head()
+
+        newline = chunk.find('\n')
+        if newline == -1:
+            self._partial.append(chunk)
+            return ""
+
+        output: List[str] = []
+        start = 0
+        while newline != -1 and not self._done:
+            self._partial.append(chunk[start:newline])
+            line = "".join(self._partial)
+            self._partial = []
+            self._process_line(line, output)
+            start = newline + 1
+            newline = chunk.find('\n', start)
+        if not self._done and start < len(chunk):
+            self._partial.append(chunk[start:])
+        return "".join(output)
+
+    def finish(self) -> str:
+        """
+        Process the rest of the output
+
+        Returns:
+            str: Remaining cleaned text
+        """
+        output: List[str] = []
+        if self._head is not None:
+            rest = self._release_head()
+            if rest:
+                return self.feed(rest) + self.finish()
+        if not self._done and self._partial:
+            line = "".join(self._partial)
+            self._partial = []
+            self._process_line(line, output)
+        if self._block is not None:
+            self._flush_block(output)
+        self._done = True
+        # Trailing whitespace and a closing fence are dropped
+        self._pending = ""
+        return "".join(output)
+
+    def _release_head(self) -> str:
+        """Apply prefix patterns to the held back beginning"""
+        head = "".join(self._head)
+        self._head = None
+        for pattern in self.prefix_patterns:
+            head = pattern.sub('', head, count=1)
+        return head
+
+    def _process_line(self, line: str, output: List[str]):
+        """Clean one complete line and append final text to output"""
+        stripped = line.strip()
+
+        if self._at_start:
+            # Skip language headers, blank lines and code block wrappers at the beginning
+            if not stripped or stripped in FENCE_LINES or self.language_header.match(line):
+                return
+            self._at_start = False
+
+        critical = CRITICAL_RULES.search(line)
+        if critical or ECHOED_RULE.match(line):
+            # Keep the text before an inline "CRITICAL RULES", drop everything after
+            head = line[:critical.start()] if critical else ""
+            if self._block is not None:
+                self._flush_block(output)
+            if head.strip():
+                self._emit(head, output)
+            self._done = True
+            return
+
+        if self._block is not None:
+            self._block.append(line)
+            if REQUIREMENTS_END.search(line) or len(self._block) >= self.MAX_BLOCK_LINES:
+                self._flush_block(output)
+            return
+        if REQUIREMENTS_START.match(line):
+            self._block = [line]
+            if REQUIREMENTS_END.search(line):
+                self._flush_block(output)
+            return
+
+        if self._emit(line, output):
+            # Only directly repeated blocks are collapsed
+            self._last_block = None
+
+    def _flush_block(self, output: List[str]):
+        """Emit a captured "Requirements:" block unless it repeats the previous one"""
+        block, self._block = self._block, None
+        if block == self._last_block:
+            # Drop the repetition together with the whitespace before it
+            self._pending = self._pending.rstrip() + "\n" if self._pending_fence else "\n"
+            return
+        self._last_block = block
+        for line in block:
+            self._emit(line, output)
+
+    def _emit(self, line: str, output: List[str]) -> bool:
+        """Clean a content line and append it, holding back trailing whitespace
+
+        Returns:
+            bool: Whether the line still has content after cleaning
+        """
+        had_text = bool(line.strip())
+        line = self.clean_line(line)
+        if '(Note:' in line:
+            line = NOTE.sub('', line)
+            if had_text and not line.strip():
+                # The note and the whitespace before it are removed, its newline stays
+                self._pending = self._pending.rstrip() + "\n" if self._emitted else ""
+                return False
+
+        body = line.rstrip()
+        if not body:
+            if self._emitted:
+                self._pending += line + "\n"
+            return False
+
+        if body == '```':
+            if self._pending_fence:
+                # Another fence follows, so the held back one does not close the document
+                fence_end = self._pending.rindex('```') + 3
+                output.append(self._pending[:fence_end])
+                self._pending = self._pending[fence_end:]
+            # A fence may close the document, only emit it once more content follows
+            self._pending += body + line[len(body):] + "\n"
+            self._pending_fence = True
+            self._emitted = True
+            return True
+
+        trailing = line[len(body):]
+        if not self._emitted:
+            # The document starts without leading whitespace
+            body = body.lstrip()
+            self._emitted = True
+        output.append(self._pending)
+        output.append(body)
+        self._pending = trailing + "\n"
+        self._pending_fence = False
+        return True
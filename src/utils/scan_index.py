@@ -0,0 +1,278 @@
+"""
+Project scan index module
+
+Persists per-file scan results in .duoreadme/index.sqlite inside the
+project, so repeated scans only open files whose size or mtime changed.
+"""
+
+import json
+import os
+import sqlite3
+import stat
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from .ingest import FileRecord, bounded_map, inspect_file
+from .logger import debug, warning
+
+
+class _Row(NamedTuple):
+    """Stored scan result of one file"""
+    size: int
+    mtime_ns: int
+    hash: str
+    is_text: bool
+    language: str
+    score: int
+
+
+class ScanIndex:
+    """On-disk index of project files keyed by relative path, size and mtime"""
+
+    # Bump whenever the stored verdicts or excerpts would change for the same file
+    SCHEMA_VERSION = 5
+    DIR_NAME = ".duoreadme"
+    FILE_NAME = "index.sqlite"
+
+    def __init__(self, project_path: Union[str, Path], index_path: Optional[Union[str, Path]] = None):
+        """
+        Initialize scan index
+
+        Args:
+            project_path: Project root directory
+            index_path: Index database path, defaults to <project>/.duoreadme/index.sqlite
+
+        Raises:
+            sqlite3.Error: Database cannot be opened
+            OSError: Index directory cannot be created
+        """
+        self.project_path = Path(project_path)
+        self.index_path = Path(index_path) if index_path else self.project_path / self.DIR_NAME / self.FILE_NAME
+        self.hits = 0
+        self.misses = 0
+        # Walked paths are "<root>/<relative>", except below "." where pathlib drops the "./"
+        self._prefix_length = 0 if str(self.project_path) == "." else len(os.path.join(str(self.project_path), ""))
+        self._conn = self._connect()
+        self._rows = self._load_rows()
+
+    @classmethod
+    def open(cls, project_path: Union[str, Path]) -> Optional["ScanIndex"]:
+        """
+        Open the index of a project, tolerating read-only or broken locations
+
+        Args:
+            project_path: Project root directory
+
+        Returns:
+            Optional[ScanIndex]: Index instance, None if it cannot be used
+        """
+        try:
+            return cls(project_path)
+        except (sqlite3.Error, OSError) as e:
+            warning(f"⚠ Scan index unavailable, scanning without it: {e}")
+            return None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create or reset the schema"""
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        ignore_file = self.index_path.parent / ".gitignore"
+        if not ignore_file.exists():
+            # Keep the index out of version control
+            ignore_file.write_text("*\n", encoding="utf-8")
+
+        conn = sqlite3.connect(str(self.index_path))
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != self.SCHEMA_VERSION:
+            conn.executescript("""
+                DROP TABLE IF EXISTS files;
+                DROP TABLE IF EXISTS excerpts;
+                DROP TABLE IF EXISTS features;
+                CREATE TABLE files (
+                    path TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    hash TEXT NOT NULL,
+                    is_text INTEGER NOT NULL,
+                    language TEXT NOT NULL,
+                    score INTEGER NOT NULL
+                );
+                CREATE TABLE excerpts (
+                    path TEXT NOT NULL,
+                    max_length INTEGER NOT NULL,
+                    hash TEXT NOT NULL,
+                    excerpt TEXT NOT NULL,
+                    PRIMARY KEY (path, max_length)
+                );
+                CREATE TABLE features (
+                    path TEXT PRIMARY KEY,
+                    hash TEXT NOT NULL,
+                    data TEXT NOT NULL
+                );
+            """)
+            conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+            conn.commit()
+        return conn
+
+    def _load_rows(self) -> Dict[str, _Row]:
+        """Load all file rows, workers only read this snapshot"""
+        return {
+            path: _Row(size, mtime_ns, digest, bool(is_text), language, score)
+            for path, size, mtime_ns, digest, is_text, language, score
+            in self._conn.execute("SELECT path, size, mtime_ns, hash, is_text, language, score FROM files")
+        }
+
+    def _relative(self, path: Path) -> str:
+        """Get the index key of a path"""
+        # Plain string slicing, pathlib's relative_to dominates warm scans
+        key = str(path)[self._prefix_length:]
+        return key.replace(os.sep, "/") if os.sep != "/" else key
+
+    def _inspect(self, item) -> _Row:
+        """Inspect a new or changed file, runs on a worker thread"""
+        path, st = item
+        record = inspect_file(path, self.project_path)
+        if record is None:
+            # Binary or vanished, remember the verdict so it is not sniffed again
+            return _Row(st.st_size, st.st_mtime_ns, "", False, "", 0)
+        return _Row(st.st_size, st.st_mtime_ns, record.hash, True, record.language, record.score)
+
+    def scan(self, paths: Iterable[Path], max_workers: int = 8) -> List[FileRecord]:
+        """
+        Get records of the given files, inspecting only new and changed ones
+
+        Unchanged files cost one stat call. Files of earlier scans that are
+        not in paths are dropped from the index.
+
+        Args:
+            paths: File paths below the project root, e.g. from walk_project_files()
+            max_workers: Worker threads for inspecting changed files
+
+        Returns:
+            List[FileRecord]: Records of the text files, in input order
+        """
+        entries: List[Tuple[str, Path]] = []
+        changed = []
+        for path in paths:
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            if not stat.S_ISREG(st.st_mode):
+                continue
+
+            key = self._relative(path)
+            entries.append((key, path))
+            row = self._rows.get(key)
+            if row is None or row.size != st.st_size or row.mtime_ns != st.st_mtime_ns:
+                changed.append((key, path, st))
+
+        for (key, _, _), row in zip(changed, bounded_map(self._inspect, [(path, st) for _, path, st in changed], max_workers)):
+            self._rows[key] = row
+
+        seen = {key for key, _ in entries}
+        removed = [key for key in self._rows if key not in seen]
+        for key in removed:
+            del self._rows[key]
+
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO files (path, size, mtime_ns, hash, is_text, language, score) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(key, row.size, row.mtime_ns, row.hash, int(row.is_text), row.language, row.score)
+                 for key, row in ((key, self._rows[key]) for key, _, _ in changed)]
+            )
+            self._conn.executemany("DELETE FROM files WHERE path = ?", [(key,) for key in removed])
+            self._conn.executemany("DELETE FROM excerpts WHERE path = ?", [(key,) for key in removed])
+            self._conn.executemany("DELETE FROM features WHERE path = ?", [(key,) for key in removed])
+
+        self.misses = len(changed)
+        self.hits = len(entries) - self.misses
+        debug(f"Scan index: {self.hits} unchanged, {self.misses} inspected, {len(removed)} removed")
+
+        records = []
+        for key, path in entries:
+            row = self._rows[key]
+            if row.is_text:
+                records.append(FileRecord(
+                    path=path,
+                    size=row.size,
+                    mtime=row.mtime_ns / 1e9,
+                    hash=row.hash,
+                    language=row.language,
+                    score=row.score
+                ))
+        return records
+
+    def get_excerpt(self, record: FileRecord, max_length: int) -> Optional[str]:
+        """
+        Get the stored compressed excerpt of a file
+
+        Args:
+            record: File record from scan()
+            max_length: Compression budget the excerpt was made with
+
+        Returns:
+            Optional[str]: Excerpt, None if missing or made from other content
+        """
+        row = self._conn.execute(
+            "SELECT excerpt FROM excerpts WHERE path = ? AND max_length = ? AND hash = ?",
+            (self._relative(record.path), max_length, record.hash)
+        ).fetchone()
+        return row[0] if row else None
+
+    def set_excerpt(self, record: FileRecord, max_length: int, excerpt: str):
+        """
+        Store the compressed excerpt of a file
+
+        Args:
+            record: File record from scan()
+            max_length: Compression budget the excerpt was made with
+            excerpt: Compressed content
+        """
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO excerpts (path, max_length, hash, excerpt) VALUES (?, ?, ?, ?)",
+                (self._relative(record.path), max_length, record.hash, excerpt)
+            )
+
+    def get_features(self, records: List[FileRecord]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Get the stored ranking features of files
+
+        Args:
+            records: File records from scan()
+
+        Returns:
+            List[Optional[Dict[str, Any]]]: Features per record, None if missing or made from other content
+        """
+        stored = {
+            path: (digest, data)
+            for path, digest, data in self._conn.execute("SELECT path, hash, data FROM features")
+        }
+        features = []
+        for record in records:
+            digest, data = stored.get(self._relative(record.path), (None, None))
+            features.append(json.loads(data) if digest == record.hash else None)
+        return features
+
+    def set_features(self, items: List[Tuple[FileRecord, Dict[str, Any]]]):
+        """
+        Store ranking features of files
+
+        Args:
+            items: (file record, JSON-serializable features) pairs
+        """
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO features (path, hash, data) VALUES (?, ?, ?)",
+                [(self._relative(record.path), record.hash, json.dumps(data)) for record, data in items]
+            )
+
+    def close(self):
+        """Close the database"""
+        self._conn.close()
+
+    def __enter__(self) -> "ScanIndex":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
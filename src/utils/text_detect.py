@@ -0,0 +1,224 @@
+"""
+Text detection module
+
+Classifies files as text or binary from a small prefix, using git's NUL
+byte heuristic plus a UTF-8 validity check, and caches verdicts by inode
+and mtime so unchanged files are never opened twice.
+"""
+
+import os
+import stat
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+
+# Extensions treated as text without looking at the content
+TEXT_EXTENSIONS = frozenset({
+    '.txt', '.md', '.py', '.js', '.ts', '.html', '.css', '.json',
+    '.xml', '.yaml', '.yml', '.ini', '.cfg', '.conf', '.log'
+})
+
+# Bytes inspected to decide whether a file is text, same as git's FIRST_FEW_BYTES
+SNIFF_SIZE = 8000
+
+# Bytes counted as printable by the fallback for non-UTF-8 text: everything
+# except control characters other than \b \t \n \f \r and ESC, and DEL
+_NON_PRINTABLE = bytes(b for b in range(32) if b not in b"\b\t\n\f\r\x1b") + b"\x7f"
+_PRINTABLE = bytes(b for b in range(256) if b not in _NON_PRINTABLE)
+
+
+def looks_like_text(chunk: bytes, truncated: bool = False) -> bool:
+    """
+    Decide whether the beginning of a file looks like text
+
+    Content with a NUL byte is binary, valid UTF-8 is text. Anything else,
+    e.g. Latin-1 or GBK, is text when at most one byte in 128 is a control
+    character, like git's text statistics.
+
+    Args:
+        chunk: First bytes of the file
+        truncated: Whether the chunk was cut from a longer file, so a split
+            multi-byte sequence at its end is allowed
+
+    Returns:
+        bool: Whether the chunk looks like text
+    """
+    if b"\x00" in chunk:
+        return False
+    try:
+        chunk.decode("utf-8")
+        return True
+    except UnicodeDecodeError as e:
+        # A UTF-8 sequence split by the prefix cut is still valid text
+        if truncated and e.reason == "unexpected end of data" and e.end == len(chunk):
+            return True
+
+    non_printable = len(chunk.translate(None, _PRINTABLE))
+    return non_printable * 128 <= len(chunk) - non_printable
+
+
+def read_prefix(path: Union[str, Path], length: int = SNIFF_SIZE) -> bytes:
+    """
+    Read the first bytes of a file
+
+    Uses a raw descriptor and a single read() call, without a buffered
+    file object; mapping the file was measured slower for prefixes this small.
+
+    Args:
+        path: File path
+        length: Bytes to read at most
+
+    Returns:
+        bytes: File prefix
+
+    Raises:
+        OSError: File cannot be opened or read
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        return os.read(fd, length)
+    finally:
+        os.close(fd)
+
+
+class TextClassifier:
+    """Text/binary classifier with a verdict cache keyed by device, inode, mtime and size"""
+
+    # Verdicts kept before the cache is dropped and refilled
+    MAX_CACHE_ENTRIES = 100000
+
+    def __init__(self, sniff_size: int = SNIFF_SIZE):
+        """
+        Initialize text classifier
+
+        Args:
+            sniff_size: Bytes inspected per file
+        """
+        self.sniff_size = sniff_size
+        self.hits = 0
+        self.misses = 0
+        self._cache: Dict[Tuple, bool] = {}
+
+    def _lookup(self, path: Union[str, Path]) -> Tuple[Optional[bool], Optional[Tuple]]:
+        """Get the verdict of a file without reading it, or the cache key to read it for"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False, None
+        if not stat.S_ISREG(st.st_mode):
+            return False, None
+        if os.path.splitext(str(path))[1].lower() in TEXT_EXTENSIONS:
+            return True, None
+
+        # Some filesystems report no inode numbers, key those by path instead
+        key = (st.st_dev, st.st_ino or str(path), st.st_mtime_ns, st.st_size)
+        verdict = self._cache.get(key)
+        if verdict is not None:
+            self.hits += 1
+        return verdict, key
+
+    def _sniff(self, path: Union[str, Path], key: Tuple) -> bool:
+        """Read the prefix of a file and cache its verdict"""
+        self.misses += 1
+        try:
+            prefix = read_prefix(path, self.sniff_size)
+        except OSError:
+            return False
+        # key[3] is the size from stat
+        verdict = looks_like_text(prefix, truncated=key[3] > len(prefix))
+
+        if len(self._cache) >= self.MAX_CACHE_ENTRIES:
+            self._cache.clear()
+        self._cache[key] = verdict
+        return verdict
+
+    def classify(self, path: Union[str, Path]) -> bool:
+        """
+        Decide whether a file is text
+
+        Args:
+            path: File path
+
+        Returns:
+            bool: Whether the file is a text file, False for missing and special files
+        """
+        verdict, key = self._lookup(path)
+        if verdict is None:
+            verdict = self._sniff(path, key)
+        return verdict
+
+    def classify_many(self, paths: Iterable[Union[str, Path]], max_workers: int = 8) -> List[bool]:
+        """
+        Classify many files, reading uncached ones in parallel
+
+        Known extensions and cached verdicts are resolved with one stat call
+        on the calling thread; only the remaining files go to the pool.
+
+        Args:
+            paths: File paths
+            max_workers: Worker threads
+
+        Returns:
+            List[bool]: Verdicts in input order
+        """
+        # Imported here, ingest builds on this module
+        from .ingest import bounded_map
+
+        verdicts: List[Optional[bool]] = []
+        pending = []
+        for path in paths:
+            verdict, key = self._lookup(path)
+            if verdict is None:
+                pending.append((len(verdicts), path, key))
+            verdicts.append(verdict)
+
+        for (index, _, _), verdict in zip(pending, bounded_map(lambda item: self._sniff(item[1], item[2]), pending, max_workers)):
+            verdicts[index] = verdict
+        return verdicts
+
+    def clear(self):
+        """Drop all cached verdicts"""
+        self._cache.clear()
+
+
+_classifier: Optional[TextClassifier] = None
+
+
+def get_classifier() -> TextClassifier:
+    """
+    Get the process-wide text classifier
+
+    Returns:
+        TextClassifier: Shared classifier, its cache lives as long as the process
+    """
+    global _classifier
+    if _classifier is None:
+        _classifier = TextClassifier()
+    return _classifier
+
+
+def classify(path: Union[str, Path]) -> bool:
+    """
+    Decide whether a file is text using the shared classifier
+
+    Args:
+        path: File path
+
+    Returns:
+        bool: Whether the file is a text file
+    """
+    return get_classifier().classify(path)
+
+
+def classify_many(paths: Iterable[Union[str, Path]], max_workers: int = 8) -> List[bool]:
+    """
+    Classify many files in parallel using the shared classifier
+
+    Args:
+        paths: File paths
+        max_workers: Worker threads
+
+    Returns:
+        List[bool]: Verdicts in input order
+    """
+    return get_classifier().classify_many(paths, max_workers)
@@ -0,0 +1,199 @@
+"""
+Token counting module
+
+Estimates how many model tokens a text costs, so content is budgeted in
+tokens instead of characters. CJK text costs about one token per character
+while English costs about one per four, so character limits either waste
+most of the context window or overflow it.
+"""
+
+import re
+import threading
+from typing import Dict, List, Tuple
+
+from .logger import debug, warning
+
+
+# Kana, CJK ideographs, Hangul and fullwidth forms, about one token per character
+_CJK = re.compile(r"[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff\uff00-\uffef]")
+
+# Tokens per character of the approximation
+ASCII_TOKENS_PER_CHAR = 0.25
+CJK_TOKENS_PER_CHAR = 1.0
+OTHER_TOKENS_PER_CHAR = 0.5
+
+# Calibration factor limits and the weight of each new observation
+MIN_SCALE = 0.25
+MAX_SCALE = 4.0
+CALIBRATION_WEIGHT = 0.3
+
+
+class TokenCounter:
+    """
+    Token counter with a calibration factor learned from reported usage
+
+    The base class approximates counts from character classes; subclasses
+    may count with a real tokenizer by overriding count_raw().
+    """
+
+    def __init__(self, name: str = "approx"):
+        """
+        Initialize token counter
+
+        Args:
+            name: Tokenizer name, for logging
+        """
+        self.name = name
+        self.scale = 1.0
+        self._lock = threading.Lock()
+
+    def count_raw(self, text: str) -> int:
+        """
+        Count tokens without calibration
+
+        Deterministic for a given text, use it wherever the result changes
+        content that is hashed or cached.
+
+        Args:
+            text: Text to count
+
+        Returns:
+            int: Estimated token count
+        """
+        if not text:
+            return 0
+        total = len(text)
+        ascii_chars = len(text.encode("ascii", "ignore"))
+        if ascii_chars == total:
+            return max(1, int(total * ASCII_TOKENS_PER_CHAR + 0.5))
+        cjk_chars = _CJK.subn("", text)[1]
+        other_chars = total - ascii_chars - cjk_chars
+        return max(1, int(
+            ascii_chars * ASCII_TOKENS_PER_CHAR
+            + cjk_chars * CJK_TOKENS_PER_CHAR
+            + other_chars * OTHER_TOKENS_PER_CHAR
+            + 0.5
+        ))
+
+    def count(self, text: str) -> int:
+        """
+        Count tokens, corrected by the calibration factor
+
+        Args:
+            text: Text to count
+
+        Returns:
+            int: Estimated token count
+        """
+        raw = self.count_raw(text)
+        return int(raw * self.scale + 0.5) if raw else 0
+
+    def calibrate(self, estimated: int, actual: int):
+        """
+        Move the calibration factor towards an observed ratio
+
+        Args:
+            estimated: Raw count of the text sent, from count_raw()
+            actual: Tokens the provider reported for it
+        """
+        if estimated <= 0 or actual <= 0:
+            return
+        ratio = min(MAX_SCALE, max(MIN_SCALE, actual / estimated))
+        with self._lock:
+            self.scale += (ratio - self.scale) * CALIBRATION_WEIGHT
+        debug("Token counter %s: estimated %s, actual %s, scale %.2f", self.name, estimated, actual, self.scale)
+
+
+class TiktokenCounter(TokenCounter):
+    """Token counter backed by a local tiktoken BPE table"""
+
+    def __init__(self, encoding_name: str):
+        """
+        Initialize tiktoken counter
+
+        Args:
+            encoding_name: tiktoken encoding, e.g. cl100k_base
+
+        Raises:
+            ImportError: tiktoken is not installed
+            ValueError: Encoding is unknown
+        """
+        import tiktoken
+
+        super().__init__(encoding_name)
+        self._encoding = tiktoken.get_encoding(encoding_name)
+
+    def count_raw(self, text: str) -> int:
+        if not text:
+            return 0
+        return len(self._encoding.encode(text, disallowed_special=()))
+
+
+_counters: Dict[Tuple[str, str], TokenCounter] = {}
+_counters_lock = threading.Lock()
+
+
+def get_token_counter(model: str, tokenizer: str = "approx") -> TokenCounter:
+    """
+    Get the shared token counter of a model
+
+    Counters are shared per model so calibration learned by a provider
+    also applies to budgeting in the translator.
+
+    Args:
+        model: Provider and model the counts are for, e.g. "siliconflow:<model>"
+        tokenizer: "approx" for the character class approximation, or a tiktoken encoding name
+
+    Returns:
+        TokenCounter: Token counter
+    """
+    key = (model, tokenizer or "approx")
+    with _counters_lock:
+        counter = _counters.get(key)
+        if counter is None:
+            counter = TokenCounter()
+            if tokenizer and tokenizer != "approx":
+                try:
+                    counter = TiktokenCounter(tokenizer)
+                except Exception as e:
+                    warning(f"⚠ Tokenizer {tokenizer} unavailable, using approximate token counts: {e}")
+            _counters[key] = counter
+        return counter
+
+
+def pack_batches(parts: List[str], max_tokens: int, counter: TokenCounter, separator: str = "\n\n") -> List[str]:
+    """
+    Pack consecutive parts into as few batches as fit a token budget
+
+    Part sizes are counted once and summed, the batch text is only joined
+    when the batch is complete. A part larger than the budget gets its own batch.
+
+    Args:
+        parts: Content parts in order
+        max_tokens: Token budget per batch
+        counter: Token counter
+        separator: Text joining the parts of a batch
+
+    Returns:
+        List[str]: Batch contents
+    """
+    separator_tokens = counter.count(separator)
+    batches = []
+    current: List[str] = []
+    current_tokens = 0
+
+    for part in parts:
+        tokens = counter.count(part)
+        if current and current_tokens + separator_tokens + tokens > max_tokens:
+            batches.append(separator.join(current))
+            current = []
+            current_tokens = 0
+        if current:
+            current_tokens += separator_tokens
+        current.append(part)
+        current_tokens += tokens
+
+    if current:
+        batches.append(separator.join(current))
+    return batches
+
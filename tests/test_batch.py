@@ -0,0 +1,122 @@
+"""
+Batch processing test module
+
+Tests manifest loading, job scheduling and multi-repository runs.
+"""
+
+import json
+import pytest
+from src.core.batch import BatchRunner, format_batch_summary, load_manifest
+from src.core.translator import Translator
+from src.models.types import BatchRepository
+from src.utils.config import Config
+
+
+class FakeProvider:
+    """Provider returning a marker translation and recording the call order"""
+
+    name = "fake"
+
+    def __init__(self, failing=()):
+        self.calls = []
+        self.failing = set(failing)
+
+    async def atranslate(self, content, languages, **kwargs):
+        lang = languages[0]
+        self.calls.append((content.splitlines()[0], lang))
+        if (content.splitlines()[0], lang) in self.failing:
+            raise Exception("API error: 500")
+        return json.dumps({lang: f"{content.splitlines()[0]} [{lang}]"})
+
+
+def make_repository(root, name):
+    """Create a repository directory with a README"""
+    path = root / name
+    path.mkdir()
+    (path / "README.md").write_text(f"# {name}\n\nHello\n", encoding="utf-8")
+    return path
+
+
+class TestLoadManifest:
+    """Manifest loading test class"""
+
+    def test_defaults_and_relative_paths(self, tmp_path):
+        """Test top-level defaults, per-entry overrides and path resolution"""
+        manifest = tmp_path / "repos.yaml"
+        manifest.write_text(
+            "languages: [zh-Hans, ja]\n"
+            "repositories:\n"
+            "  - a\n"
+            "  - path: b\n"
+            "    languages: ko, fr\n"
+            "    mode: gen\n",
+            encoding="utf-8"
+        )
+
+        repositories = load_manifest(manifest)
+
+        assert repositories == [
+            BatchRepository(path=str(tmp_path / "a"), languages=["zh-Hans", "ja"], mode="trans"),
+            BatchRepository(path=str(tmp_path / "b"), languages=["ko", "fr"], mode="gen"),
+        ]
+
+    def test_plain_list_and_invalid_entries(self, tmp_path):
+        """Test a bare list manifest and rejected entries"""
+        manifest = tmp_path / "repos.yaml"
+        manifest.write_text("- /srv/a\n", encoding="utf-8")
+        assert load_manifest(manifest)[0].path == "/srv/a"
+
+        manifest.write_text("repositories:\n  - path: a\n    mode: deploy\n", encoding="utf-8")
+        with pytest.raises(ValueError):
+            load_manifest(manifest)
+
+
+class TestBatchRunner:
+    """Batch runner test class"""
+
+    def setup_method(self):
+        """Set up a translator with a fake provider"""
+        config = Config()
+        config.set("cache.enabled", False)
+        self.translator = Translator(config)
+        self.provider = FakeProvider()
+        self.translator.provider = self.provider
+
+    def test_jobs_are_interleaved_across_repositories(self, tmp_path):
+        """Test that every repository gets a turn before the next language"""
+        repositories = [
+            BatchRepository(path=str(make_repository(tmp_path, name)), languages=["zh-Hans", "ja", "ko"])
+            for name in ("a", "b")
+        ]
+
+        BatchRunner(self.translator, max_concurrency=1).run(repositories)
+
+        assert self.provider.calls == [
+            ("# a", "zh-Hans"), ("# b", "zh-Hans"),
+            ("# a", "ja"), ("# b", "ja"),
+            ("# a", "ko"), ("# b", "ko"),
+        ]
+
+    def test_writes_each_repository_and_reports_failures(self, tmp_path):
+        """Test per-repository output files and the consolidated summary"""
+        self.provider.failing = {("# b", "ja")}
+        repo_a = make_repository(tmp_path, "a")
+        repo_b = make_repository(tmp_path, "b")
+        repositories = [
+            BatchRepository(path=str(repo_a), languages=["zh-Hans", "ja"]),
+            BatchRepository(path=str(repo_b), languages=["zh-Hans", "ja"]),
+            BatchRepository(path=str(tmp_path / "missing"), languages=["ja"]),
+        ]
+
+        results = BatchRunner(self.translator, max_concurrency=4, incremental=False).run(repositories)
+
+        assert (repo_a / "docs" / "README.ja.md").read_text(encoding="utf-8") == "# a [ja]"
+        assert (repo_b / "docs" / "README.zh.md").read_text(encoding="utf-8") == "# b [zh-Hans]"
+        assert not (repo_b / "docs" / "README.ja.md").exists()
+        assert results[0].generation.total_saved == 2
+        assert "ja" in results[1].errors
+        assert results[2].error == "Repository directory not found"
+
+        summary = format_batch_summary(results)
+        assert "3 repositories, 3/5 READMEs generated" in summary
+        assert f"⚠ {repo_b} (trans): zh-Hans; failed: ja" in summary
@@ -0,0 +1,89 @@
+"""
+Translation cache test module
+
+Tests persistent translation cache functionality.
+"""
+
+import os
+import time
+import pytest
+from pathlib import Path
+from src.utils.cache import TranslationCache
+from src.utils.config import Config
+
+
+class TestTranslationCache:
+    """Translation cache test class"""
+
+    @pytest.fixture(autouse=True)
+    def setup_cache(self, tmp_path):
+        """Set up test environment"""
+        self.cache = TranslationCache(cache_dir=tmp_path / "cache")
+
+    def test_make_key_depends_on_all_fields(self):
+        """Test that every key component changes the key"""
+        base = ("siliconflow", "model-a", "trans", "ja", "1", "# Hello")
+        key = TranslationCache.make_key(*base)
+
+        assert key == TranslationCache.make_key(*base)
+        for index, value in enumerate(["tencent", "model-b", "gen", "ko", "2", "# Hello!"]):
+            changed = list(base)
+            changed[index] = value
+            assert TranslationCache.make_key(*changed) != key
+
+    def test_get_set_roundtrip(self):
+        """Test storing and retrieving a translation"""
+        key = TranslationCache.make_key("siliconflow", "m", "trans", "ja", "1", "text")
+        assert self.cache.get(key) is None
+
+        self.cache.set(key, "テキスト")
+        assert self.cache.get(key) == "テキスト"
+
+    def test_expired_entry_is_evicted_on_get(self):
+        """Test that entries older than max age are not returned"""
+        cache = TranslationCache(cache_dir=self.cache.cache_dir, max_age_days=1)
+        cache.set("ab" * 32, "old")
+
+        path = cache._entry_path("ab" * 32)
+        old_time = time.time() - 2 * 86400
+        os.utime(path, (old_time, old_time))
+
+        assert cache.get("ab" * 32) is None
+        assert not path.exists()
+
+    def test_prune_by_size_removes_least_recently_used(self):
+        """Test size eviction order"""
+        for index, key in enumerate(["aa" * 32, "bb" * 32, "cc" * 32]):
+            self.cache.set(key, "x" * 1000)
+            access_time = time.time() - 100 + index
+            os.utime(self.cache._entry_path(key), (access_time, access_time))
+
+        removed = self.cache.prune(max_size_mb=2500 / 1024 / 1024)
+
+        assert removed >= 1
+        assert self.cache.get("aa" * 32) is None
+        assert self.cache.get("cc" * 32) == "x" * 1000
+
+    def test_stats_and_clear(self):
+        """Test statistics and clearing"""
+        self.cache.set("aa" * 32, "one")
+        self.cache.set("bb" * 32, "two")
+
+        stats = self.cache.stats()
+        assert stats["entries"] == 2
+        assert stats["total_bytes"] > 0
+
+        assert self.cache.clear() == 2
+        assert self.cache.stats()["entries"] == 0
+
+    def test_from_config_disabled(self):
+        """Test that caching can be disabled in configuration"""
+        config = Config()
+        config.set("cache.enabled", False)
+        assert TranslationCache.from_config(config) is None
+
+        config.set("cache.enabled", True)
+        config.set("cache.dir", str(self.cache.cache_dir))
+        cache = TranslationCache.from_config(config)
+        assert cache is not None
+        assert cache.cache_dir == Path(self.cache.cache_dir)
@@ -0,0 +1,63 @@
+"""
+File utilities test module
+
+Tests atomic incremental file writing.
+"""
+
+import os
+import stat
+import pytest
+from pathlib import Path
+from src.utils.file_utils import AtomicFileWriter
+
+
+class TestAtomicFileWriter:
+    """Atomic file writer test class"""
+
+    def test_commit_replaces_target(self, tmp_path):
+        """Test that content only appears at the target after commit"""
+        target = tmp_path / "docs" / "README.ja.md"
+        writer = AtomicFileWriter(target)
+        writer.write("partial\n")
+
+        assert not target.exists()
+        assert writer.temp_path.read_text(encoding="utf-8") == "partial\n"
+
+        writer.rewrite("final")
+        writer.commit()
+
+        assert target.read_text(encoding="utf-8") == "final"
+        assert not writer.temp_path.exists()
+
+    def test_abort_keeps_previous_file(self, tmp_path):
+        """Test that aborting leaves the existing target untouched"""
+        target = tmp_path / "README.ja.md"
+        target.write_text("old", encoding="utf-8")
+
+        with pytest.raises(RuntimeError):
+            with AtomicFileWriter(target) as writer:
+                writer.write("new")
+                raise RuntimeError("stream failed")
+
+        assert target.read_text(encoding="utf-8") == "old"
+        assert list(tmp_path.iterdir()) == [target]
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+    def test_committed_file_mode(self, tmp_path):
+        """Test that a new file gets the umask mode and an existing file keeps its mode"""
+        previous = os.umask(0o022)
+        try:
+            new_file = tmp_path / "README.ja.md"
+            with AtomicFileWriter(new_file) as writer:
+                writer.write("new")
+
+            existing = tmp_path / "README.ko.md"
+            existing.write_text("old", encoding="utf-8")
+            os.chmod(existing, 0o640)
+            with AtomicFileWriter(existing) as writer:
+                writer.write("new")
+        finally:
+            os.umask(previous)
+
+        assert stat.S_IMODE(new_file.stat().st_mode) == 0o644
+        assert stat.S_IMODE(existing.stat().st_mode) == 0o640
@@ -0,0 +1,104 @@
+"""
+Gitignore matching test module
+
+Tests gitignore semantics and the pruning project walker.
+"""
+
+import pytest
+from pathlib import Path
+from src.utils.gitignore import GitIgnoreSpec, walk_project_files
+
+
+class TestGitIgnoreSpec:
+    """Gitignore spec test class"""
+
+    def test_unanchored_pattern_matches_at_any_level(self):
+        """Test that patterns without slash match in every directory"""
+        spec = GitIgnoreSpec(["*.log"])
+        assert spec.match("debug.log") is True
+        assert spec.match("a/b/debug.log") is True
+        assert spec.match("debug.txt") is None
+
+    def test_anchored_pattern(self):
+        """Test that leading or middle slashes anchor the pattern"""
+        spec = GitIgnoreSpec(["/build", "docs/*.tmp"])
+        assert spec.match("build", is_dir=True) is True
+        assert spec.match("src/build", is_dir=True) is None
+        assert spec.match("docs/a.tmp") is True
+        assert spec.match("src/docs/a.tmp") is None
+
+    def test_directory_only_pattern(self):
+        """Test that trailing slash only matches directories"""
+        spec = GitIgnoreSpec(["cache/"])
+        assert spec.match("cache", is_dir=True) is True
+        assert spec.match("cache") is None
+
+    def test_negation_last_match_wins(self):
+        """Test negated patterns re-include files"""
+        spec = GitIgnoreSpec(["*.md", "!README.md"])
+        assert spec.match("CHANGES.md") is True
+        assert spec.match("README.md") is False
+
+        spec = GitIgnoreSpec(["!README.md", "*.md"])
+        assert spec.match("README.md") is True
+
+    def test_double_star(self):
+        """Test ** handling"""
+        spec = GitIgnoreSpec(["**/node_modules", "logs/**", "a/**/z"])
+        assert spec.match("node_modules", is_dir=True) is True
+        assert spec.match("web/node_modules", is_dir=True) is True
+        assert spec.match("logs/x/y.txt") is True
+        assert spec.match("a/z") is True
+        assert spec.match("a/b/c/z") is True
+
+    def test_comments_and_escapes(self):
+        """Test comments, escaped hash and escaped trailing space"""
+        spec = GitIgnoreSpec(["# comment", "\\#file", "name\\ ", ""])
+        assert spec.match("#file") is True
+        assert spec.match("name ") is True
+        assert spec.match("comment") is None
+
+    def test_is_ignored_checks_parent_directories(self):
+        """Test that files inside ignored directories are ignored"""
+        spec = GitIgnoreSpec(["venv/"])
+        assert spec.is_ignored("venv/lib/site.py") is True
+        assert spec.is_ignored("src/site.py") is False
+
+
+class TestWalkProjectFiles:
+    """Project walker test class"""
+
+    def _make_files(self, root, paths):
+        """Create empty files"""
+        for path in paths:
+            file_path = root / path
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.write_text("x", encoding="utf-8")
+
+    def test_walk_prunes_and_applies_nested_gitignore(self, tmp_path):
+        """Test pruning, nested .gitignore and negation"""
+        self._make_files(tmp_path, [
+            "README.md",
+            "main.py",
+            "debug.log",
+            "node_modules/pkg/index.js",
+            ".git/config",
+            "src/app.py",
+            "src/generated.py",
+            "src/keep.log",
+        ])
+        (tmp_path / ".gitignore").write_text("node_modules/\n*.log\n", encoding="utf-8")
+        (tmp_path / "src" / ".gitignore").write_text("generated.py\n!keep.log\n", encoding="utf-8")
+
+        files = {p.relative_to(tmp_path).as_posix() for p in walk_project_files(tmp_path)}
+
+        assert files == {".gitignore", "README.md", "main.py", "src/.gitignore", "src/app.py", "src/keep.log"}
+
+    def test_walk_without_gitignore(self, tmp_path):
+        """Test walking with gitignore disabled still skips .git"""
+        self._make_files(tmp_path, ["a.log", ".git/HEAD"])
+        (tmp_path / ".gitignore").write_text("*.log\n", encoding="utf-8")
+
+        files = {p.name for p in walk_project_files(tmp_path, use_gitignore=False)}
+
+        assert files == {"a.log", ".gitignore"}
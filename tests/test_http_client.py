@@ -0,0 +1,49 @@
+"""
+Shared HTTP client test module
+
+Tests the pooled session and the sync/async bridging helpers.
+"""
+
+import asyncio
+import threading
+import pytest
+from src.services import http_client
+from src.services.providers.base import TranslationProvider
+
+
+class EchoProvider(TranslationProvider):
+    """Provider that echoes its input from the shared executor"""
+
+    @property
+    def name(self) -> str:
+        return "echo"
+
+    async def atranslate(self, content, languages, **kwargs):
+        return await http_client.run_blocking(lambda: f"{content}:{','.join(languages)}")
+
+    def validate_credentials(self) -> bool:
+        return True
+
+
+class TestHttpClient:
+    """HTTP client test class"""
+
+    def test_session_is_shared(self):
+        """Test that every caller gets the same pooled session"""
+        assert http_client.get_session() is http_client.get_session()
+
+    def test_run_blocking_uses_shared_executor(self):
+        """Test that blocking calls run on the shared executor threads"""
+        name = http_client.run_sync(http_client.run_blocking(lambda: threading.current_thread().name))
+        assert name.startswith("duoreadme-http")
+
+    def test_sync_translate_wraps_atranslate(self):
+        """Test the blocking translate wrapper"""
+        assert EchoProvider().translate("text", ["ja", "ko"]) == "text:ja,ko"
+
+    def test_run_sync_inside_running_loop(self):
+        """Test that run_sync works when called from a coroutine"""
+        async def caller():
+            return EchoProvider().translate("text", ["ja"])
+
+        assert asyncio.run(caller()) == "text:ja"
@@ -0,0 +1,74 @@
+"""
+Import time test module
+
+Runs the CLI import under python -X importtime to keep the fast-start path
+from loading providers, the translator or network libraries.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Modules only the gen, trans and batch commands need
+HEAVY_MODULES = (
+    "requests",
+    "tencentcloud",
+    "asyncio",
+    "src.core.translator",
+    "src.services.providers",
+    "src.services.tencent_cloud",
+)
+
+# Generous ceiling on the cumulative import time of the CLI, in milliseconds
+MAX_CLI_IMPORT_MS = 1000
+
+
+def run_imports(statement):
+    """
+    Run a statement under -X importtime
+
+    Returns the cumulative microseconds per module reported by importtime
+    and the set of all loaded modules, which also covers modules imported
+    through importlib that importtime does not report.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"{statement}\nimport sys\nprint('\\n'.join(sys.modules))"],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, module = line.split("|")
+        if cumulative.strip().isdigit():
+            times[module.strip()] = int(cumulative)
+    return times, set(result.stdout.split())
+
+
+def is_heavy(module):
+    """Whether a module is one of HEAVY_MODULES or inside one"""
+    return any(module == heavy or module.startswith(heavy + ".") for heavy in HEAVY_MODULES)
+
+
+class TestImportTime:
+    """CLI import time test class"""
+
+    def test_cli_does_not_load_heavy_modules(self):
+        """Test that importing the CLI skips providers, the translator and the SDKs"""
+        times, modules = run_imports("import src.cli.main")
+
+        assert sorted(filter(is_heavy, modules)) == []
+        assert times["src.cli.main"] / 1000 < MAX_CLI_IMPORT_MS
+
+    def test_providers_load_on_first_use(self):
+        """Test that the provider registry imports only the configured provider"""
+        _, modules = run_imports(
+            "from src.services.providers import get_provider_class\nget_provider_class('siliconflow')"
+        )
+
+        assert "src.services.providers.siliconflow_provider" in modules
+        assert "src.services.providers.tencent_provider" not in modules
+        assert not any(name.startswith("tencentcloud") for name in modules)
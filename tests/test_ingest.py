@@ -0,0 +1,89 @@
+"""
+Project ingestion test module
+
+Tests parallel file inspection and ordered bounded mapping.
+"""
+
+import threading
+import time
+from pathlib import Path
+from src.utils.file_utils import FileUtils
+from src.utils.ingest import bounded_map, ingest_files, inspect_file, score_file
+
+
+class TestInspectFile:
+    """File inspection test class"""
+
+    def test_text_file_record(self, tmp_path):
+        """Test the record of a known text file"""
+        path = tmp_path / "main.py"
+        path.write_text("print('hi')\n", encoding="utf-8")
+
+        record = inspect_file(path)
+
+        assert record.path == path
+        assert record.size == 12
+        assert record.language == "Python"
+        assert len(record.hash) == 32
+        assert record.score == score_file(path)
+
+    def test_hash_follows_content(self, tmp_path):
+        """Test that equal content hashes equally regardless of the name"""
+        (tmp_path / "a.md").write_text("same", encoding="utf-8")
+        (tmp_path / "b.md").write_text("same", encoding="utf-8")
+        (tmp_path / "c.md").write_text("other", encoding="utf-8")
+
+        a, b, c = (inspect_file(tmp_path / name) for name in ("a.md", "b.md", "c.md"))
+
+        assert a.hash == b.hash != c.hash
+
+    def test_binary_and_missing_files_are_skipped(self, tmp_path):
+        """Test that binary content is sniffed away"""
+        (tmp_path / "blob.bin").write_bytes(b"\x00\x01\x02binary")
+        (tmp_path / "LICENSE").write_text("MIT License", encoding="utf-8")
+
+        assert inspect_file(tmp_path / "blob.bin") is None
+        assert inspect_file(tmp_path / "missing.md") is None
+        assert inspect_file(tmp_path / "LICENSE") is not None
+
+    def test_score_prefers_core_and_shallow_files(self):
+        """Test importance scoring rules"""
+        assert score_file(Path("src/main.py")) > score_file(Path("src/utils.py")) > score_file(Path("tests/test_x.py"))
+        assert score_file(Path("main.py")) > score_file(Path("a/b/c/main.py"))
+
+
+class TestIngestion:
+    """Parallel ingestion test class"""
+
+    def test_bounded_map_keeps_order_and_limits_in_flight(self):
+        """Test result order and the in-flight window"""
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def work(value):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.001 * (value % 3))
+            with lock:
+                state["active"] -= 1
+            return value * 2
+
+        results = list(bounded_map(work, iter(range(50)), max_workers=4, window=6))
+
+        assert results == [value * 2 for value in range(50)]
+        assert state["peak"] <= 4
+
+    def test_project_ingestion_matches_walk_order(self, tmp_path):
+        """Test that records follow the walk and respect .gitignore"""
+        for name in ("README.md", "src/main.py", "src/data.bin", "build/out.py"):
+            path = tmp_path / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(b"\x00\x00" if name.endswith(".bin") else b"text")
+        (tmp_path / ".gitignore").write_text("build/\n", encoding="utf-8")
+
+        records = FileUtils().ingest_project_files(tmp_path, max_workers=3)
+
+        assert [record.path.relative_to(tmp_path).as_posix() for record in records] == [".gitignore", "README.md", "src/main.py"]
+        assert FileUtils().get_project_files(tmp_path) == [record.path for record in records]
+        assert ingest_files([], max_workers=2) == []
@@ -0,0 +1,104 @@
+"""
+JSON extractor test module
+
+Tests JSON extraction from model responses.
+"""
+
+import json
+import time
+import pytest
+from src.utils.json_extractor import JSONExtractor, extract_json_content
+
+
+class TestJSONExtractor:
+    """JSON extractor test class"""
+
+    def test_code_block_with_nested_fences(self):
+        """Test that code fences inside string values do not end the block"""
+        payload = {"en": "# Demo\n\n```bash\npip install demo\n```", "ja": "# デモ {placeholder}"}
+        text = "Here you go:\n```json\n" + json.dumps(payload, ensure_ascii=False) + "\n```\nDone."
+        assert JSONExtractor.extract_json_from_response(text) == payload
+
+    def test_code_block_is_preferred(self):
+        """Test that the object in the json code block wins over earlier objects"""
+        text = 'Example: {"x": 1}\n```json\n{"en": "Hello"}\n```'
+        assert JSONExtractor.extract_json_from_response(text) == {"en": "Hello"}
+
+    def test_skips_invalid_candidates(self):
+        """Test that prose braces before the object are skipped"""
+        text = 'Use {name} as placeholder. {"en": "Hello", "ja": "こんにちは"}'
+        assert JSONExtractor.extract_json_from_response(text) == {"en": "Hello", "ja": "こんにちは"}
+
+    def test_stray_brace_before_code_block(self):
+        """Test that an unmatched brace in prose does not hide the code block"""
+        text = 'Note { this is not closed\n```json\n{"en": "Hello"}\n```'
+        assert JSONExtractor.extract_json_from_response(text) == {"en": "Hello"}
+
+    def test_literal_newlines_and_control_characters(self):
+        """Test lenient decoding of raw newlines and removal of control characters"""
+        text = '{"en": "line one\nline two\x07", "ja": "行\r\n"}'
+        assert JSONExtractor.extract_json_from_response(text) == {"en": "line one\nline two", "ja": "行\n"}
+
+    def test_truncated_object_keeps_complete_members(self):
+        """Test recovery of a response cut off in the middle of a value"""
+        text = '```json\n{"English readme": "Hello", "ja": "こんに'
+        assert JSONExtractor.extract_json_from_response(text) == {"English readme": "Hello"}
+
+    def test_truncated_first_value_is_closed(self):
+        """Test recovery of a response cut off inside its only value"""
+        assert JSONExtractor.extract_json_from_response('{"en": "Hello wor') == {"en": "Hello wor"}
+
+    def test_no_json(self):
+        """Test responses without JSON"""
+        assert JSONExtractor.extract_json_from_response("") is None
+        assert JSONExtractor.extract_json_from_response("### English\nHello") is None
+
+    def test_extract_json_content_maps_language_keys(self):
+        """Test language key normalization"""
+        _, content = extract_json_content('{"Japanese readme": "こんにちは", "english": "Hello"}')
+        assert content == {"ja": "こんにちは", "en": "Hello"}
+
+
+@pytest.mark.slow
+class TestJSONExtractorBenchmark:
+    """JSON extractor benchmark class"""
+
+    LANGUAGES = ["zh-Hans", "zh-Hant", "en", "ja", "ko", "fr", "de", "es", "it", "pt",
+                 "ru", "vi", "th", "hi", "ar", "tr", "pl", "nl", "sv", "he"]
+
+    def _response(self, truncate=False):
+        """Build a multi-hundred-KB multilingual response"""
+        section = "## 功能 Feature {x}\n\nDétails — «quoted» \"text\", `code {}` ✓\n\n```python\nprint('{}')\n```\n\n"
+        payload = {lang: f"# README {lang}\n\n" + section * 200 for lang in self.LANGUAGES}
+        text = "Sure! {Here} is the result:\n```json\n" + json.dumps(payload, ensure_ascii=False, indent=2) + "\n```"
+        if truncate:
+            text = text[:int(len(text) * 0.9)]
+        return text, payload
+
+    def test_large_response(self):
+        """Benchmark extraction of a complete response"""
+        text, payload = self._response()
+        assert len(text.encode("utf-8")) > 300_000
+
+        start = time.perf_counter()
+        for _ in range(10):
+            result = JSONExtractor.extract_json_from_response(text)
+        elapsed = (time.perf_counter() - start) / 10
+
+        print(f"\nComplete response: {len(text)} chars, {elapsed * 1000:.1f} ms per extraction")
+        assert result == payload
+        assert elapsed < 1.0
+
+    def test_large_truncated_response(self):
+        """Benchmark recovery of a truncated response"""
+        text, payload = self._response(truncate=True)
+
+        start = time.perf_counter()
+        for _ in range(10):
+            result = JSONExtractor.extract_json_from_response(text)
+        elapsed = (time.perf_counter() - start) / 10
+
+        print(f"\nTruncated response: {len(text)} chars, {elapsed * 1000:.1f} ms per extraction")
+        assert 0 < len(result) < len(payload)
+        assert all(result[lang] == payload[lang] for lang in result)
+        assert elapsed < 1.0
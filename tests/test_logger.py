@@ -0,0 +1,84 @@
+"""
+Logger test module
+
+Tests that log messages are only built when their level is enabled.
+"""
+
+import json
+import logging
+from unittest.mock import patch
+import pytest
+import requests
+from src.services.sse_stream import stream_reply
+from src.utils.logger import debug, disable_debug, enable_debug, info
+
+
+class Expensive:
+    """Argument that counts how often it is formatted"""
+
+    def __init__(self):
+        self.formatted = 0
+
+    def __str__(self):
+        self.formatted += 1
+        return "expensive"
+
+
+@pytest.fixture
+def records():
+    """Capture records of the duoreadme logger"""
+    captured = []
+    handler = logging.Handler()
+    handler.emit = captured.append
+    logger = logging.getLogger("duoreadme")
+    logger.addHandler(handler)
+    try:
+        yield captured
+    finally:
+        logger.removeHandler(handler)
+        disable_debug()
+
+
+class TestLazyLogging:
+    """Lazy log message test class"""
+
+    def test_disabled_level_builds_nothing(self, records):
+        """Test that neither callables nor %-style arguments are formatted below the level"""
+        disable_debug()
+        argument = Expensive()
+        calls = []
+
+        debug("Event data: %s", argument)
+        debug(lambda: calls.append(1) or "built")
+
+        assert argument.formatted == 0
+        assert calls == []
+        assert records == []
+
+    def test_enabled_level_formats(self, records):
+        """Test that lazy messages are formatted when the level is enabled"""
+        enable_debug()
+
+        debug("Event %s of %d", "reply", 3)
+        debug(lambda: "built")
+        info("100% done")
+
+        assert [record.getMessage() for record in records] == ["Event reply of 3", "built", "100% done"]
+
+    def test_request_payload_is_not_serialized_at_info(self, records):
+        """Test that the SSE request payload is only pretty-printed for debug logs"""
+        disable_debug()
+        indents = []
+        real_dumps = json.dumps
+
+        def dumps(obj, **kwargs):
+            indents.append(kwargs.get("indent"))
+            return real_dumps(obj, **kwargs)
+
+        with patch("src.services.sse_stream.json.dumps", side_effect=dumps), \
+                patch("src.services.sse_stream.get_session") as get_session:
+            get_session.return_value.post.side_effect = requests.exceptions.ConnectionError("offline")
+            with pytest.raises(Exception, match="Network request failed"):
+                next(stream_reply("http://localhost", {"content": "x" * 1000}, 1))
+
+        assert indents == [None]
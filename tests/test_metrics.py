@@ -0,0 +1,149 @@
+"""
+Metrics test module
+
+Tests spans, their aggregation and export, and the counters recorded by
+providers and the CLI.
+"""
+
+import asyncio
+import json
+import os
+import stat
+import pytest
+import yaml
+from click.testing import CliRunner
+from benchmarks.mock_server import MockOptions, MockServer
+from src.cli.main import cli
+from src.services.http_client import run_blocking
+from src.services.providers import get_provider_class
+from src.utils.config import Config
+from src.utils.metrics import MetricsRecorder, current_span, get_metrics, span
+
+
+class TestMetricsRecorder:
+    """Metrics recorder test class"""
+
+    def test_nested_spans_and_errors(self):
+        """Test parent links, counters and errors of spans"""
+        recorder = MetricsRecorder()
+
+        with recorder.span("translate") as outer:
+            with recorder.span("request", language="ja") as inner:
+                inner.add("retries")
+                inner.add("retries")
+                inner.set(prompt_tokens=10, completion_tokens=None)
+        with pytest.raises(ValueError):
+            with recorder.span("generate"):
+                raise ValueError("disk full")
+
+        spans = {item.name: item for item in recorder.spans}
+        assert spans["request"].parent_id == outer.span_id
+        assert spans["request"].counters == {"retries": 2, "prompt_tokens": 10}
+        assert spans["request"].labels == {"language": "ja"}
+        assert spans["generate"].error == "ValueError: disk full"
+
+    def test_summary_and_exports(self, tmp_path):
+        """Test per-name aggregation and the JSON and Prometheus files"""
+        recorder = MetricsRecorder()
+        for tokens in (100, 50):
+            with recorder.span("request") as request:
+                request.set(prompt_tokens=tokens, bytes_in=1000)
+
+        summary = recorder.summary()["request"]
+        assert summary["count"] == 2
+        assert summary["counters"] == {"prompt_tokens": 150, "bytes_in": 2000}
+
+        recorder.write_json(tmp_path / "metrics.json")
+        recorder.write_prometheus(tmp_path / "metrics.prom")
+        exported = json.loads((tmp_path / "metrics.json").read_text())
+        prometheus = (tmp_path / "metrics.prom").read_text()
+
+        assert exported["stages"]["request"]["count"] == 2
+        assert len(exported["spans"]) == 2
+        assert 'duoreadme_spans_total{span="request"} 2' in prometheus
+        assert 'duoreadme_prompt_tokens_total{span="request"} 150' in prometheus
+        assert "# TYPE duoreadme_bytes_in_total counter" in prometheus
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+    def test_exports_are_world_readable(self, tmp_path):
+        """Test that the textfile collector, usually another user, can read the exports"""
+        recorder = MetricsRecorder()
+        previous = os.umask(0o022)
+        try:
+            recorder.write_json(tmp_path / "metrics.json")
+            recorder.write_prometheus(tmp_path / "metrics.prom")
+        finally:
+            os.umask(previous)
+
+        assert stat.S_IMODE((tmp_path / "metrics.prom").stat().st_mode) == 0o644
+        assert stat.S_IMODE((tmp_path / "metrics.json").stat().st_mode) == 0o644
+
+    def test_span_carries_over_to_executor(self):
+        """Test that work started with run_blocking adds to the caller's span"""
+        recorder = MetricsRecorder()
+
+        async def run():
+            with recorder.span("request"):
+                await run_blocking(lambda: current_span().add("bytes_out", 5))
+
+        asyncio.run(run())
+
+        assert recorder.spans[0].counters == {"bytes_out": 5}
+
+    def test_counters_outside_spans_are_dropped(self):
+        """Test that instrumented code runs without an open span"""
+        current_span().add("retries")
+
+        assert current_span().counters == {}
+
+
+class TestProviderMetrics:
+    """Provider request instrumentation test class"""
+
+    def test_request_counters(self):
+        """Test bytes, tokens and retries of a throttled request"""
+        metrics = get_metrics()
+        metrics.reset()
+        with MockServer(options=MockOptions(throttle_first=1)) as server:
+            config = Config()
+            config.set("cache.enabled", False)
+            config.set("siliconflow.api_key", "test")
+            config.set("siliconflow.api_url", server.chat_url)
+            config.set("siliconflow.rate_limit.backoff_base", 0.01)
+            provider = get_provider_class("siliconflow")(config)
+
+            provider.translate("# Hello\n\nWorld.", ["ja"], mode="trans")
+
+        request = [item for item in metrics.spans if item.name == "request"][0]
+        assert request.labels == {"provider": "siliconflow", "language": "ja"}
+        assert request.counters["retries"] == 1
+        assert request.counters["bytes_in"] > 0 and request.counters["bytes_out"] > 0
+        assert request.counters["completion_tokens"] > 0
+        assert request.counters["queue_wait_seconds"] >= 0
+
+
+class TestMetricsCommand:
+    """--metrics-out and --prometheus-out test class"""
+
+    def test_trans_writes_stage_metrics(self, tmp_path, monkeypatch):
+        """Test that trans records every stage and writes both files"""
+        (tmp_path / "README.md").write_text("# Demo\n\nHello.\n", encoding="utf-8")
+        monkeypatch.chdir(tmp_path)
+        with MockServer() as server:
+            config_path = tmp_path / "config.yaml"
+            config_path.write_text(yaml.safe_dump({
+                "provider": "siliconflow",
+                "siliconflow": {"api_key": "test", "api_url": server.chat_url},
+                "cache": {"enabled": False},
+            }), encoding="utf-8")
+
+            result = CliRunner().invoke(cli, [
+                "trans", "--config", str(config_path), "--languages", "ja",
+                "--metrics-out", "metrics.json", "--prometheus-out", "metrics.prom"
+            ])
+
+        assert result.exit_code == 0, result.output
+        stages = json.loads((tmp_path / "metrics.json").read_text())["stages"]
+        assert set(stages) == {"read", "translate", "request", "parse", "generate"}
+        assert stages["read"]["counters"]["bytes_out"] == len("# Demo\n\nHello.\n")
+        assert 'duoreadme_spans_total{span="translate"} 1' in (tmp_path / "metrics.prom").read_text()
@@ -0,0 +1,100 @@
+"""
+Mock server test module
+
+Tests the providers end to end against the local mock server, without
+network access or credentials.
+"""
+
+import json
+import pytest
+from benchmarks.mock_server import MockOptions, MockServer, percentile
+from src.services.providers import get_provider_class
+from src.utils.config import Config
+
+
+@pytest.fixture
+def server():
+    """Mock server on a free port"""
+    with MockServer(options=MockOptions(seed=1)) as running:
+        yield running
+
+
+def make_config(server: MockServer) -> Config:
+    """Configuration pointing all providers at the mock server"""
+    config = Config()
+    config.set("cache.enabled", False)
+    config.set("siliconflow.api_key", "test")
+    config.set("siliconflow.api_url", server.chat_url)
+    config.set("siliconflow.rate_limit.backoff_base", 0.01)
+    config.set("sse.url", server.sse_url)
+    return config
+
+
+class TestSiliconFlowAgainstMock:
+    """SiliconFlow provider against the mock server test class"""
+
+    def test_translate(self, server):
+        """Test one request per language with usage reported"""
+        provider = get_provider_class("siliconflow")(make_config(server))
+
+        result = json.loads(provider.translate("# Hello\n\nWorld.", ["ja", "fr"], mode="trans"))
+
+        assert set(result) == {"ja", "fr"}
+        assert "日本語" in result["ja"]
+        assert [record.status for record in server.stats.snapshot()] == [200, 200]
+
+    def test_streaming(self, server):
+        """Test that a streamed reply is assembled from its deltas"""
+        config = make_config(server)
+        config.set("siliconflow.stream", True)
+        provider = get_provider_class("siliconflow")(config)
+
+        result = json.loads(provider.translate("# Hello\n\n" + "Some text.\n" * 50, ["ja"], mode="trans"))
+
+        assert result["ja"].startswith("# Project (日本語)")
+        assert "Paragraph 10 translated" in result["ja"]
+
+    def test_throttled_request_is_retried(self, server):
+        """Test that a 429 is retried until the request succeeds"""
+        server.options.throttle_first = 1
+        provider = get_provider_class("siliconflow")(make_config(server))
+
+        result = json.loads(provider.translate("Hello", ["ja"], mode="trans"))
+
+        assert result["ja"]
+        assert [record.status for record in server.stats.snapshot()] == [429, 200]
+
+
+class TestTencentAgainstMock:
+    """Tencent provider against the mock server test class"""
+
+    def test_translate(self, server):
+        """Test that reply events are streamed and the JSON reply holds every language"""
+        provider = get_provider_class("tencent")(make_config(server))
+
+        result = provider.translate("# Hello", ["ja", "ko"], mode="trans")
+
+        assert "```json" in result
+        body = json.loads(result.split("```json", 1)[1].rsplit("```", 1)[0])
+        assert set(body) == {"ja", "ko"}
+        assert server.stats.snapshot()[0].path == "/v1/qbot/chat/sse"
+
+    def test_injected_error(self, server):
+        """Test that an injected server error surfaces as a failure"""
+        server.options.error_rate = 1.0
+        provider = get_provider_class("tencent")(make_config(server))
+
+        with pytest.raises(Exception):
+            provider.translate("# Hello", ["ja"], mode="trans")
+
+
+class TestPercentile:
+    """Percentile test class"""
+
+    def test_nearest_rank(self):
+        """Test nearest-rank percentiles"""
+        samples = [float(i) for i in range(1, 101)]
+
+        assert percentile(samples, 0.5) == 50.0
+        assert percentile(samples, 0.99) == 99.0
+        assert percentile([], 0.5) == 0.0
@@ -0,0 +1,160 @@
+"""
+Provider registry test module
+
+Tests provider lookup, entry point plugins, capabilities and the
+OpenAI-compatible provider.
+"""
+
+import asyncio
+import json
+from importlib.metadata import EntryPoint
+from unittest.mock import MagicMock, patch
+import pytest
+from src.core.translator import Translator
+from src.models.types import TranslationRequest
+from src.services import providers
+from src.services.providers import available_providers, get_provider, get_provider_class
+from src.services.providers.base import TranslationProvider
+from src.utils.config import Config
+
+
+class EchoProvider(TranslationProvider):
+    """Plugin provider that echoes one language and tracks concurrent calls"""
+
+    parallel_safe = False
+
+    def __init__(self, config):
+        self.config = config
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    @property
+    def name(self) -> str:
+        return "echo"
+
+    async def atranslate(self, content, languages, **kwargs):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return json.dumps({lang: content for lang in languages})
+
+    def validate_credentials(self) -> bool:
+        return True
+
+
+PLUGINS = {
+    "echo": EntryPoint("echo", "tests.test_providers:EchoProvider", "duoreadme.providers"),
+    "broken": EntryPoint("broken", "tests.test_providers:PLUGINS", "duoreadme.providers"),
+}
+
+
+class TestRegistry:
+    """Provider registry test class"""
+
+    def test_builtin_providers(self):
+        """Test that built-in names resolve to their classes"""
+        assert get_provider_class("siliconflow").__name__ == "SiliconFlowProvider"
+        assert get_provider_class("tencent").__name__ == "TencentProvider"
+        assert get_provider_class("openai").__name__ == "OpenAICompatibleProvider"
+
+    def test_entry_point_plugins(self):
+        """Test that plugins are discovered through entry points and validated"""
+        config = Config()
+        config.set("provider", "echo")
+
+        with patch.object(providers, "_entry_points", return_value=PLUGINS):
+            assert isinstance(get_provider(config), EchoProvider)
+            assert available_providers() == ["tencent", "siliconflow", "openai", "broken", "echo"]
+            with pytest.raises(TypeError):
+                get_provider_class("broken")
+
+    def test_unknown_provider(self):
+        """Test that an unknown name is an error instead of a silent fallback"""
+        config = Config()
+        config.set("provider", "missing")
+
+        with pytest.raises(ValueError, match="missing"):
+            get_provider(config)
+
+    def test_capabilities(self):
+        """Test the capabilities reported by the built-in providers"""
+        config = Config()
+        siliconflow = get_provider_class("siliconflow")(config).capabilities
+        tencent = get_provider_class("tencent")(config).capabilities
+
+        assert siliconflow.streaming and siliconflow.parallel_safe
+        assert siliconflow.max_context == 131072
+        assert not tencent.streaming
+
+
+class TestTranslatorStrategy:
+    """Capability-driven translator strategy test class"""
+
+    def test_provider_that_is_not_parallel_safe_runs_serially(self):
+        """Test that batches are sent one at a time to a provider that is not parallel-safe"""
+        config = Config()
+        config.set("cache.enabled", False)
+        translator = Translator(config)
+        translator.provider = EchoProvider(config)
+        batch_requests = [TranslationRequest(content=f"part {i}", languages=["ja"], bot_app_key="", visitor_biz_id="") for i in range(4)]
+
+        responses = asyncio.run(translator._run_batches(batch_requests))
+
+        assert all(response.success for response in responses)
+        assert translator.provider.max_in_flight == 1
+
+    def test_stream_writer_only_reaches_streaming_providers(self):
+        """Test that the README writer is only passed to providers that stream"""
+        config = Config()
+        config.set("cache.enabled", False)
+        translator = Translator(config)
+        request = TranslationRequest(content="Hello", languages=["ja"], bot_app_key="", visitor_biz_id="",
+                                     additional_params={"stream_writer_factory": print})
+
+        translator.provider = get_provider_class("siliconflow")(config)
+        assert translator._provider_kwargs(request)["stream_writer_factory"] is print
+        translator.provider = EchoProvider(config)
+        assert translator._provider_kwargs(request)["stream_writer_factory"] is None
+
+    def test_input_budget_is_capped_at_context(self):
+        """Test that translation.max_input_tokens cannot exceed the model's context window"""
+        config = Config()
+        config.set("cache.enabled", False)
+        config.set("translation.max_input_tokens", 1000000)
+        translator = Translator(config)
+        translator.provider = EchoProvider(config)
+
+        assert translator._input_token_budget() == translator.provider.capabilities.max_context
+
+
+class TestOpenAICompatibleProvider:
+    """OpenAI-compatible provider test class"""
+
+    def test_self_hosted_endpoint(self):
+        """Test that requests go to base_url without a key or non-standard parameters"""
+        config = Config()
+        config.set("cache.enabled", False)
+        config.set("openai.base_url", "http://gpu-01:8000/v1/")
+        config.set("openai.model", "Qwen/Qwen2.5-7B-Instruct")
+        provider = get_provider_class("openai")(config)
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"choices": [{"message": {"content": "こんにちは"}}]}
+
+        with patch("src.services.providers.siliconflow_provider.get_session") as get_session:
+            get_session.return_value.post.return_value = response
+            result = json.loads(provider.translate("Hello", ["ja"], mode="trans"))
+            args, kwargs = get_session.return_value.post.call_args
+
+        assert result == {"ja": "こんにちは"}
+        assert args[0] == "http://gpu-01:8000/v1/chat/completions"
+        assert "Authorization" not in kwargs["headers"]
+        assert "top_k" not in kwargs["json"]
+        assert kwargs["json"]["model"] == "Qwen/Qwen2.5-7B-Instruct"
+
+    def test_public_api_needs_a_key(self):
+        """Test that the default endpoint is rejected without an API key"""
+        provider = get_provider_class("openai")(Config())
+
+        assert provider.api_url == "https://api.openai.com/v1/chat/completions"
+        assert not provider.validate_credentials()
@@ -0,0 +1,107 @@
+"""
+File ranking test module
+
+Tests feature extraction, entry point detection, import in-degree and
+token-budgeted file selection.
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+from src.core import ranking
+from src.core.ranking import extract_features, find_entry_points, rank_files, select_within_budget
+from src.utils.ingest import ingest_files
+from src.utils.scan_index import ScanIndex
+
+
+def make_project(root, files):
+    """Create project files from a name to content mapping"""
+    for name, content in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+    return ingest_files(sorted(root / name for name in files), root=root)
+
+
+PROJECT = {
+    "pyproject.toml": '[project]\nname = "demo"\n\n[project.scripts]\ndemo = "demo.cli:main"\n',
+    "demo/__init__.py": "",
+    "demo/cli.py": "from .engine import run\n\ndef main():\n    run()\n",
+    "demo/engine.py": '"""Engine"""\n\nfrom . import helpers\nfrom demo.models import Item\n\nclass Engine:\n    pass\n\ndef run():\n    pass\n',
+    "demo/helpers.py": "import json\n\ndef _private():\n    pass\n",
+    "demo/models.py": "class Item:\n    pass\n\nclass Other:\n    pass\n",
+    "scripts/old.py": "x = 1\n",
+}
+
+
+class TestFeatures:
+    """Feature extraction test class"""
+
+    def test_python_features(self, tmp_path):
+        """Test imports, public symbols and docstring lines of a Python file"""
+        path = tmp_path / "engine.py"
+        path.write_text(PROJECT["demo/engine.py"], encoding="utf-8")
+
+        features = extract_features(path)
+
+        assert features.imports == [".helpers", "demo.models"]
+        assert features.public_symbols == 2
+        assert features.doc_lines == 1
+        assert features.lines == 10
+
+    def test_script_features(self, tmp_path):
+        """Test imports and exports of a JavaScript file"""
+        path = tmp_path / "index.js"
+        path.write_text("import x from './x';\nconst y = require('../y');\n// note\nexport function run() {}\n", encoding="utf-8")
+
+        features = extract_features(path)
+
+        assert features.imports == ["./x", "../y"]
+        assert features.public_symbols == 1
+        assert features.doc_lines == 1
+
+    def test_entry_points(self, tmp_path):
+        """Test console scripts of pyproject.toml, setup.py and package.json"""
+        (tmp_path / "pyproject.toml").write_text('[tool.poetry.scripts]\na = "pkg.a:main"\n[other]\nb = "pkg.b:main"\n', encoding="utf-8")
+        (tmp_path / "setup.py").write_text('setup(entry_points={"console_scripts": ["c=pkg.c:main"]})\n', encoding="utf-8")
+        (tmp_path / "package.json").write_text('{"main": "./lib/index.js", "bin": {"d": "bin/d.js"}}', encoding="utf-8")
+
+        assert find_entry_points(tmp_path) == {"pkg.a", "pkg.c", "lib/index.js", "bin/d.js"}
+
+
+class TestRanking:
+    """Ranking and selection test class"""
+
+    def test_entry_points_and_imported_modules_rank_first(self, tmp_path):
+        """Test that entry points and import in-degree drive the ranking"""
+        records = make_project(tmp_path, PROJECT)
+
+        ranked = {item.record.path.relative_to(tmp_path).as_posix(): item for item in rank_files(records, tmp_path)}
+
+        assert ranked["demo/cli.py"].entry_point
+        assert ranked["demo/engine.py"].importers == 1
+        assert ranked["demo/helpers.py"].importers == 1
+        assert ranked["demo/models.py"].importers == 1
+        assert ranked["demo/cli.py"].score > ranked["demo/engine.py"].score > ranked["scripts/old.py"].score
+
+    def test_selection_fits_token_budget(self, tmp_path):
+        """Test that files are chosen by rank until the budget is spent"""
+        records = make_project(tmp_path, PROJECT)
+        ranked = rank_files(records, tmp_path)
+
+        selected = select_within_budget(ranked, 40, 375)
+
+        assert sum(item.features.tokens + ranking.HEADER_TOKENS for item in selected) <= 40
+        assert selected[0].record.path.name == "cli.py"
+        assert select_within_budget(ranked, 5, 375) == []
+
+    def test_features_are_reused_from_the_index(self, tmp_path):
+        """Test that unchanged files are not parsed again"""
+        records = make_project(tmp_path, PROJECT)
+        with ScanIndex(tmp_path) as index:
+            index.scan([record.path for record in records])
+            first = rank_files(records, tmp_path, index=index)
+
+            with patch.object(ranking, "extract_features", side_effect=AssertionError("parsed again")):
+                second = rank_files(records, tmp_path, index=index)
+
+        assert [(item.record.path, item.score) for item in first] == [(item.record.path, item.score) for item in second]
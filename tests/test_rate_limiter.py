@@ -0,0 +1,119 @@
+"""
+Rate limiter test module
+
+Tests token buckets, adaptive concurrency and retry backoff.
+"""
+
+import time
+from unittest.mock import patch
+import pytest
+import requests
+from src.services.providers.siliconflow_provider import SiliconFlowProvider
+from src.services.rate_limiter import (
+    AdaptiveConcurrency, RateLimiter, TokenBucket, parse_retry_after
+)
+from src.utils.config import Config
+
+
+class TestTokenBucket:
+    """Token bucket test class"""
+
+    def test_acquire_within_budget_does_not_block(self):
+        """Test that a full bucket serves requests immediately"""
+        bucket = TokenBucket(600)
+        start = time.monotonic()
+        for _ in range(10):
+            bucket.acquire(1)
+        assert time.monotonic() - start < 0.1
+
+    def test_acquire_waits_for_refill(self):
+        """Test that an empty bucket blocks until tokens are refilled"""
+        bucket = TokenBucket(600)  # 10 tokens per second
+        bucket.acquire(600)
+        start = time.monotonic()
+        bucket.acquire(2)
+        assert time.monotonic() - start >= 0.15
+
+    def test_adjust_refunds_unused_reservation(self):
+        """Test that actual usage below the reservation is given back"""
+        bucket = TokenBucket(60)
+        bucket.acquire(60)
+        bucket.adjust(-30)
+        start = time.monotonic()
+        bucket.acquire(30)
+        assert time.monotonic() - start < 0.1
+
+
+class TestAdaptiveConcurrency:
+    """Adaptive concurrency test class"""
+
+    def test_throttle_halves_and_success_recovers(self):
+        """Test multiplicative decrease and additive increase"""
+        concurrency = AdaptiveConcurrency(8, cooldown=0)
+        concurrency.on_throttle()
+        assert int(concurrency.limit) == 4
+        concurrency.on_throttle()
+        concurrency.on_throttle()
+        concurrency.on_throttle()
+        assert int(concurrency.limit) == 1
+
+        for _ in range(50):
+            concurrency.on_success()
+        assert int(concurrency.limit) == 8
+
+    def test_simultaneous_throttles_count_once(self):
+        """Test that throttling within the cooldown only decreases once"""
+        concurrency = AdaptiveConcurrency(8, cooldown=60)
+        concurrency.on_throttle()
+        concurrency.on_throttle()
+        assert int(concurrency.limit) == 4
+
+
+class TestRetryPolicy:
+    """Retry backoff test class"""
+
+    def test_parse_retry_after(self):
+        """Test seconds and HTTP-date Retry-After values"""
+        assert parse_retry_after("3") == 3.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    def test_backoff_is_bounded_and_honours_retry_after(self):
+        """Test exponential backoff with jitter"""
+        limiter = RateLimiter(backoff_base=1.0, backoff_max=10.0)
+        for attempt in range(10):
+            assert 0 <= limiter.backoff_delay(attempt) <= min(10.0, 2 ** attempt)
+        assert 5.0 <= limiter.backoff_delay(0, retry_after=5.0) <= 6.0
+        assert limiter.backoff_delay(0, retry_after=100.0) <= 11.0
+
+
+class TestProviderSlots:
+    """Rate limiter slots held by provider requests test class"""
+
+    def test_timeouts_release_slots(self):
+        """Test that requests failing without a response give their slot back"""
+        config = Config()
+        config.set("cache.enabled", False)
+        config.set("siliconflow.api_key", "test")
+        config.set("siliconflow.max_workers", 2)
+        config.set("siliconflow.rate_limit.max_retries", 1)
+        config.set("siliconflow.rate_limit.backoff_base", 0.0)
+        provider = SiliconFlowProvider(config)
+        provider.rate_limiter = RateLimiter(max_concurrency=2, max_retries=1, backoff_base=0.0)
+
+        with patch("src.services.providers.siliconflow_provider.get_session") as get_session:
+            get_session.return_value.post.side_effect = requests.exceptions.ReadTimeout("read timed out")
+            # Each call times out twice (one retry), more failures than there are slots
+            for _ in range(3):
+                language, content, error = provider._translate_single_language("Hello", "ja", "trans")
+                assert error.startswith("Request timeout")
+
+            assert get_session.return_value.post.call_count == 6
+
+            # Errors that are not retried release their slot too
+            get_session.return_value.post.side_effect = requests.exceptions.InvalidURL("bad url")
+            for _ in range(3):
+                assert provider._translate_single_language("Hello", "ja", "trans")[2].startswith("Network error")
+
+        assert provider.rate_limiter.concurrency.active == 0
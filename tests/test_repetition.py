@@ -0,0 +1,67 @@
+"""
+Repetition collapse test module
+
+Tests the linear-time repetition cleaner against the regex it replaces.
+"""
+
+import re
+import random
+import time
+import pytest
+from src.utils.repetition import collapse_repeated_units
+
+
+REFERENCE_PATTERN = re.compile(r'(.{2,}?)\1{2,}')
+
+
+class TestCollapseRepeatedUnits:
+    """Repetition collapse test class"""
+
+    def test_collapses_runs(self):
+        """Test typical degenerate model output"""
+        assert collapse_repeated_units("debug debug debug debug ") == "debug "
+        assert collapse_repeated_units("ますますます") == "ます"
+        assert collapse_repeated_units("abab") == "abab"
+        assert collapse_repeated_units("xyzxyzxyz tail") == "xyz tail"
+
+    def test_units_do_not_span_lines(self):
+        """Test that newlines split repetitions"""
+        assert collapse_repeated_units("ab\nab\nab\n") == "ab\nab\nab\n"
+        assert collapse_repeated_units("ababab\ncdcdcd") == "ab\ncd"
+
+    def test_matches_reference_regex(self):
+        """Test equivalence with the backtracking regex on random inputs"""
+        rng = random.Random(0)
+        for alphabet in ("ab", "abc", "ab \n", "ます "):
+            for _ in range(3000):
+                text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 60)))
+                assert collapse_repeated_units(text) == REFERENCE_PATTERN.sub(r'\1', text), repr(text)
+
+    def test_units_longer_than_limit_are_kept(self):
+        """Test that max_unit bounds the unit length"""
+        unit = "".join(chr(ord("a") + i % 26) for i in range(30))
+        assert collapse_repeated_units(unit * 3, max_unit=20) == unit * 3
+        assert collapse_repeated_units(unit * 3, max_unit=30) == unit
+
+
+@pytest.mark.slow
+class TestCollapseRepeatedUnitsBenchmark:
+    """Repetition collapse worst-case benchmark class"""
+
+    CASES = {
+        "table": "| " + " | ".join(f"cell {i}" for i in range(4000)) + " |",
+        "badges": "".join(f"[![badge {i}](https://img.shields.io/badge/{i}.svg)](https://example.com/{i}) " for i in range(500)),
+        "near_miss": ("abcd" * 15 + "X") * 500 + ("ab" * 31 + "Y") * 500,
+    }
+
+    @pytest.mark.parametrize("name", sorted(CASES))
+    def test_long_line(self, name):
+        """Benchmark long lines that make the backtracking regex quadratic"""
+        line = self.CASES[name]
+
+        start = time.perf_counter()
+        collapse_repeated_units(line)
+        elapsed = time.perf_counter() - start
+
+        print(f"\n{name}: {len(line)} chars in {elapsed * 1000:.1f} ms")
+        assert elapsed < 2.0
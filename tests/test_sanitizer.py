@@ -0,0 +1,89 @@
+"""
+Output sanitizer test module
+
+Tests prompt contamination removal and chunked streaming of the sanitizer.
+"""
+
+import random
+from src.utils.sanitizer import OutputSanitizer, remove_repetitions
+
+
+def sanitize_in_chunks(text, rng):
+    """Feed text in random small chunks and collect the output"""
+    sanitizer = OutputSanitizer()
+    output = []
+    i = 0
+    while i < len(text):
+        size = rng.randint(1, 7)
+        output.append(sanitizer.feed(text[i:i + size]))
+        i += size
+    output.append(sanitizer.finish())
+    return "".join(output)
+
+
+class TestOutputSanitizer:
+    """Output sanitizer test class"""
+
+    def test_strips_wrappers_and_headers(self):
+        """Test removal of leading headers, code block wrappers and the closing fence"""
+        text = "### 中文\n\n```markdown\n# Title\n\nBody\n```\n"
+        assert OutputSanitizer.sanitize(text) == "# Title\n\nBody"
+
+    def test_keeps_inner_code_blocks(self):
+        """Test that fences followed by more content are kept"""
+        text = "# Title\n```\ncode\n```\nAfter\n"
+        assert OutputSanitizer.sanitize(text) == text.strip()
+
+    def test_removes_prompt_prefix(self):
+        """Test removal of echoed prompts at the beginning"""
+        assert OutputSanitizer.sanitize("Original text: # Title\nBody") == "# Title\nBody"
+
+    def test_removes_notes(self):
+        """Test removal of "(Note: ...)" remarks"""
+        text = "Line one (Note: translated)\n(Note: nothing)\nLine two"
+        assert OutputSanitizer.sanitize(text) == "Line one\nLine two"
+
+    def test_drops_echoed_rules(self):
+        """Test that echoed prompt rules end the document"""
+        assert OutputSanitizer.sanitize("Body\n\nCRITICAL RULES:\n- Output ONLY") == "Body"
+        assert OutputSanitizer.sanitize("Body\n- Do NOT add notes\nMore") == "Body"
+        # Rule words inside the document are content
+        assert OutputSanitizer.sanitize("Use ONLY this\nBody") == "Use ONLY this\nBody"
+
+    def test_collapses_repeated_requirements(self):
+        """Test that directly repeated "Requirements:" blocks are emitted once"""
+        block = "Requirements: keep the\nsame structure."
+        text = f"Intro\n{block}\n\n{block}\n{block}\nOutro"
+        assert OutputSanitizer.sanitize(text) == f"Intro\n{block}\nOutro"
+
+    def test_removes_repetitions(self):
+        """Test repetition cleanup within lines"""
+        assert remove_repetitions("debug debug debug debug") == "debug"
+        assert remove_repetitions("[-o a.yaml] [-o a.yaml] [-o a.yaml]") == "[-o a.yaml]"
+        assert remove_repetitions("ですがですが") == "ですが"
+
+    def test_chunked_feed_matches_sanitize(self):
+        """Test that streaming in arbitrary chunks gives the one-shot result"""
+        pieces = ["# Title", "text", "word word word word", "```", "```markdown", "### English",
+                  "(Note: n)", "Requirements: x structure.", "", "  ", "abcabcabc", "Do NOT x",
+                  "CRITICAL RULES", "Please translate into format:"]
+        rng = random.Random(0)
+        for _ in range(2000):
+            lines = [rng.choice(pieces) for _ in range(rng.randint(0, 10))]
+            text = "\n".join(lines) + rng.choice(["", "\n", "\n\n"])
+            assert sanitize_in_chunks(text, rng) == OutputSanitizer.sanitize(text), repr(text)
+
+    def test_long_prefix_spanning_chunks(self):
+        """Test prefix patterns on a beginning longer than the held back head"""
+        body = "\n".join(f"Line {i}" for i in range(1000))
+        text = "Translate this document:\n" + body
+        assert OutputSanitizer.sanitize(text) == body
+        assert sanitize_in_chunks(text, random.Random(1)) == body
+
+    def test_feed_after_rules_is_ignored(self):
+        """Test that nothing is emitted after the document was ended"""
+        sanitizer = OutputSanitizer()
+        output = sanitizer.feed("Body\nCRITICAL RULES\n")
+        output += sanitizer.feed("leaked prompt\n")
+        output += sanitizer.finish()
+        assert output == "Body"
@@ -0,0 +1,115 @@
+"""
+Scan index test module
+
+Tests the persistent project scan index.
+"""
+
+import os
+import time
+import pytest
+from pathlib import Path
+from src.utils.file_utils import FileUtils
+from src.utils.ingest import ingest_files
+from src.utils.gitignore import walk_project_files
+from src.utils.scan_index import ScanIndex
+
+
+def make_project(root, files):
+    """Create project files from a name to content mapping"""
+    for name, content in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+
+
+def scan(root):
+    """Scan a project through its index"""
+    with ScanIndex(root) as index:
+        records = FileUtils().ingest_project_files(root, max_workers=4, index=index)
+        return index, records
+
+
+class TestScanIndex:
+    """Scan index test class"""
+
+    def test_matches_direct_ingestion(self, tmp_path):
+        """Test that indexed records equal freshly inspected ones"""
+        make_project(tmp_path, {"README.md": b"# Demo", "src/main.py": b"print()", "logo.png": b"\x89PNG\x00\x00"})
+
+        _, first = scan(tmp_path)
+        _, second = scan(tmp_path)
+        direct = ingest_files(walk_project_files(tmp_path), root=tmp_path)
+
+        assert first == second
+        assert [(r.path, r.size, r.hash, r.language, r.score) for r in second] == \
+            [(r.path, r.size, r.hash, r.language, r.score) for r in direct]
+
+    def test_only_changed_files_are_inspected(self, tmp_path):
+        """Test stat-based reuse, updates and removals"""
+        make_project(tmp_path, {"a.md": b"a", "b.md": b"b", "c.bin": b"\x00\x01"})
+        index, _ = scan(tmp_path)
+        assert (index.hits, index.misses) == (0, 3)
+
+        index, _ = scan(tmp_path)
+        assert (index.hits, index.misses) == (3, 0)
+
+        (tmp_path / "a.md").write_bytes(b"changed")
+        (tmp_path / "b.md").unlink()
+        index, records = scan(tmp_path)
+        assert (index.hits, index.misses) == (1, 1)
+        assert [r.path.name for r in records] == ["a.md"]
+
+    def test_keys_do_not_depend_on_path_spelling(self, tmp_path, monkeypatch):
+        """Test that "." and the absolute project path share index entries"""
+        make_project(tmp_path, {"docs/a.md": b"a"})
+        scan(tmp_path)
+
+        monkeypatch.chdir(tmp_path)
+        index, records = scan(Path("."))
+
+        assert (index.hits, index.misses) == (1, 0)
+        assert records[0].path == Path("docs/a.md")
+
+    def test_excerpts_follow_content(self, tmp_path):
+        """Test that excerpts are only reused for the same content"""
+        make_project(tmp_path, {"README.md": b"# Demo"})
+        with ScanIndex(tmp_path) as index:
+            record = index.scan(walk_project_files(tmp_path))[0]
+            index.set_excerpt(record, 3000, "excerpt")
+            assert index.get_excerpt(record, 3000) == "excerpt"
+            assert index.get_excerpt(record, 1500) is None
+
+        (tmp_path / "README.md").write_bytes(b"# Other demo")
+        with ScanIndex(tmp_path) as index:
+            record = index.scan(walk_project_files(tmp_path))[0]
+            assert index.get_excerpt(record, 3000) is None
+
+    def test_index_directory_is_not_scanned(self, tmp_path):
+        """Test that the index keeps itself out of the scan and of git"""
+        make_project(tmp_path, {"README.md": b"# Demo"})
+        _, records = scan(tmp_path)
+        _, records = scan(tmp_path)
+
+        assert [r.path.name for r in records] == ["README.md"]
+        assert (tmp_path / ".duoreadme" / ".gitignore").read_text(encoding="utf-8") == "*\n"
+
+
+@pytest.mark.slow
+class TestScanIndexBenchmark:
+    """Scan index benchmark class"""
+
+    def test_unchanged_rescan(self, tmp_path):
+        """Benchmark rescanning a large unchanged project"""
+        make_project(tmp_path, {f"pkg{i % 50}/module_{i}.py": os.urandom(8).hex().encode() * 200 for i in range(5000)})
+
+        start = time.perf_counter()
+        scan(tmp_path)
+        cold = time.perf_counter() - start
+
+        start = time.perf_counter()
+        index, _ = scan(tmp_path)
+        warm = time.perf_counter() - start
+
+        print(f"\n5000 files: cold {cold * 1000:.0f} ms, warm {warm * 1000:.0f} ms")
+        assert index.hits == 5000
+        assert warm < cold
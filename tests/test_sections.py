@@ -0,0 +1,120 @@
+"""
+Section-level incremental translation test module
+
+Tests README section splitting and incremental translation plans.
+"""
+
+import json
+import pytest
+from pathlib import Path
+from src.core.sections import SectionPlan, split_sections, join_sections, section_hash
+
+
+SOURCE = """Intro paragraph
+
+# Title
+
+Some text
+
+## Install
+
+```bash
+# not a heading
+pip install demo
+```
+
+## Usage
+
+Run it"""
+
+
+class TestSplitSections:
+    """Section splitting test class"""
+
+    def test_split_by_headings(self):
+        """Test splitting on ATX headings"""
+        sections = split_sections(SOURCE)
+        assert len(sections) == 4
+        assert sections[0] == "Intro paragraph"
+        assert sections[1].startswith("# Title")
+        assert sections[3] == "## Usage\n\nRun it"
+
+    def test_headings_in_code_fences_are_ignored(self):
+        """Test that comment lines inside fenced code are not headings"""
+        sections = split_sections(SOURCE)
+        assert "# not a heading" in sections[2]
+
+    def test_join_roundtrip(self):
+        """Test joining sections keeps the section structure"""
+        sections = split_sections(SOURCE)
+        assert split_sections(join_sections(sections)) == sections
+
+
+class TestSectionPlan:
+    """Section plan test class"""
+
+    @pytest.fixture(autouse=True)
+    def setup_plan(self, tmp_path):
+        """Set up test environment"""
+        self.manifest_path = tmp_path / SectionPlan.MANIFEST_NAME
+        self.translations = {}
+
+    def _plan(self, text, incremental=True):
+        """Create plan backed by in-memory translations"""
+        return SectionPlan(text, self.manifest_path, self.translations.get, incremental=incremental)
+
+    def _write_previous_run(self, text, lang, translated):
+        """Simulate a previous run that translated text into lang"""
+        self.translations[lang] = translated
+        SectionPlan.write_manifest(self.manifest_path, {lang: [section_hash(s) for s in split_sections(text)]})
+
+    def test_first_run_translates_everything(self):
+        """Test that without manifest all languages are translated in full"""
+        plan = self._plan(SOURCE)
+        plan.prepare(["ja"])
+        assert plan.full_languages() == ["ja"]
+        assert plan.groups() == []
+
+    def test_only_changed_sections_are_sent(self):
+        """Test changed section detection and re-assembly"""
+        translated = SOURCE.replace("Some text", "テキスト").replace("Run it", "実行")
+        self._write_previous_run(SOURCE, "ja", translated)
+
+        plan = self._plan(SOURCE.replace("Run it", "Run it now"))
+        plan.prepare(["ja"])
+
+        groups = plan.groups()
+        assert groups == [([3], ["ja"])]
+        assert plan.changed_text([3]) == "## Usage\n\nRun it now"
+
+        assembled = plan.assemble("ja", "## 使い方\n\n今すぐ実行")
+        assert "テキスト" in assembled
+        assert assembled.endswith("## 使い方\n\n今すぐ実行")
+
+    def test_mismatched_translation_returns_none(self):
+        """Test that a translation with missing headings is rejected"""
+        self._write_previous_run(SOURCE, "ja", SOURCE)
+        plan = self._plan(SOURCE.replace("Run it", "Run it now"))
+        plan.prepare(["ja"])
+
+        assert plan.assemble("ja", "no heading here\n\n# extra\n\ntext") is None
+
+    def test_full_mode_ignores_manifest(self):
+        """Test that incremental=False translates everything"""
+        self._write_previous_run(SOURCE, "ja", SOURCE)
+        plan = self._plan(SOURCE, incremental=False)
+        plan.prepare(["ja"])
+        assert plan.full_languages() == ["ja"]
+
+    def test_save_records_and_forgets_languages(self):
+        """Test manifest bookkeeping"""
+        self._write_previous_run(SOURCE, "ko", SOURCE)
+        plan = self._plan(SOURCE)
+        plan.prepare(["ja"])
+        plan.record("ja", SOURCE)
+        plan.forget("ko")
+        plan.save()
+
+        data = json.loads(Path(self.manifest_path).read_text(encoding="utf-8"))
+        assert list(data["languages"]) == ["ja"]
+        assert data["languages"]["ja"] == plan.hashes
@@ -0,0 +1,97 @@
+"""
+SSE stream test module
+
+Tests incremental event parsing, reply extraction and the Tencent streaming
+request path.
+"""
+
+import json
+from unittest.mock import patch
+import pytest
+from src.services import sse_stream
+from src.services.providers.tencent_provider import TencentProvider
+from src.services.sse_stream import ReplyChunk, SSEEvent, collect_reply, iter_reply_chunks, iter_sse_events
+from src.utils.config import Config
+
+
+def reply_event(content, is_final=False, is_from_self=False):
+    """Build a raw reply event"""
+    payload = {"content": content, "is_final": is_final, "is_from_self": is_from_self, "extra": [1, 2]}
+    return f"event: reply\ndata: {json.dumps({'type': 'reply', 'payload': payload}, ensure_ascii=False)}\n\n".encode("utf-8")
+
+
+class FakeResponse:
+    """Streaming response returning fixed chunks"""
+
+    def __init__(self, chunks, status_code=200):
+        self.chunks = chunks
+        self.status_code = status_code
+        self.text = ""
+        self.closed = False
+
+    def iter_content(self, chunk_size=None):
+        return iter(self.chunks)
+
+    def close(self):
+        self.closed = True
+
+
+class TestEventParsing:
+    """SSE event parsing test class"""
+
+    def test_lines_split_across_chunks(self):
+        """Test that events are reassembled regardless of chunk boundaries"""
+        body = b": comment\r\nevent: token_stat\r\ndata: {}\r\n\r\n" + reply_event("中文") + b"data: a\ndata: b"
+
+        for size in (1, 3, len(body)):
+            chunks = [body[i:i + size] for i in range(0, len(body), size)]
+            events = list(iter_sse_events(chunks))
+
+            assert events[0] == SSEEvent("token_stat", b"{}")
+            assert events[1].event == "reply"
+            assert json.loads(events[1].data)["payload"]["content"] == "中文"
+            assert events[2] == SSEEvent("message", b"a\nb")
+
+    def test_reply_chunks(self):
+        """Test that own messages and other events are skipped and iteration stops at the final reply"""
+        body = reply_event("prompt", is_from_self=True) + b"event: token_stat\ndata: not json\n\n"
+        body += reply_event("Hel") + b"event: reply\ndata: broken\n\n" + reply_event("lo")
+        body += reply_event("Hello!", is_final=True) + reply_event("ignored")
+
+        chunks = list(iter_reply_chunks(iter_sse_events([body])))
+
+        assert chunks == [ReplyChunk("Hel", False), ReplyChunk("lo", False), ReplyChunk("Hello!", True)]
+        assert collect_reply(chunks) == "Hello!"
+        assert collect_reply(chunks[:2]) == "Hello"
+
+
+class TestTencentStreaming:
+    """Tencent streaming request test class"""
+
+    def test_stream_and_collect(self):
+        """Test that the provider streams chunks and closes the response"""
+        provider = TencentProvider(Config())
+        response = FakeResponse([reply_event("a"), reply_event("b"), reply_event("ab", is_final=True)])
+        req_data = {"content": "x", "bot_app_key": "key", "visitor_biz_id": "visitor"}
+
+        with patch.object(sse_stream, "get_session") as get_session:
+            get_session.return_value.post.return_value = response
+            chunks = [chunk.content for chunk in provider.stream_reply(req_data)]
+            sent = json.loads(get_session.return_value.post.call_args.kwargs["data"])
+
+            assert chunks == ["a", "b", "ab"]
+            assert sent["streaming_throttle"] == provider.streaming_throttle
+            assert response.closed
+
+            response = FakeResponse([reply_event("a"), reply_event("ab", is_final=True)])
+            get_session.return_value.post.return_value = response
+            assert provider._send_sse_request(req_data) == "ab"
+
+    def test_http_error(self):
+        """Test that a failed request raises"""
+        provider = TencentProvider(Config())
+
+        with patch.object(sse_stream, "get_session") as get_session:
+            get_session.return_value.post.return_value = FakeResponse([], status_code=500)
+            with pytest.raises(Exception, match="HTTP request failed: 500"):
+                provider._send_sse_request({"content": "x", "bot_app_key": "key", "visitor_biz_id": "v"})
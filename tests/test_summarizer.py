@@ -0,0 +1,134 @@
+"""
+Code summarizer test module
+
+Tests structural summaries of Python and other source files.
+"""
+
+from pathlib import Path
+from src.core.summarizer import summarize, summarize_declarations, summarize_python
+from src.core.translator import Translator
+from src.utils.config import Config
+
+
+PYTHON_SOURCE = '''# Copyright (c) 2024 Example
+# Licensed under the MIT License
+"""
+Engine module
+
+Longer description that is not kept.
+"""
+
+import os
+import sys
+
+VERSION = "1.0"
+
+
+class Engine(Base):
+    """Runs jobs.
+
+    Details.
+    """
+
+    def __init__(self, workers: int = 4):
+        self.workers = workers
+
+    @property
+    def size(self) -> int:
+        """Number of workers"""
+        return self.workers
+
+    def _internal(self):
+        """Hidden"""
+
+    async def run(
+        self,
+        jobs: list,  # pending jobs
+        timeout: float = 1.0,
+    ) -> None:
+        """Run all jobs"""
+        pass
+
+
+def helper(x): return x * 2
+'''
+
+
+class TestSummarizePython:
+    """Python summarizer test class"""
+
+    def test_signatures_and_docstrings(self):
+        """Test that structure is kept and bodies, imports and private members are dropped"""
+        summary = summarize_python(PYTHON_SOURCE)
+
+        assert summary == (
+            '"""Engine module"""\n'
+            '\n'
+            'VERSION = "1.0"\n'
+            'class Engine(Base):\n'
+            '    """Runs jobs."""\n'
+            '    def __init__(self, workers: int = 4):\n'
+            '    @property\n'
+            '    def size(self) -> int:\n'
+            '        """Number of workers"""\n'
+            '    async def run(self, jobs: list, timeout: float = 1.0) -> None:\n'
+            '        """Run all jobs"""\n'
+            '\n'
+            'def helper(x):\n'
+        )
+
+    def test_invalid_source(self):
+        """Test that unparsable sources are left to the caller"""
+        assert summarize_python("def broken(:\n") is None
+        assert summarize("notes.md", "# Title") is None
+
+
+class TestSummarizeDeclarations:
+    """Declaration summarizer test class"""
+
+    def test_declarations_with_doc_comments(self):
+        """Test that license headers and bodies are dropped"""
+        source = (
+            "// Copyright 2024 Example, SPDX-License-Identifier: MIT\n"
+            "package main\n\n"
+            "import \"fmt\"\n\n"
+            "// Server handles requests\n"
+            "type Server struct {\n\taddr string\n}\n\n"
+            "/**\n * Start the server.\n */\n"
+            "func (s *Server) Start() error {\n\treturn nil\n}\n"
+        )
+
+        assert summarize_declarations(source) == (
+            "type Server struct { ... }\n"
+            "/** Start the server. */\n"
+            "func (s *Server) Start() error { ... }\n"
+        )
+
+    def test_no_declarations(self):
+        """Test files without declarations"""
+        assert summarize("data.js", "const x = 1;\n") is None
+
+
+class TestTranslatorExcerpts:
+    """Translator excerpt test class"""
+
+    def test_long_source_files_are_summarized(self, tmp_path):
+        """Test that an over-budget file is sent as its structure"""
+        path = tmp_path / "engine.py"
+        path.write_text(PYTHON_SOURCE + "\n".join(f"VALUE_{i} = {i}" for i in range(400)), encoding="utf-8")
+        translator = Translator(Config())
+
+        excerpt, read_error = translator._read_compressed(Path(path), 200)
+
+        assert read_error is None
+        assert "Copyright" not in excerpt
+        assert "async def run(self, jobs: list, timeout: float = 1.0) -> None:" in excerpt
+
+    def test_short_files_are_kept_whole(self, tmp_path):
+        """Test that files within the budget are not summarized"""
+        path = tmp_path / "small.py"
+        path.write_text(PYTHON_SOURCE, encoding="utf-8")
+
+        excerpt, _ = Translator(Config())._read_compressed(Path(path), 2000)
+
+        assert excerpt == PYTHON_SOURCE
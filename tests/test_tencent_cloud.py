@@ -0,0 +1,143 @@
+"""
+Tencent Cloud service test module
+
+Tests token caching, background refresh and client sharing of the token
+manager.
+"""
+
+import threading
+import time
+from unittest.mock import patch
+from src.services.tencent_cloud import TencentCloudService, TokenManager, get_token_manager
+from src.utils.config import Config
+
+
+PROFILE = {"domain": "tencentcloudapi.com", "scheme": "https", "method": "POST"}
+
+
+class FakeClient:
+    """Client returning numbered tokens"""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def call_json(self, action, params):
+        time.sleep(self.delay)
+        with self.lock:
+            self.calls += 1
+            return {"Response": {"Token": f"token-{self.calls}"}}
+
+
+class TestTokenManager:
+    """Token manager test class"""
+
+    def test_token_is_cached_per_params(self):
+        """Test that a valid token is reused and other parameters get their own"""
+        manager = TokenManager(ttl=60)
+        client = FakeClient()
+
+        with patch.object(manager, "get_client", return_value=client):
+            first = manager.get_token("id", "key", "ap-beijing", PROFILE, {"Type": 5})
+            second = manager.get_token("id", "key", "ap-beijing", PROFILE, {"Type": 5})
+            other = manager.get_token("id", "key", "ap-beijing", PROFILE, {"Type": 6})
+
+        assert first == second == "token-1"
+        assert other == "token-2"
+        assert client.calls == 2
+
+    def test_token_is_cached_per_secret_key(self):
+        """Test that a token fetched with one secret key is not returned for another"""
+        manager = TokenManager(ttl=60)
+        client = FakeClient()
+
+        with patch.object(manager, "get_client", return_value=client):
+            first = manager.get_token("id", "key", "ap-beijing", PROFILE, {"Type": 5})
+            rotated = manager.get_token("id", "new-key", "ap-beijing", PROFILE, {"Type": 5})
+
+        assert first == "token-1"
+        assert rotated == "token-2"
+        assert client.calls == 2
+
+    def test_concurrent_misses_send_one_request(self):
+        """Test that workers missing the same token wait for one request"""
+        manager = TokenManager(ttl=60)
+        client = FakeClient(delay=0.1)
+        tokens = []
+
+        def worker():
+            tokens.append(manager.get_token("id", "key", "ap-beijing", PROFILE, {}))
+
+        with patch.object(manager, "get_client", return_value=client):
+            threads = [threading.Thread(target=worker) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert tokens == ["token-1"] * 8
+        assert client.calls == 1
+
+    def test_refresh_and_expiry(self):
+        """Test that an aging token is refreshed in the background and an expired one synchronously"""
+        manager = TokenManager(ttl=60)
+        client = FakeClient()
+
+        with patch.object(manager, "get_client", return_value=client):
+            assert manager.get_token("id", "key", "ap-beijing", PROFILE, {}) == "token-1"
+            entry = next(iter(manager._tokens.values()))
+
+            # Past the refresh point the current token is still returned
+            entry.fetched_at -= 50
+            assert manager.get_token("id", "key", "ap-beijing", PROFILE, {}) == "token-1"
+            for _ in range(100):
+                if entry.token == "token-2" and not entry.refreshing:
+                    break
+                time.sleep(0.01)
+            assert manager.get_token("id", "key", "ap-beijing", PROFILE, {}) == "token-2"
+
+            entry.fetched_at -= 60
+            assert manager.get_token("id", "key", "ap-beijing", PROFILE, {}) == "token-3"
+
+    def test_failures_are_not_cached(self):
+        """Test that a failed call returns an empty token and is retried next time"""
+        manager = TokenManager(ttl=60)
+        client = FakeClient()
+
+        with patch.object(manager, "get_client", return_value=client):
+            with patch.object(client, "call_json", return_value={"Response": {}}):
+                assert manager.get_token("id", "key", "ap-beijing", PROFILE, {}) == ""
+            assert manager.get_token("id", "key", "ap-beijing", PROFILE, {}) == "token-1"
+
+    def test_client_is_shared_per_region(self):
+        """Test that one client is created per region and profile"""
+        manager = TokenManager()
+
+        with patch("tencentcloud.common.common_client.CommonClient", side_effect=lambda *args, **kwargs: object()) as client_class:
+            beijing = manager.get_client("id", "key", "ap-beijing", PROFILE)
+            assert manager.get_client("id", "key", "ap-beijing", dict(PROFILE)) is beijing
+            assert manager.get_client("id", "key", "ap-shanghai", PROFILE) is not beijing
+
+        assert client_class.call_count == 2
+
+
+class TestTencentCloudService:
+    """Tencent Cloud service test class"""
+
+    def test_services_share_the_manager(self):
+        """Test that services created per worker reuse cached tokens"""
+        config = Config()
+        client = FakeClient()
+        manager = get_token_manager(config)
+        manager.clear()
+
+        with patch.object(manager, "get_client", return_value=client):
+            tokens = [
+                TencentCloudService(config).get_token({"secret_id": "id", "secret_key": "key"}, PROFILE, "ap-beijing", {"Type": 5})
+                for _ in range(3)
+            ]
+        manager.clear()
+
+        assert tokens == ["token-1"] * 3
+        assert client.calls == 1
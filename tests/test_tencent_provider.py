@@ -0,0 +1,96 @@
+"""
+Tencent provider test module
+
+Tests language groups, reply validation and caching of the Tencent provider.
+"""
+
+import json
+import threading
+from unittest.mock import patch
+import pytest
+from src.services.providers.tencent_provider import TencentProvider
+from src.utils.config import Config
+
+
+class TestTencentSingleRequest:
+    """Tencent single-request path test class"""
+
+    @pytest.fixture(autouse=True)
+    def setup_provider(self, tmp_path):
+        """Set up a provider that sends all languages in one request, with a cache"""
+        config = Config()
+        config.set("cache.enabled", True)
+        config.set("cache.dir", str(tmp_path / "cache"))
+        config.set("sse.languages_per_request", 0)
+        self.provider = TencentProvider(config)
+
+    def test_valid_reply_is_cached(self):
+        """Test that a reply holding the requested languages is served from the cache"""
+        reply = "```json\n" + json.dumps({"ja": "readme ja", "ko": "readme ko"}) + "\n```"
+
+        with patch.object(self.provider, "_send_sse_request", return_value=reply) as send:
+            first = self.provider.translate("content", ["ja", "ko"])
+            second = self.provider.translate("content", ["ja", "ko"])
+
+        assert first == second == reply
+        assert send.call_count == 1
+
+    def test_malformed_reply_is_not_cached(self):
+        """Test that a refusal or a reply without the requested languages is requested again"""
+        replies = ["Sorry, I cannot help with that.", json.dumps({"fr": "readme fr"}), json.dumps({"ja": "readme ja"})]
+
+        with patch.object(self.provider, "_send_sse_request", side_effect=replies) as send:
+            results = [self.provider.translate("content", ["ja"]) for _ in range(4)]
+
+        assert results == replies + [replies[-1]]
+        assert send.call_count == 3
+
+
+class TestTencentFanOut:
+    """Tencent per-language fan-out test class"""
+
+    def setup_method(self):
+        """Set up a provider that sends two languages per request"""
+        config = Config()
+        config.set("cache.enabled", False)
+        config.set("sse.languages_per_request", 2)
+        config.set("sse.max_workers", 3)
+        self.provider = TencentProvider(config)
+
+    def test_groups_are_merged(self):
+        """Test that each group gets its own request and session and the replies merge into one object"""
+        barrier = threading.Barrier(3, timeout=5)
+        requests = []
+
+        def send(req_data):
+            # All three groups must be in flight at once to pass the barrier
+            barrier.wait()
+            requests.append(req_data)
+            names = req_data["workflow_variables"]["language"].split("、")
+            codes = [code for code in ["zh-Hans", "ja", "ko", "fr", "de"] if self.provider.get_language_name(code) in names]
+            return "```json\n" + json.dumps({code: f"readme {code}" for code in codes}) + "\n```"
+
+        with patch.object(self.provider, "_send_sse_request", side_effect=send):
+            result = self.provider.translate("content", ["zh-Hans", "ja", "ko", "fr", "de"],
+                                             workflow_variables={"code_text": "content", "language": "all"})
+
+        assert json.loads(result) == {code: f"readme {code}" for code in ["zh-Hans", "ja", "ko", "fr", "de"]}
+        assert sorted(req["workflow_variables"]["language"] for req in requests) == ["Deutsch", "中文、日本語", "한국어、Français"]
+
+    def test_failed_group_is_left_out(self):
+        """Test that a malformed reply only drops its own group"""
+        def send(req_data):
+            if "中文" in req_data["workflow_variables"]["language"]:
+                return "not json"
+            return json.dumps({"ko": "readme ko", "fr": "readme fr"})
+
+        with patch.object(self.provider, "_send_sse_request", side_effect=send):
+            result = self.provider.translate("content", ["zh-Hans", "ja", "ko", "fr"])
+
+            assert json.loads(result) == {"ko": "readme ko", "fr": "readme fr"}
+
+    def test_all_groups_failing_raises(self):
+        """Test that the request fails when no group succeeded"""
+        with patch.object(self.provider, "_send_sse_request", side_effect=Exception("Request timeout")):
+            with pytest.raises(Exception, match="Request timeout"):
+                self.provider.translate("content", ["zh-Hans", "ja", "ko"])
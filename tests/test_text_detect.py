@@ -0,0 +1,92 @@
+"""
+Text detection test module
+
+Tests the text/binary heuristics and the verdict cache.
+"""
+
+import os
+from src.utils.file_utils import FileUtils
+from src.utils.text_detect import SNIFF_SIZE, TextClassifier, looks_like_text
+
+
+class TestLooksLikeText:
+    """Prefix heuristic test class"""
+
+    def test_multiline_and_unicode_text(self):
+        """Test that newlines, tabs and non-ASCII UTF-8 are text"""
+        assert looks_like_text(b"line one\n\tline two\r\n")
+        assert looks_like_text("多语言 README\n".encode("utf-8"))
+        assert looks_like_text(b"")
+
+    def test_nul_byte_is_binary(self):
+        """Test git's NUL byte rule"""
+        assert not looks_like_text(b"PK\x03\x04\x00\x00")
+        assert not looks_like_text("text".encode("utf-16"))
+
+    def test_split_utf8_sequence_at_prefix_end(self):
+        """Test that a character cut by the prefix only counts as valid UTF-8 for truncated reads"""
+        chunk = b"\x01" + "文档".encode("utf-8")[:-1]
+
+        assert looks_like_text(chunk, truncated=True)
+        assert not looks_like_text(chunk, truncated=False)
+
+    def test_legacy_encodings_and_control_bytes(self):
+        """Test the printable ratio fallback for non-UTF-8 content"""
+        assert looks_like_text("café au lait\n".encode("latin-1") * 10)
+        assert not looks_like_text(bytes(range(1, 32)) * 10 + b"\xff")
+
+
+class TestTextClassifier:
+    """Text classifier test class"""
+
+    def test_extensionless_text_files(self, tmp_path):
+        """Test files that the old printable check rejected for their newlines"""
+        (tmp_path / "LICENSE").write_text("MIT License\n\nCopyright\n", encoding="utf-8")
+        (tmp_path / "Makefile").write_text("all:\n\tpython -m pytest\n", encoding="utf-8")
+        (tmp_path / "image").write_bytes(b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR")
+        (tmp_path / "empty").write_bytes(b"")
+
+        utils = FileUtils()
+
+        assert utils.is_text_file(tmp_path / "LICENSE")
+        assert utils.is_text_file(tmp_path / "Makefile")
+        assert not utils.is_text_file(tmp_path / "image")
+        assert utils.is_text_file(tmp_path / "empty")
+        assert not utils.is_text_file(tmp_path / "missing")
+        assert not utils.is_text_file(tmp_path)
+
+    def test_large_file_only_prefix_is_read(self, tmp_path):
+        """Test that content after the sniffed prefix does not change the verdict"""
+        path = tmp_path / "data"
+        path.write_bytes(b"a" * SNIFF_SIZE + b"\x00" * 100)
+
+        assert TextClassifier().classify(path)
+
+    def test_verdicts_are_cached_until_the_file_changes(self, tmp_path):
+        """Test cache hits for unchanged files and misses after a rewrite"""
+        path = tmp_path / "NOTES"
+        path.write_bytes(b"plain text\n")
+        classifier = TextClassifier()
+
+        assert classifier.classify(path)
+        assert classifier.classify_many([path, path], max_workers=1) == [True, True]
+        assert (classifier.hits, classifier.misses) == (2, 1)
+
+        path.write_bytes(b"\x00binary now")
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        assert classifier.classify(path) is False
+        assert classifier.misses == 2
+
+    def test_classify_many_keeps_order(self, tmp_path):
+        """Test bulk classification order"""
+        paths = []
+        for i in range(20):
+            path = tmp_path / f"file{i}"
+            path.write_bytes(b"\x00" if i % 3 == 0 else b"text")
+            paths.append(path)
+
+        verdicts = TextClassifier().classify_many(paths, max_workers=4)
+
+        assert verdicts == [i % 3 != 0 for i in range(20)]
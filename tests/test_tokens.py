@@ -0,0 +1,93 @@
+"""
+Token counting test module
+
+Tests the token approximation, calibration and token-budgeted batching.
+"""
+
+from pathlib import Path
+from src.core.translator import Translator
+from src.utils.config import Config
+from src.utils.tokens import TokenCounter, get_token_counter, pack_batches
+
+
+class TestTokenCounter:
+    """Token counter test class"""
+
+    def test_cjk_costs_more_per_character(self):
+        """Test that character classes are weighted differently"""
+        counter = TokenCounter()
+
+        assert counter.count_raw("a" * 400) == 100
+        assert counter.count_raw("文" * 400) == 400
+        assert counter.count_raw("é" * 400) == 200
+        assert counter.count_raw("") == 0
+
+    def test_calibration_moves_towards_reported_usage(self):
+        """Test that reported usage corrects counts but not raw counts"""
+        counter = TokenCounter()
+        for _ in range(20):
+            counter.calibrate(100, 60)
+
+        assert abs(counter.scale - 0.6) < 0.01
+        assert counter.count("a" * 400) == 60
+        assert counter.count_raw("a" * 400) == 100
+
+        counter.calibrate(1, 1000)
+        assert counter.scale <= 4.0
+
+    def test_unavailable_tokenizer_falls_back(self):
+        """Test that an unknown tiktoken encoding uses the approximation"""
+        counter = get_token_counter("test:fallback", "no-such-encoding")
+
+        assert type(counter) is TokenCounter
+        assert get_token_counter("test:fallback", "no-such-encoding") is counter
+
+
+class TestPackBatches:
+    """Token-budgeted batching test class"""
+
+    def test_batches_respect_budget_and_order(self):
+        """Test that parts are packed greedily without exceeding the budget"""
+        counter = TokenCounter()
+        parts = ["a" * 40, "b" * 40, "c" * 40, "d" * 200]
+
+        batches = pack_batches(parts, 25, counter)
+
+        assert batches == ["a" * 40 + "\n\n" + "b" * 40, "c" * 40, "d" * 200]
+        assert all(counter.count(batch) <= 25 for batch in batches[:2])
+
+    def test_cjk_parts_fill_batches_sooner(self):
+        """Test that equally long CJK parts are budgeted by tokens, not characters"""
+        counter = TokenCounter()
+
+        assert len(pack_batches(["a" * 100] * 4, 120, counter)) == 1
+        assert len(pack_batches(["文" * 100] * 4, 120, counter)) == 4
+
+
+class TestTranslatorBudget:
+    """Translator token budgeting test class"""
+
+    def setup_method(self):
+        """Set up a translator"""
+        self.translator = Translator(Config())
+
+    def test_excerpts_are_budgeted_in_tokens(self, tmp_path):
+        """Test that a CJK file is compressed to fewer characters than an English one"""
+        english = tmp_path / "en.md"
+        chinese = tmp_path / "zh.md"
+        english.write_text("word " * 2000, encoding="utf-8")
+        chinese.write_text("中文内容" * 1000, encoding="utf-8")
+
+        english_excerpt, _ = self.translator._read_compressed(Path(english), 375)
+        chinese_excerpt, _ = self.translator._read_compressed(Path(chinese), 375)
+
+        assert len(english_excerpt) > 3 * len(chinese_excerpt)
+        assert self.translator.token_counter.count_raw(chinese_excerpt) < 450
+
+    def test_budget_override(self):
+        """Test that translation.max_input_tokens overrides the provider budget"""
+        assert self.translator._input_token_budget() == self.translator.provider.input_token_budget()
+
+        self.translator.config.set("translation.max_input_tokens", 2000)
+
+        assert self.translator._input_token_budget() == 2000
@@ -4,12 +4,15 @@ Translator test module
 Tests translator functionality.
 """
 
+import json
+import asyncio
 import pytest
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from src.core.translator import Translator
 from src.utils.config import Config
-from src.models.types import TranslationResponse
+from src.models.types import TranslationRequest, TranslationResponse
+from src.utils.ingest import FileRecord
 
 
 class TestTranslator:
@@ -18,6 +21,8 @@ class TestTranslator:
     def setup_method(self):
         """Set up test environment"""
         self.config = Config()
+        # Project reading tests mock Path, keep the scan index from writing to disk
+        self.config.set("ingest.index", False)
         self.translator = Translator(self.config)
     
     def test_init(self):
@@ -35,8 +40,8 @@ class TestTranslator:
         assert "en" in languages
     
     @patch('src.core.translator.Path')
-    @patch('src.core.translator.FileUtils.get_project_files')
-    def test_read_project_content_success(self, mock_get_files, mock_path):
+    @patch('src.core.translator.FileUtils.ingest_project_files')
+    def test_read_project_content_success(self, mock_ingest, mock_path):
         """Test successful project content reading"""
         # Mock the file utils to return a README file
         mock_readme_path = Mock()
@@ -44,7 +49,7 @@ class TestTranslator:
         mock_readme_path.read_text.return_value = "# Test README"
         mock_readme_path.relative_to.return_value = "README.md"
         
-        mock_get_files.return_value = [mock_readme_path]
+        mock_ingest.return_value = [FileRecord(path=mock_readme_path, size=13, mtime=0.0, hash="", language="Markdown", score=0)]
         
         content = self.translator._read_project_content("test_project")
         assert "=== README.md ===" in content
@@ -138,4 +143,35 @@ class TestTranslator:
         # Verify method calls
         mock_read.assert_called_once_with("test_project")
         mock_build.assert_called_once_with("Project content", ["中文", "English"])
-        mock_execute.assert_called_once_with(mock_request) 
\ No newline at end of file
+        mock_execute.assert_called_once_with(mock_request)
+    
+    def test_combine_batch_responses_merges_per_language(self):
+        """Test that batch responses are merged section by section"""
+        first = json.dumps({"en": "# Demo\n\nShort\n\n## Install\n\npip install demo", "ja": "# デモ"})
+        second = json.dumps({"en": "# Demo\n\nA longer introduction\n\n## Usage\n\ndemo run"})
+        
+        merged = json.loads(self.translator._combine_batch_responses([first, second], ["ja", "en"]))
+        
+        assert list(merged) == ["ja", "en"]
+        assert merged["en"] == "# Demo\n\nA longer introduction\n\n## Install\n\npip install demo\n\n## Usage\n\ndemo run"
+        assert merged["ja"] == "# デモ"
+    
+    def test_batches_run_concurrently_and_retry(self):
+        """Test concurrent batch dispatch with per-batch retry"""
+        self.translator.config.set("translation.batch_concurrency", 2)
+        self.translator.config.set("translation.batch_retries", 1)
+        attempts = {}
+        
+        async def fake_execute(request):
+            attempts[request.content] = attempts.get(request.content, 0) + 1
+            if request.content == "b" and attempts["b"] == 1:
+                return TranslationResponse(success=False, error="busy", languages=request.languages)
+            return TranslationResponse(success=True, content=request.content, languages=request.languages)
+        
+        requests = [TranslationRequest(content=c, languages=["en"], bot_app_key="", visitor_biz_id="") for c in ("a", "b", "c")]
+        with patch.object(self.translator, '_aexecute_translation', side_effect=fake_execute), \
+                patch('src.core.translator.asyncio.sleep', new=AsyncMock()):
+            responses = asyncio.run(self.translator._run_batches(requests))
+        
+        assert [r.content for r in responses] == ["a", "b", "c"]
+        assert attempts == {"a": 1, "b": 2, "c": 1}